@@ -1,22 +1,111 @@
-from fastapi import APIRouter, Query
+import logging
+from typing import Dict, Literal, Optional
+
+import psycopg2
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from datetime import datetime, date
+from pydantic import BaseModel, Field
 
+from app.api.v1.routes.moderation import verify_admin
 from app.schemas.dashboard import (
     DashboardPayload, Team, LastGame, LastGameScore, UpcomingGame,
     PlayerAvailability, AvailabilityItem, KeyPerformer, TeamStats, CoachNote
 )
+from app.services.bracket import brackets
+from app.services.dashboard import DashboardUnavailable, TeamNotFound, dashboards, serialize
+from app.services.game_day import game_day
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["dashboard"])
 
+# Playoff finals rebuild the dashboards of both teams
+brackets.subscribe(dashboards.on_bracket_write)
+# Teams kicking off soon get their dashboards built ahead of the rush
+game_day.subscribe(dashboards.prefetch)
+
+
+class AvailabilityUpdate(BaseModel):
+    name: str
+    position: Optional[str] = None
+    status: Literal["cleared", "limited", "out"]
+    note: Optional[str] = None
+
+
+class CoachNoteCreate(BaseModel):
+    author: str = Field(..., min_length=1)
+    body: str = Field(..., min_length=1)
+
+
+class SectionLatencySummary(BaseModel):
+    loads: int
+    timeouts: int
+    errors: int
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    max_ms: Optional[float] = None
+
+
 @router.get("/dashboard", response_model=DashboardPayload)
-def get_dashboard(team_id: str | None = Query(default=None, description="Optional team UUID")) -> DashboardPayload:
+async def get_dashboard(team_id: str | None = Query(default=None, description="Optional team UUID")) -> Response:
     """
-    Returns the full DashboardPayload structure.
-    NOTE: This currently serves sample data.
+    Returns the full DashboardPayload structure for a team.
+
+    Payloads are precomputed and stored serialized, and rebuilt whenever a
+    game final, availability change or coach note touches the team, so this
+    is usually a cache read. Payloads of teams playing today expire within a
+    minute (off days: hours) and are rebuilt in the background while the old
+    one is served. A cold build loads the sections concurrently;
+    any that time out come from the team's last good copy and are listed in
+    `stale_sections`. Without a team_id, serves sample data.
     """
+    if team_id is None:
+        return Response(content=serialize(_sample_payload()), media_type="application/json")
+    try:
+        content = await dashboards.get(team_id)
+    except TeamNotFound:
+        raise HTTPException(status_code=404, detail="Team not found")
+    except DashboardUnavailable:
+        raise HTTPException(status_code=503, detail="Dashboard temporarily unavailable")
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/dashboard/sections", response_model=Dict[str, SectionLatencySummary])
+def get_dashboard_section_latency() -> Dict[str, SectionLatencySummary]:
+    """Recent load latency per dashboard section, with timeout and error counts."""
+    return dashboards.latency.summary()
+
+
+@router.put("/teams/{team_id}/availability/{number}", status_code=204)
+def put_player_availability(
+    update: AvailabilityUpdate,
+    team_id: str,
+    number: int = Path(..., ge=0, le=99, description="Jersey number"),
+    admin=Depends(verify_admin),
+) -> Response:
+    """Set one player's availability (admin only); the team's dashboard is rebuilt in the background."""
+    try:
+        dashboards.set_availability(team_id, number, update.name, update.position, update.status, update.note)
+    except psycopg2.Error:
+        logger.exception("dashboard: could not save availability for team %s", team_id)
+        raise HTTPException(status_code=503, detail="Could not save availability")
+    return Response(status_code=204)
+
+
+@router.post("/teams/{team_id}/notes", response_model=CoachNote, status_code=201)
+def post_coach_note(note: CoachNoteCreate, team_id: str, admin=Depends(verify_admin)) -> CoachNote:
+    """Add a coach note (admin only); the team's dashboard is rebuilt in the background."""
+    try:
+        return dashboards.add_note(team_id, note.author, note.body)
+    except psycopg2.Error:
+        logger.exception("dashboard: could not save a note for team %s", team_id)
+        raise HTTPException(status_code=503, detail="Could not save note")
+
+
+def _sample_payload() -> DashboardPayload:
 
     team = Team(
-        id=team_id or "8f2c1b0d-3a9d-41c6-9f02-8e4e5e1c56a4",
+        id="8f2c1b0d-3a9d-41c6-9f02-8e4e5e1c56a4",
         name="Joshua",
         mascot="Owls",
         city="Joshua, TX",
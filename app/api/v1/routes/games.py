@@ -1,7 +1,14 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.api.v1.routes.moderation import verify_admin
+from app.services.box_scores import GameBoxScore, PlayerLine, box_scores
+from app.services.dashboard import dashboards
+from app.services.standings import standings
+from app.services.votes import vote_store
+from app.services.win_probability import live_win_probability
+
 router = APIRouter(prefix="/api/v1", tags=["games"])
 ml_router = APIRouter(tags=["ml-predictions"])  # No prefix for ML endpoints
 
@@ -75,6 +82,15 @@ class Predictions(BaseModel):
     total_votes: int
 
 
+class LiveScoreUpdate(BaseModel):
+    """Live score/clock delta pushed by the scoreboard feed"""
+    home_score: int
+    away_score: int
+    quarter: str  # "1Q", "2Q", "3Q", "4Q", "OT", "HALFTIME", "FINAL"
+    time_remaining: str | None = None  # "12:34"
+    pregame_home_win_probability: float | None = None  # Seeds the model on first update
+
+
 class GameDetailResponse(BaseModel):
     """Complete game detail with ML predictions and team info"""
     id: int
@@ -100,6 +116,47 @@ class GameDetailResponse(BaseModel):
     predictions: Predictions | None = None
 
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+# TeamLeaders category -> (stat that ranks the leader, GameLeader fields to copy)
+LEADER_CATEGORIES = {
+    "passing": ("passing_yards", ("passing_yards", "passing_completions", "passing_attempts", "passing_tds")),
+    "rushing": ("rushing_yards", ("rushing_yards", "rushing_carries", "rushing_tds")),
+    "receiving": ("receiving_yards", ("receiving_yards", "receptions", "receiving_tds")),
+    "tackles": ("tackles", ("tackles",)),
+    "sacks": ("sacks", ("sacks",)),
+}
+
+
+def _leader(players: list[PlayerLine], rank_by: str, stat_fields: tuple) -> GameLeader | None:
+    best = max(players, key=lambda p: getattr(p, rank_by), default=None)
+    if best is None or not getattr(best, rank_by):
+        return None
+    return GameLeader(
+        player_id=best.player_id,
+        player_name=best.name or best.player_id,
+        jersey_number=best.jersey_number,
+        position=best.position or "",
+        **{name: getattr(best, name) for name in stat_fields},
+    )
+
+
+def _team_leaders(box: GameBoxScore, team_id: str | None) -> TeamLeaders:
+    team = box.teams.get(team_id or "")
+    players = [p for p in box.players.values() if p.team_id == team_id]
+    return TeamLeaders(
+        team_id=team_id or "",
+        team_name=team.team_name if team else "",
+        team_mascot="",
+        **{
+            category: _leader(players, rank_by, stat_fields)
+            for category, (rank_by, stat_fields) in LEADER_CATEGORIES.items()
+        },
+    )
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
@@ -144,11 +201,19 @@ def get_game_leaders(game_id: str) -> GameLeadersResponse:
     ```
     """
 
+    # Games with a play-by-play log read leaders from the precomputed box score
+    box = box_scores.game(int(game_id)) if game_id.isdigit() else None
+    if box is not None:
+        return GameLeadersResponse(
+            game_id=game_id,
+            home_team=_team_leaders(box, box.home_team_id),
+            away_team=_team_leaders(box, box.away_team_id),
+            updated_at=datetime.utcnow().isoformat(),
+        )
+
     # TODO: Replace with actual database query when player_stats table is populated
     # For now, return mock data based on game_id
 
-    from datetime import datetime
-
     # Mock data for demo playoff game
     if game_id == "demo-playoff-001":
         return GameLeadersResponse(
@@ -355,10 +420,65 @@ def get_game_leaders(game_id: str) -> GameLeadersResponse:
     )
 
 
+@router.post("/games/{game_id}/live", response_model=Analytics)
+def post_live_score(game_id: int, update: LiveScoreUpdate, admin=Depends(verify_admin)) -> Analytics:
+    """
+    Ingest a live score/clock update and return the re-priced win probability
+    (admin only).
+
+    The first update for a game seeds the model with the pregame ML prediction
+    (from the request, or the current game detail analytics). Every later
+    update is a constant-time table lookup. The score also moves the game's
+    district standings, and a final rebuilds both teams' dashboards. Updates
+    after the final are ignored and return the final result.
+    """
+    if live_win_probability.is_final(game_id):
+        return Analytics(**live_win_probability.get(game_id).to_dict())
+
+    if not live_win_probability.is_tracking(game_id):
+        pregame = update.pregame_home_win_probability
+        if pregame is None:
+            detail = get_game_detail(game_id)
+            pregame = detail.analytics.home_win_probability if detail.analytics else 50.0
+        live_win_probability.start(game_id, pregame)
+
+    live = live_win_probability.update(
+        game_id,
+        home_score=update.home_score,
+        away_score=update.away_score,
+        quarter=update.quarter,
+        time_remaining=update.time_remaining,
+    )
+    standings.record_score(game_id, update.home_score, update.away_score, update.quarter, update.time_remaining)
+    if update.quarter.upper().startswith("FINAL"):
+        game = standings.game(game_id)  # The games row's team ids; get_game_detail is still sample data
+        if game is not None:
+            dashboards.game_final(game.home_team_id, game.away_team_id)
+    return Analytics(**live.to_dict())
+
+
 # ============================================================================
 # ML PREDICTION ENDPOINTS (No /api/v1 prefix)
 # ============================================================================
 
+def _apply_live_data(detail: GameDetailResponse) -> GameDetailResponse:
+    """
+    Swap the pregame analytics for the live model once a game has score
+    updates, and fill predictions from the in-memory vote counters.
+    """
+    live = live_win_probability.get(detail.id)
+    if live is not None:
+        detail.analytics = Analytics(**live.to_dict())
+    if vote_store.has_votes(detail.id):
+        tally = vote_store.tally(detail.id)
+        detail.predictions = Predictions(
+            away_percentage=tally.away_percentage,
+            home_percentage=tally.home_percentage,
+            total_votes=tally.total,
+        )
+    return detail
+
+
 @ml_router.get("/games/{game_id}", response_model=GameDetailResponse)
 def get_game_detail(game_id: int) -> GameDetailResponse:
     """
@@ -385,7 +505,9 @@ def get_game_detail(game_id: int) -> GameDetailResponse:
     WHERE g.id = :game_id;
     ```
 
-    Then call ML prediction service to get analytics data.
+    Then call ML prediction service to get analytics data. Live games
+    report the in-game win probability from the live tracker instead, and
+    fan predictions come from the vote counters (no COUNT(*) over votes).
     """
 
     # TODO: Replace with actual database query
@@ -394,7 +516,7 @@ def get_game_detail(game_id: int) -> GameDetailResponse:
     # Mock data - replace with actual DB query
     if game_id == 8:
         # Game 8: Lovejoy vs Highland Park with real ML predictions
-        return GameDetailResponse(
+        return _apply_live_data(GameDetailResponse(
             id=8,
             home_team_id=16,
             away_team_id=15,
@@ -425,10 +547,10 @@ def get_game_detail(game_id: int) -> GameDetailResponse:
                 home_percentage=32.5,
                 total_votes=1247
             )
-        )
+        ))
 
     # Default mock data for other games
-    return GameDetailResponse(
+    return _apply_live_data(GameDetailResponse(
         id=game_id,
         home_team_id=1,
         away_team_id=2,
@@ -459,4 +581,4 @@ def get_game_detail(game_id: int) -> GameDetailResponse:
             home_percentage=45.0,
             total_votes=842
         )
-    )
+    ))
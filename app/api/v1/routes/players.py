@@ -1,5 +1,11 @@
-from fastapi import APIRouter, HTTPException
-from typing import Optional, Dict, Any
+import base64
+import bisect
+import json
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional, Dict, Any, List, Literal, Set, Tuple, get_args
+
+from app.services.leaderboards import leaderboards
+from app.services.player_stats import player_stats
 
 router = APIRouter(prefix="/api/v1", tags=["players"])
 
@@ -8,27 +14,27 @@ JOSHUA_PLAYERS: Dict[str, Dict[str, Any]] = {
     "1": {
         "number": "1", "name": "Aaron Martinez", "position": "Slot", "class": "Senior", 
         "height": "5'10\"", "weight": "165 lbs",
-        "stats": {"receptions": 3, "receiving_yards": 36, "receiving_tds": 0, "receiving_avg": 12.0}
+        "stats": {"receptions": 3, "receiving_yards": 36, "receiving_tds": 0}
     },
     "4": {
         "number": "4", "name": "Malachi Berry", "position": "WR", "class": "Senior", 
         "height": "6'1\"", "weight": "180 lbs",
         "stats": {
-            "rushing_yards": 99, "rushing_tds": 0, "rushing_attempts": 12, "rushing_avg": 8.25,
-            "receptions": 1, "receiving_yards": 33, "receiving_tds": 1, "receiving_avg": 33.0
+            "rushing_yards": 99, "rushing_tds": 0, "rushing_attempts": 12,
+            "receptions": 1, "receiving_yards": 33, "receiving_tds": 1
         }
     },
     "6": {
         "number": "6", "name": "Joe Strother", "position": "RB", "class": "Senior", 
         "height": "5'10\"", "weight": "185 lbs",
-        "stats": {"rushing_yards": 249, "rushing_tds": 3, "rushing_attempts": 62, "rushing_avg": 4.02, "rushing_long": 41}
+        "stats": {"rushing_yards": 249, "rushing_tds": 3, "rushing_attempts": 62, "rushing_long": 41}
     },
     "8": {
         "number": "8", "name": "Lucas Liles", "position": "Slot", "class": "Sophomore", 
         "height": "5'11\"", "weight": "170 lbs",
         "stats": {
-            "rushing_yards": 29, "rushing_tds": 0, "rushing_attempts": 13, "rushing_avg": 2.23,
-            "receptions": 1, "receiving_yards": 27, "receiving_tds": 0, "receiving_avg": 27.0
+            "rushing_yards": 29, "rushing_tds": 0, "rushing_attempts": 13,
+            "receptions": 1, "receiving_yards": 27, "receiving_tds": 0
         }
     },
     "9": {
@@ -36,16 +42,16 @@ JOSHUA_PLAYERS: Dict[str, Dict[str, Any]] = {
         "height": "6'2\"", "weight": "195 lbs", "gpa": "3.8",
         "stats": {
             "passing_yards": 115, "passing_tds": 2, "passing_completions": 10, "passing_attempts": 26,
-            "passing_completion_pct": 38.5, "passing_ints": 0,
-            "rushing_yards": 237, "rushing_tds": 2, "rushing_attempts": 76, "rushing_avg": 3.12
+            "passing_ints": 0,
+            "rushing_yards": 237, "rushing_tds": 2, "rushing_attempts": 76
         }
     },
     "10": {
         "number": "10", "name": "Cash Criner", "position": "Slot", "class": "Junior", 
         "height": "5'10\"", "weight": "165 lbs",
         "stats": {
-            "rushing_yards": 316, "rushing_tds": 1, "rushing_attempts": 41, "rushing_avg": 7.71, "rushing_long": 52,
-            "receptions": 2, "receiving_yards": 6, "receiving_tds": 0, "receiving_avg": 3.0
+            "rushing_yards": 316, "rushing_tds": 1, "rushing_attempts": 41, "rushing_long": 52,
+            "receptions": 2, "receiving_yards": 6, "receiving_tds": 0
         }
     },
     "12": {
@@ -61,14 +67,14 @@ JOSHUA_PLAYERS: Dict[str, Dict[str, Any]] = {
         "height": "6'1\"", "weight": "190 lbs",
         "stats": {
             "passing_yards": 28, "passing_tds": 0, "passing_completions": 1, "passing_attempts": 9,
-            "passing_completion_pct": 11.1, "passing_ints": 1,
-            "rushing_yards": 35, "rushing_tds": 1, "rushing_attempts": 5, "rushing_avg": 7.0
+            "passing_ints": 1,
+            "rushing_yards": 35, "rushing_tds": 1, "rushing_attempts": 5
         }
     },
     "17": {
         "number": "17", "name": "Trey Pennell", "position": "DB", "class": "Senior", 
         "height": "6'0\"", "weight": "180 lbs",
-        "stats": {"receptions": 3, "receiving_yards": 40, "receiving_tds": 0, "receiving_avg": 13.3}
+        "stats": {"receptions": 3, "receiving_yards": 40, "receiving_tds": 0}
     },
     "18": {
         "number": "18", "name": "Ryan Winsett", "position": "Slot", "class": "Junior", 
@@ -77,12 +83,12 @@ JOSHUA_PLAYERS: Dict[str, Dict[str, Any]] = {
     "20": {
         "number": "20", "name": "Max Mata", "position": "DB", "class": "Junior", 
         "height": "5'10\"", "weight": "170 lbs",
-        "stats": {"rushing_yards": 3, "rushing_tds": 0, "rushing_attempts": 3, "rushing_avg": 1.0}
+        "stats": {"rushing_yards": 3, "rushing_tds": 0, "rushing_attempts": 3}
     },
     "21": {
         "number": "21", "name": "Esteban Salas", "position": "RB", "class": "Junior", 
         "height": "5'11\"", "weight": "180 lbs",
-        "stats": {"rushing_yards": 382, "rushing_tds": 3, "rushing_attempts": 74, "rushing_avg": 5.16, "rushing_long": 95}
+        "stats": {"rushing_yards": 382, "rushing_tds": 3, "rushing_attempts": 74, "rushing_long": 95}
     },
     "22": {
         "number": "22", "name": "Colin O'Callahan", "position": "Slot", "class": "Sophomore", 
@@ -91,25 +97,25 @@ JOSHUA_PLAYERS: Dict[str, Dict[str, Any]] = {
     "23": {
         "number": "23", "name": "Bentley Beltran", "position": "Slot", "class": "Junior", 
         "height": "5'10\"", "weight": "165 lbs",
-        "stats": {"rushing_yards": 15, "rushing_tds": 0, "rushing_attempts": 1, "rushing_avg": 15.0}
+        "stats": {"rushing_yards": 15, "rushing_tds": 0, "rushing_attempts": 1}
     },
     "26": {
         "number": "26", "name": "Taji Matthews", "position": "RB", "class": "Senior", 
         "height": "5'10\"", "weight": "190 lbs", "gpa": "3.5",
-        "stats": {"rushing_yards": 281, "rushing_tds": 4, "rushing_attempts": 66, "rushing_avg": 4.26, "rushing_long": 46}
+        "stats": {"rushing_yards": 281, "rushing_tds": 4, "rushing_attempts": 66, "rushing_long": 46}
     },
     "27": {
         "number": "27", "name": "Tyler Evans", "position": "RB", "class": "Junior", 
         "height": "5'11\"", "weight": "185 lbs",
-        "stats": {"rushing_yards": 26, "rushing_tds": 0, "rushing_attempts": 6, "rushing_avg": 4.33}
+        "stats": {"rushing_yards": 26, "rushing_tds": 0, "rushing_attempts": 6}
     },
     "30": {
         "number": "30", "name": "Granger Quinn", "position": "K", "class": "Junior", 
         "height": "5'11\"", "weight": "170 lbs",
         "stats": {
-            "fg_made": 2, "fg_attempts": 2, "fg_pct": 100.0, "fg_long": 49,
+            "fg_made": 2, "fg_attempts": 2, "fg_long": 49,
             "xp_made": 12, "xp_attempts": 15,
-            "punt_yards": 527, "punts": 17, "punt_avg": 31.0
+            "punt_yards": 527, "punts": 17
         }
     },
     "31": {
@@ -126,8 +132,8 @@ JOSHUA_PLAYERS: Dict[str, Dict[str, Any]] = {
         "number": "81", "name": "Luther Matt", "position": "K", "class": "Sophomore", 
         "height": "5'11\"", "weight": "170 lbs",
         "stats": {
-            "rushing_yards": 5, "rushing_tds": 0, "rushing_attempts": 1, "rushing_avg": 5.0,
-            "fg_made": 1, "fg_attempts": 1, "fg_pct": 100.0, "fg_long": 31
+            "rushing_yards": 5, "rushing_tds": 0, "rushing_attempts": 1,
+            "fg_made": 1, "fg_attempts": 1, "fg_long": 31
         }
     },
 }
@@ -138,7 +144,7 @@ REMAINING_PLAYERS = {
     "2": {"number": "2", "name": "JD Smith", "position": "DL", "class": "Senior", "height": "6'2\"", "weight": "245 lbs"},
     "3": {"number": "3", "name": "Dre Wilson", "position": "DB", "class": "Junior", "height": "5'11\"", "weight": "175 lbs"},
     "5": {"number": "5", "name": "Alex Rubacalba", "position": "Slot", "class": "Junior", "height": "5'9\"", "weight": "160 lbs",
-          "stats": {"rushing_yards": 50, "rushing_tds": 0, "rushing_attempts": 11, "rushing_avg": 4.55, "receptions": 1, "receiving_yards": 1, "receiving_tds": 1, "receiving_avg": 1.0}},
+          "stats": {"rushing_yards": 50, "rushing_tds": 0, "rushing_attempts": 11, "receptions": 1, "receiving_yards": 1, "receiving_tds": 1}},
     "7": {"number": "7", "name": "Jaxon Wells", "position": "LB", "class": "Junior", "height": "6'0\"", "weight": "190 lbs"},
     "11": {"number": "11", "name": "Gavin McManus", "position": "DL", "class": "Senior", "height": "6'3\"", "weight": "260 lbs"},
     "13": {"number": "13", "name": "John Pigg", "position": "LB", "class": "Junior", "height": "6'1\"", "weight": "200 lbs"},
@@ -178,53 +184,202 @@ for num, player in REMAINING_PLAYERS.items():
     if num not in JOSHUA_PLAYERS:
         JOSHUA_PLAYERS[num] = player
 
+# ============================================================================
+# PLAYER INDEXES
+# Built once at import so handlers are dict lookups returning prebuilt
+# response objects - nothing is scanned, lowercased, copied or sorted per
+# request. Each roster is kept pre-sorted once per sort option; a page is a
+# bisect into that array.
+# ============================================================================
+
+TEAM_ID = "2"
+TEAM_NAME = "Joshua"
+TEAM_MASCOT = "Owls"
+TEAM_CLASSIFICATION = "5A-D1"
+TEAM_DISTRICT = "7-5A"
+ALL_TEAMS = "*"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+SortKey = Literal["number", "name", "position"]
+
+# Depth-chart order for sort=position; anything unlisted sorts last
+POSITION_ORDER = ["QB", "RB", "WR", "Slot", "TE", "OL", "DL", "LB", "DB", "K"]
+
+PLAYERS_BY_NUMBER: Dict[str, Dict[str, Any]] = {}    # number -> detail response
+NUMBER_BY_SLUG: Dict[str, str] = {}                  # "brayden payne" -> "9"
+TEAM_BY_KEY: Dict[str, str] = {}                     # team id/name -> team id
+ROSTERS: Dict[str, Dict[str, "RosterOrder"]] = {}    # team id or ALL_TEAMS -> sort -> order
+PLAYER_FIELDS: Set[str] = {"stats"}                  # Everything `fields=` may ask for
+
+
+def _number(player: Dict[str, Any]) -> int:
+    return int(player["number"]) if player["number"].isdigit() else 999
+
+
+def _sort_key(sort: str, player: Dict[str, Any]) -> tuple:
+    """Unique, JSON-safe ordering key; the trailing id makes it usable as a cursor."""
+    if sort == "name":
+        return (player["name"].lower(), _number(player), player["id"])
+    if sort == "position":
+        position = player.get("position")
+        rank = POSITION_ORDER.index(position) if position in POSITION_ORDER else len(POSITION_ORDER)
+        return (rank, _number(player), player["id"])
+    return (_number(player), player["id"])
+
+
+# Element types of each sort's _sort_key, for validating cursors
+CURSOR_KEY_TYPES: Dict[str, Tuple[type, ...]] = {
+    "number": (int, str),
+    "name": (str, int, str),
+    "position": (int, int, str),
+}
+
+
+class RosterOrder:
+    """One roster sorted one way, with the sort keys alongside for bisecting cursors."""
+
+    def __init__(self, sort: str, players: List[Dict[str, Any]]):
+        pairs = sorted(((_sort_key(sort, p), p) for p in players), key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.players = [player for _, player in pairs]
+
+    def page(self, after: Optional[tuple], limit: int) -> Tuple[List[Dict[str, Any]], Optional[tuple]]:
+        """Up to `limit` players strictly after the `after` key, plus the key to resume from."""
+        start = bisect.bisect_right(self.keys, after) if after is not None else 0
+        end = min(start + limit, len(self.players))
+        next_key = self.keys[end - 1] if end < len(self.players) else None
+        return self.players[start:end], next_key
+
+
+def _team_keys(team_id: str, name: str, mascot: str) -> List[str]:
+    """Every value the `team` filter accepts for a team: id, name, or name + mascot."""
+    return [team_id, name.lower(), f"{name} {mascot}".lower()]
+
+
+def _build_indexes() -> None:
+    roster = []
+    for number, player in JOSHUA_PLAYERS.items():
+        player_id = f"player_{number}"
+        # Counting stats live in the columnar store; responses attach them
+        # (with derived averages) on read
+        player_stats.register(player_id, TEAM_ID, TEAM_CLASSIFICATION, TEAM_DISTRICT,
+                              name=player["name"], position=player.get("position"),
+                              jersey=int(number) if number.isdigit() else None)
+        if "stats" in player:
+            player_stats.set(player_id, player["stats"])
+        summary = {
+            **{k: v for k, v in player.items() if k != "stats"},
+            "id": player_id,
+            "team": TEAM_NAME,
+            "mascot": TEAM_MASCOT
+        }
+        PLAYERS_BY_NUMBER[number] = {**summary, "gpa": player.get("gpa", "N/A")}
+        NUMBER_BY_SLUG[player["name"].lower()] = number
+        PLAYER_FIELDS.update(summary)
+        roster.append(summary)
+
+    leaderboards.register_team(TEAM_ID, TEAM_NAME)
+    leaderboards.invalidate()
+
+    rosters = {TEAM_ID: roster, ALL_TEAMS: roster}
+    for key in _team_keys(TEAM_ID, TEAM_NAME, TEAM_MASCOT):
+        TEAM_BY_KEY[key] = TEAM_ID
+    for roster_id, players in rosters.items():
+        ROSTERS[roster_id] = {sort: RosterOrder(sort, players) for sort in get_args(SortKey)}
+
+
+_build_indexes()
+
+
+def encode_cursor(sort: str, key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort, list(key)]).encode()).decode()
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple:
+    try:
+        cursor_sort, key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_sort != sort:
+        raise HTTPException(status_code=400, detail="Cursor was issued for a different sort")
+    # The key is bisected against _sort_key tuples, so it must have their exact shape
+    types = CURSOR_KEY_TYPES[sort]
+    if not isinstance(key, list) or len(key) != len(types) or not all(
+            type(part) is expected for part, expected in zip(key, types)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(key)
+
+
+def with_stats(player: Dict[str, Any]) -> Dict[str, Any]:
+    """The prebuilt response plus current stats, if the player has any."""
+    stats = player_stats.stats(player["id"])
+    return {**player, "stats": stats} if stats is not None else player
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Requested fields, always including id; None means the full summary."""
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in PLAYER_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return ["id"] + [f for f in requested if f != "id"]
+
+
 @router.get("/players/{player_id}")
 def get_player(player_id: str):
     """
-    Get a specific player by ID (jersey number)
+    Get a specific player by ID (jersey number, player_<number>, or name slug)
     """
-    # Extract number from player_id
     if player_id.startswith("player_"):
-        number = player_id.replace("player_", "")
+        number = player_id[len("player_"):]
     elif player_id.isdigit():
         number = player_id
     else:
-        # Try to find by name slug
-        name_slug = player_id.replace("-", " ").lower()
-        for num, player in JOSHUA_PLAYERS.items():
-            if player["name"].lower() == name_slug:
-                number = num
-                break
-        else:
-            raise HTTPException(status_code=404, detail="Player not found")
-    
-    player = JOSHUA_PLAYERS.get(number)
+        number = NUMBER_BY_SLUG.get(player_id.replace("-", " ").lower())
+
+    player = PLAYERS_BY_NUMBER.get(number)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
-    
-    # Add team info
-    result = {
-        **player,
-        "id": f"player_{number}",
-        "team": "Joshua",
-        "mascot": "Owls",
-        "gpa": player.get("gpa", "N/A")
-    }
-    
-    return result
+    return with_stats(player)
 
 @router.get("/players")
-def list_players(team: Optional[str] = None):
+def list_players(
+    team: Optional[str] = None,
+    sort: SortKey = "number",
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. number,name,position"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+):
     """
-    List all players
+    List players, optionally one team's roster (team ID, name, or "Name Mascot").
+    Paginated by cursor over a pre-sorted roster; `fields` trims each player
+    to the listed fields (id is always included).
     """
-    players = []
-    for number, player in JOSHUA_PLAYERS.items():
-        players.append({
-            **player,
-            "id": f"player_{number}",
-            "team": "Joshua",
-            "mascot": "Owls"
-        })
-    
-    return players
+    if team is None:
+        roster_id = ALL_TEAMS
+    else:
+        roster_id = TEAM_BY_KEY.get(team.strip().lower())
+    projection = parse_fields(fields)
+    after = decode_cursor(cursor, sort) if cursor else None
+
+    if roster_id is None:
+        players, next_key, total = [], None, 0
+    else:
+        order = ROSTERS[roster_id][sort]
+        players, next_key = order.page(after, limit)
+        total = len(order.players)
+
+    if projection is None or "stats" in projection:
+        players = [with_stats(p) for p in players]
+    if projection is not None:
+        players = [{f: p[f] for f in projection if f in p} for p in players]
+
+    return {
+        "players": players,
+        "total": total,
+        "next_cursor": encode_cursor(sort, next_key) if next_key is not None else None,
+    }
@@ -1,9 +1,29 @@
-from fastapi import APIRouter, Query
-from pydantic import BaseModel
-from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+from app.api.v1.routes.moderation import verify_admin
+from app.services.bracket import brackets
+from app.services.bracket_odds import DEFAULT_SIMULATIONS, PUBLIC_MAX_SIMULATIONS, bracket_odds
+from app.services.bracket_stream import bracket_feed
+from app.services.box_scores import CURRENT_SEASON
+from app.services.power_rankings import power_rankings
 
 router = APIRouter(prefix="/api/v1", tags=["playoff-bracket"])
 
+# Score updates and reloads fan out to open bracket streams
+brackets.subscribe(bracket_feed.publish)
+
+
+def _use_power_ratings(season: str, ratings: dict) -> None:
+    if season == CURRENT_SEASON:
+        bracket_odds.set_ratings(ratings)
+
+
+# Each power rankings load re-prices the bracket odds
+power_rankings.subscribe(_use_power_ratings)
+
 # ============================================================================
 # PYDANTIC SCHEMAS
 # ============================================================================
@@ -12,6 +32,7 @@ class Team(BaseModel):
     id: int
     name: str
     mascot: str = ""
+    seed: Optional[str] = None
 
 
 class PlayoffGame(BaseModel):
@@ -26,6 +47,9 @@ class PlayoffGame(BaseModel):
     kickoff_at: Optional[str] = None
     location: str = "TBD"
     notes: Optional[str] = None
+    broadcaster: Optional[str] = None
+    home_feeder: Optional[str] = None  # game_id whose winner takes the home slot
+    away_feeder: Optional[str] = None
 
 
 class PlayoffRound(BaseModel):
@@ -38,172 +62,113 @@ class PlayoffBracketResponse(BaseModel):
     rounds: list[PlayoffRound]
 
 
+class TeamOdds(BaseModel):
+    team: Team
+    odds: dict[str, float]  # round -> % chance of playing in it; "Champion" -> % to win it all
+
+
+class PlayoffOddsResponse(BaseModel):
+    conference: str
+    version: int  # bracket version the simulation ran against
+    simulations: int
+    rounds: list[str]
+    teams: list[TeamOdds]
+
+
+class PlayoffScoreUpdate(BaseModel):
+    home_score: Optional[int] = Field(None, ge=0)
+    away_score: Optional[int] = Field(None, ge=0)
+    status: Literal["scheduled", "live", "final"] = "final"
+
+
 # ============================================================================
 # ROUTES
 # ============================================================================
 
 @router.get("/playoff-bracket", response_model=PlayoffBracketResponse)
 def get_playoff_bracket(
-    conference: str = Query("5A D1", description="Conference/classification (e.g., '5A D1', '6A D2')")
-) -> PlayoffBracketResponse:
+    conference: str = Query("5A D1", description="Conference/classification (e.g., '5A D1', '6A D2')"),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """
     Get playoff bracket data for a specific conference.
     Returns all rounds and games in the playoff bracket.
 
-    NOTE: This currently serves mock data. When connected to the database, it should:
-    - Query playoff_games table filtered by conference
-    - Group games by round
-    - Include team details and current scores
-    - Show bracket progression
+    The body is the conference's cached, already-serialized bracket; it is
+    rebuilt only after a score update in that conference. Clients that send
+    back the ETag get a 304 until then. Conferences without a bracket get
+    empty rounds.
     """
+    snapshot = brackets.snapshot(conference)
+    headers = {
+        "ETag": snapshot.etag,
+        "X-Bracket-Version": str(snapshot.version),
+        "Cache-Control": "no-cache",
+    }
+    if if_none_match and snapshot.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.payload, media_type="application/json", headers=headers)
 
-    # Mock playoff bracket data for 5A D1
-    mock_rounds = [
-        PlayoffRound(
-            round="Bi-District",
-            games=[
-                PlayoffGame(
-                    id=218,
-                    game_id="G1",
-                    region=1,
-                    home_team=Team(id=1, name="Highland Park", mascot="Scots"),
-                    away_team=Team(id=2, name="Midlothian", mascot="Panthers"),
-                    home_score=28,
-                    away_score=24,
-                    status="final",
-                    kickoff_at="2025-11-08T19:00:00Z",
-                    location="AT&T Stadium",
-                    notes="Highland Park advances"
-                ),
-                PlayoffGame(
-                    id=219,
-                    game_id="G2",
-                    region=1,
-                    home_team=Team(id=3, name="Lovejoy", mascot="Leopards"),
-                    away_team=Team(id=4, name="Frisco Reedy", mascot="Lions"),
-                    home_score=35,
-                    away_score=21,
-                    status="final",
-                    kickoff_at="2025-11-08T19:30:00Z",
-                    location="McKinney ISD Stadium",
-                    notes="Lovejoy advances"
-                ),
-                PlayoffGame(
-                    id=220,
-                    game_id="G3",
-                    region=2,
-                    home_team=Team(id=5, name="Texas High", mascot="Tigers"),
-                    away_team=Team(id=6, name="Mount Pleasant", mascot="Tigers"),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at="2025-11-15T19:00:00Z",
-                    location="Christus Trinity Mother Frances Rose Stadium",
-                    notes=None
-                ),
-                PlayoffGame(
-                    id=221,
-                    game_id="G4",
-                    region=2,
-                    home_team=Team(id=7, name="Longview", mascot="Lobos"),
-                    away_team=Team(id=8, name="Tyler", mascot="Lions"),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at="2025-11-15T19:30:00Z",
-                    location="Lobo Stadium",
-                    notes=None
-                ),
-            ]
-        ),
-        PlayoffRound(
-            round="Area",
-            games=[
-                PlayoffGame(
-                    id=222,
-                    game_id="G5",
-                    region=1,
-                    home_team=Team(id=1, name="Highland Park", mascot="Scots"),
-                    away_team=Team(id=3, name="Lovejoy", mascot="Leopards"),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at="2025-11-22T19:00:00Z",
-                    location="AT&T Stadium",
-                    notes="Winner of G1 vs Winner of G2"
-                ),
-                PlayoffGame(
-                    id=223,
-                    game_id="G6",
-                    region=2,
-                    home_team=Team(id=5, name="TBD", mascot=""),
-                    away_team=Team(id=7, name="TBD", mascot=""),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at=None,
-                    location="TBD",
-                    notes="Winner of G3 vs Winner of G4"
-                ),
-            ]
-        ),
-        PlayoffRound(
-            round="Regional",
-            games=[
-                PlayoffGame(
-                    id=224,
-                    game_id="G7",
-                    region=1,
-                    home_team=Team(id=0, name="TBD", mascot=""),
-                    away_team=Team(id=0, name="TBD", mascot=""),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at=None,
-                    location="TBD",
-                    notes="Winner of G5 vs Winner of G6"
-                ),
-            ]
-        ),
-        PlayoffRound(
-            round="State Semifinal",
-            games=[
-                PlayoffGame(
-                    id=225,
-                    game_id="G8",
-                    region=1,
-                    home_team=Team(id=0, name="TBD", mascot=""),
-                    away_team=Team(id=0, name="TBD", mascot=""),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at=None,
-                    location="AT&T Stadium",
-                    notes="Regional Champions"
-                ),
-            ]
-        ),
-        PlayoffRound(
-            round="State Championship",
-            games=[
-                PlayoffGame(
-                    id=226,
-                    game_id="G9",
-                    region=1,
-                    home_team=Team(id=0, name="TBD", mascot=""),
-                    away_team=Team(id=0, name="TBD", mascot=""),
-                    home_score=None,
-                    away_score=None,
-                    status="scheduled",
-                    kickoff_at=None,
-                    location="AT&T Stadium",
-                    notes="State Championship Game"
-                ),
-            ]
-        ),
-    ]
-
-    return PlayoffBracketResponse(
-        conference=conference,
-        rounds=mock_rounds
+
+@router.get("/playoff-bracket/odds", response_model=PlayoffOddsResponse)
+def get_playoff_odds(
+    conference: str = Query("5A D1", description="Conference/classification (e.g., '5A D1', '6A D2')"),
+    simulations: int = Query(DEFAULT_SIMULATIONS, ge=100, le=PUBLIC_MAX_SIMULATIONS,
+                             description="Rounded up to 1,000, 10,000 or 100,000"),
+) -> PlayoffOddsResponse:
+    """
+    Each team's chance of reaching every remaining round, from Monte Carlo
+    runs over the bracket. Results are reused until a score in this
+    conference changes; `simulations` in the response is the count run.
+    """
+    bracket = brackets.get(conference)
+    if bracket is None:
+        raise HTTPException(status_code=404, detail=f"No playoff bracket for {conference}")
+    return PlayoffOddsResponse(**bracket_odds.odds(bracket, simulations).as_dict())
+
+
+@router.get("/playoff-bracket/stream")
+async def stream_playoff_bracket(
+    request: Request,
+    conference: str = Query("5A D1", description="Conference/classification (e.g., '5A D1', '6A D2')"),
+    since: Optional[int] = Query(None, ge=0, description="Resume after this seq"),
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """
+    Server-sent events for one conference's bracket.
+
+    Opens with a `ready` event carrying the current seq. Each `games` event
+    holds only the games a write changed (score, status, advanced teams);
+    its `id` is the seq to resume from, via `since` or the standard
+    Last-Event-ID header on reconnect. A `reset` event means the client
+    fell too far behind (or the bracket was reloaded) and should refetch
+    GET /playoff-bracket.
+    """
+    if brackets.get(conference) is None:
+        raise HTTPException(status_code=404, detail=f"No playoff bracket for {conference}")
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    return StreamingResponse(
+        bracket_feed.stream(conference, since, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
+
+
+@router.patch("/playoff-bracket/games/{id}", response_model=PlayoffGame)
+def update_playoff_game(id: int, update: PlayoffScoreUpdate, admin=Depends(verify_admin)) -> PlayoffGame:
+    """
+    Set a playoff game's score and status (admin only). Marking it final
+    moves the winner into the next round's slot (and, for a corrected
+    final, out of any later slots the previous winner had reached). Only
+    this game's conference gets a new bracket version. A final needs both
+    scores and a winner.
+    """
+    if update.status == "final" and (
+        update.home_score is None or update.away_score is None or update.home_score == update.away_score
+    ):
+        raise HTTPException(status_code=422, detail="A final needs both scores and a winner")
+    changed = brackets.record_score(id, update.home_score, update.away_score, update.status)
+    if changed is None:
+        raise HTTPException(status_code=404, detail=f"Playoff game {id} not found")
+    return PlayoffGame(**changed[0].as_dict())
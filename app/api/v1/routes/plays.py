@@ -0,0 +1,117 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+from app.api.v1.routes.moderation import verify_admin
+from app.services.box_scores import box_scores
+from app.services.play_log import PLAY_TYPES, PlayEvent, PlayLogUnavailable, play_log, parse_clock_seconds
+from app.services.win_probability import live_win_probability
+
+router = APIRouter(prefix="/api/v1", tags=["plays"])
+
+# ============================================================================
+# PYDANTIC SCHEMAS
+# ============================================================================
+
+class PlayCreate(BaseModel):
+    # Bounds match the packed game_plays record (see play_log._HEADER)
+    quarter: int = Field(..., ge=1, le=255)  # 1-4, 5+ for overtime
+    time: str = Field(..., pattern=r"^\d{1,2}:[0-5]\d$")  # "7:42" left in the quarter
+    team_id: str = Field(..., max_length=64)
+    team_name: str = Field(..., max_length=200)
+    play_type: Literal[PLAY_TYPES]  # "rush", "pass", "incomplete", "sack", "field_goal", ...
+    yards: int = Field(0, ge=-32768, le=32767)
+    description: str = Field("", max_length=2000)
+    is_scoring_play: bool = False
+    home_score_after: int = Field(..., ge=0, le=65535)
+    away_score_after: int = Field(..., ge=0, le=65535)
+    player_id: Optional[str] = Field(None, max_length=64)
+    target_id: Optional[str] = Field(None, max_length=64)
+    defender_id: Optional[str] = Field(None, max_length=64)
+
+
+class Play(BaseModel):
+    id: str
+    seq: int
+    game_id: str
+    quarter: int
+    time: str
+    team_id: str
+    team_name: str
+    play_type: str
+    yards: int
+    description: str
+    is_scoring_play: bool
+    home_score_after: int
+    away_score_after: int
+    player_id: Optional[str] = None
+    target_id: Optional[str] = None
+    defender_id: Optional[str] = None
+    created_at: str
+
+
+class PlaysResponse(BaseModel):
+    plays: list[Play]
+    total: int
+    last_seq: int
+
+
+# ============================================================================
+# DERIVED STATE
+# ============================================================================
+
+def _update_win_probability(play: PlayEvent) -> None:
+    """Re-price the live win probability from each play's score and clock."""
+    quarter = "OT" if play.quarter > 4 else f"{play.quarter}Q"
+    live_win_probability.update(
+        play.game_id,
+        home_score=play.home_score_after,
+        away_score=play.away_score_after,
+        quarter=quarter,
+        time_remaining=play.time,
+    )
+
+
+play_log.subscribe(_update_win_probability)
+play_log.subscribe(box_scores.fold)
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+@router.get("/games/{game_id}/plays", response_model=PlaysResponse)
+def get_game_plays(
+    game_id: int,
+    after_seq: int = Query(0, ge=0, description="Only return plays with seq greater than this"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> PlaysResponse:
+    """
+    Get play-by-play for a game, oldest first.
+
+    Live clients should poll with `after_seq` set to the last seq they have;
+    the read is a slice of the in-memory log.
+    """
+    try:
+        log = play_log.log(game_id)
+    except PlayLogUnavailable:
+        raise HTTPException(status_code=503, detail="Play-by-play temporarily unavailable")
+    plays = log.after(after_seq + offset, limit)
+    return PlaysResponse(
+        plays=[Play(**play.to_dict()) for play in plays],
+        total=len(log),
+        last_seq=log.last_seq,
+    )
+
+
+@router.post("/games/{game_id}/plays", response_model=Play)
+def append_game_play(game_id: int, body: PlayCreate, admin=Depends(verify_admin)) -> Play:
+    """Append the next play to a game's log (admin only). The server assigns `seq`."""
+    fields = body.dict()
+    fields["clock_seconds"] = parse_clock_seconds(fields.pop("time"))
+    try:
+        play = play_log.append(game_id, **fields)
+    except PlayLogUnavailable:
+        raise HTTPException(status_code=503, detail="Play-by-play temporarily unavailable")
+    return Play(**play.to_dict())
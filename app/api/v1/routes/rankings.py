@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.services.box_scores import CURRENT_SEASON
+from app.services.power_rankings import power_rankings
+
+# Served under /api (not /api/v1), where the app's RANKINGS_API_BASE points
+router = APIRouter(prefix="/api", tags=["rankings"])
+
+DEFAULT_PRIMARY_COLOR = "#1a1a1a"       # Same fallbacks the team import scripts use
+DEFAULT_BACKGROUND_COLOR = "#FFFFFF"
+
+# ============================================================================
+# PYDANTIC SCHEMAS
+# ============================================================================
+
+class RankingClassification(BaseModel):
+    classification: str
+
+
+class PowerRanking(BaseModel):
+    rank: int
+    school_id: Optional[int] = None
+    team_id: int
+    school_name: str
+    mascot: Optional[str] = None
+    city: Optional[str] = None
+    classification: str
+    power_rating: float
+    wins: int
+    losses: int
+    record: str
+    win_pct: float
+    sos: float
+    point_diff: int
+    is_incomplete: bool
+    primary_color: str
+    background_color: str
+    rank_change: Optional[int] = None       # Negative = moved up
+    previous_rank: Optional[int] = None
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+@router.get("/rankings/", response_model=List[PowerRanking])
+def get_power_rankings(
+    season: str = Query(CURRENT_SEASON, description="Season year, e.g. '2025'"),
+    classification: Optional[str] = Query(None, description="e.g. '6A'; all teams statewide if omitted"),
+) -> List[PowerRanking]:
+    """
+    Power rankings from the last scripts/compute_power_rankings.py run. Rank
+    is within the classification; without a classification filter, teams
+    are listed in statewide order.
+    """
+    return [_ranking(row) for row in power_rankings.rankings(season, classification)]
+
+
+@router.get("/rankings/classifications/", response_model=List[RankingClassification])
+def get_ranking_classifications(
+    season: str = Query(CURRENT_SEASON, description="Season year, e.g. '2025'"),
+) -> List[RankingClassification]:
+    """Classifications that have rankings for the season."""
+    return [RankingClassification(classification=c) for c in power_rankings.classifications(season)]
+
+
+def _ranking(row: dict) -> PowerRanking:
+    played = row["wins"] + row["losses"]
+    previous = row["previous_rank"]
+    return PowerRanking(
+        rank=row["rank"],
+        school_id=row["school_id"],
+        team_id=row["team_id"],
+        school_name=row["school_name"],
+        mascot=row["mascot"],
+        city=row["city"],
+        classification=row["classification"] or "",
+        power_rating=row["power_rating"],
+        wins=row["wins"],
+        losses=row["losses"],
+        record=f"{row['wins']}-{row['losses']}",
+        win_pct=round(row["wins"] / played, 3) if played else 0.0,
+        sos=row["sos"],
+        point_diff=row["point_diff"],
+        is_incomplete=row["is_incomplete"],
+        primary_color=row["primary_color"] or DEFAULT_PRIMARY_COLOR,
+        background_color=row["background_color"] or DEFAULT_BACKGROUND_COLOR,
+        rank_change=row["rank"] - previous if previous is not None else None,
+        previous_rank=previous,
+    )
@@ -1,10 +1,26 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+from app.services.game_day import game_day
+from app.services.power_rankings import power_rankings
 
 router = APIRouter(prefix="/api/v1", tags=["scores"])
 
+
+def _prefetch_scores(team_ids: List[str]) -> None:
+    """game_day listener: load the rankings the feed's state ranks come from before kickoff."""
+    power_rankings.warm()
+
+
+# The score feed is the first screen opened at kickoff
+game_day.subscribe(_prefetch_scores)
+
+# Client/CDN cache lifetime of the score feed, in seconds
+SCORES_GAME_DAY_MAX_AGE = 15
+SCORES_OFF_DAY_MAX_AGE = 600
+
 # ============================================================================
 # PYDANTIC SCHEMAS
 # ============================================================================
@@ -104,6 +120,7 @@ class ScoresResponse(BaseModel):
 
 @router.get("/scores", response_model=ScoresResponse)
 def get_scores(
+    response: Response,
     classification: Optional[str] = Query(None, description="Filter by classification (6A, 5A, etc.)"),
     date_from: Optional[str] = Query(None, description="Filter games from this date (ISO format)"),
     date_to: Optional[str] = Query(None, description="Filter games to this date (ISO format)"),
@@ -118,7 +135,12 @@ def get_scores(
     - Join with teams table to get rankings and colors
     - Include broadcaster information from the games table
     - Apply user's following preferences if following_only=true
+
+    Cacheable for SCORES_GAME_DAY_MAX_AGE seconds while games are scheduled
+    today, SCORES_OFF_DAY_MAX_AGE otherwise.
     """
+    max_age = SCORES_GAME_DAY_MAX_AGE if game_day.has_games_today() else SCORES_OFF_DAY_MAX_AGE
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
 
     now = datetime.utcnow()
 
@@ -222,6 +244,11 @@ def get_scores(
         ),
     ]
 
+    # State ranks come from the power rankings table where a team is ranked
+    for game in live_games:
+        game.home_state_rank = game.home_state_rank or _state_rank(game.home_team_id)
+        game.away_state_rank = game.away_state_rank or _state_rank(game.away_team_id)
+
     # Apply classification filter if provided
     if classification:
         live_games = [g for g in live_games if g.classification == classification]
@@ -234,3 +261,9 @@ def get_scores(
         upcoming_games=upcoming_games,
         updated_at=now.isoformat(),
     )
+
+
+def _state_rank(team_id: str) -> Optional[int]:
+    """The team's power ranking within its classification, if it has one."""
+    ranking = power_rankings.team(team_id)
+    return ranking["rank"] if ranking else None
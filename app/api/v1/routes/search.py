@@ -1,7 +1,17 @@
+import logging
+
 from fastapi import APIRouter, Query
+from pydantic import BaseModel, Field
 from typing import List, Literal
 
+from app.services.recent_searches import MAX_RECENT, recent_searches
+from app.services.search_cache import SearchCache
+from app.services.search_db import SearchResultCache, SearchUnavailable
+from app.services.search_index import SearchIndex, normalize
+from app.services.team_aliases import TEAMS_5A_D1
+
 router = APIRouter(prefix="/api/v1", tags=["search"])
+logger = logging.getLogger(__name__)
 
 # Data structures
 class SearchResult:
@@ -15,6 +25,11 @@ class SearchResult:
     def to_dict(self):
         return {k: v for k, v in self.__dict__.items() if v is not None}
 
+
+class RecentSearchRequest(BaseModel):
+    device_id: str = Field(..., min_length=1, max_length=128)   # recent_searches.device_id is VARCHAR(128)
+    query: str
+
 # Teams data
 TEAMS = [
     {"id": "1", "name": "Highland Park", "mascot": "Scots", "district": "District 7-5A", "record": "8-2"},
@@ -102,47 +117,110 @@ JOSHUA_COACHES = [
     {"name": "Harkness", "title": "WR"},
 ]
 
+# ============================================================================
+# SEARCH INDEX
+# In-memory fallback over the lists above, used when Postgres is unreachable.
+# Built once at import; use index_team/index_player/index_coach to keep it
+# current as rosters change.
+# ============================================================================
+
+search_index = SearchIndex()
+search_cache = SearchCache(search_index)
+database_cache = SearchResultCache()
+
+
+def _team_alias_groups() -> dict:
+    """Alias -> every alias and official name for the same team, from the import alias table."""
+    by_team_id = {}
+    for alias, (team_id, official_name) in TEAMS_5A_D1.items():
+        group = by_team_id.setdefault(team_id, {normalize(official_name)})
+        group.add(normalize(alias))
+    return {alias: group for group in by_team_id.values() for alias in group}
+
+
+TEAM_ALIASES = _team_alias_groups()
+
+
+def index_team(team: dict) -> None:
+    synonyms = TEAM_ALIASES.get(normalize(team["name"]), set()) - {normalize(team["name"])}
+    search_index.add("team", team["id"], (team["name"], team["mascot"]), {
+        "type": "team",
+        "id": team["id"],
+        "name": team["name"],
+        "mascot": team["mascot"],
+        "district": team["district"],
+        "record": team["record"]
+    }, synonyms=synonyms)
+
+
+def index_player(player: dict, team: str = "Joshua Owls", team_id: str = "2") -> None:
+    player_id = f"player_{player['number']}"
+    search_index.add("player", player_id, (player["name"], player["number"]), {
+        "type": "player",
+        "id": player_id,
+        "name": player["name"],
+        "number": player["number"],
+        "position": player["position"],
+        "team": team,
+        "team_id": team_id
+    })
+
+
+def index_coach(coach: dict, team: str = "Joshua Owls", team_id: str = "2") -> None:
+    coach_id = f"coach_{coach['name'].replace(' ', '_')}"
+    search_index.add("coach", coach_id, (coach["name"], coach["title"]), {
+        "type": "coach",
+        "id": coach_id,
+        "name": coach["name"],
+        "title": coach["title"],
+        "team": team,
+        "team_id": team_id
+    })
+
+
+for _team in TEAMS:
+    index_team(_team)
+for _player in JOSHUA_PLAYERS:
+    index_player(_player)
+for _coach in JOSHUA_COACHES:
+    index_coach(_coach)
+
+
 @router.get("/search")
-def search(q: str = Query(..., min_length=1)):
+def search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    following: List[str] = Query([], description="Followed team IDs; matches are boosted"),
+):
     """
-    Search for teams, players, and coaches
+    Search for teams, players, and coaches statewide.
+    Results are ranked exact > prefix > word-prefix > substring > fuzzy, with
+    followed teams lifted one tier, and cut off at `limit`. Served from the
+    Postgres full-text/trigram indexes through a short-lived result cache
+    that narrows cached shorter prefixes; while the database is unreachable,
+    falls back to the cached in-memory index, which also matches team
+    aliases ("HP").
     """
-    query = q.lower()
-    results = []
-    
-    # Search teams
-    for team in TEAMS:
-        if query in team["name"].lower() or query in team["mascot"].lower():
-            results.append({
-                "type": "team",
-                "id": team["id"],
-                "name": team["name"],
-                "mascot": team["mascot"],
-                "district": team["district"],
-                "record": team["record"]
-            })
-    
-    # Search players (Joshua only for now)
-    for player in JOSHUA_PLAYERS:
-        if query in player["name"].lower() or query in player["number"]:
-            results.append({
-                "type": "player",
-                "id": f"player_{player['number']}",
-                "name": player["name"],
-                "number": player["number"],
-                "position": player["position"],
-                "team": "Joshua Owls"
-            })
-    
-    # Search coaches (Joshua only for now)
-    for coach in JOSHUA_COACHES:
-        if query in coach["name"].lower() or query in coach["title"].lower():
-            results.append({
-                "type": "coach",
-                "id": f"coach_{coach['name'].replace(' ', '_')}",
-                "name": coach["name"],
-                "title": coach["title"],
-                "team": "Joshua Owls"
-            })
-    
-    return results
\ No newline at end of file
+    try:
+        return database_cache.search(q, limit=limit, followed_team_ids=following)
+    except SearchUnavailable as e:
+        logger.warning("search: database unavailable (%s), serving from the in-memory index", e)
+    return search_cache.search(q, limit=limit, followed_team_ids=following)
+
+
+@router.get("/search/recent", response_model=List[str])
+def get_recent_searches(
+    device_id: str = Query(..., min_length=1, max_length=128, description="Device ID the searches were saved under"),
+    limit: int = Query(MAX_RECENT, ge=1, le=MAX_RECENT),
+):
+    """This device's recent searches, most recent first, without duplicates."""
+    return recent_searches.recent(device_id, limit=limit)
+
+
+@router.post("/search/recent", status_code=204)
+def save_recent_search(body: RecentSearchRequest):
+    """
+    Push a search to the front of the device's recent list.
+    Recorded in memory immediately; persisted to Postgres in batches.
+    """
+    recent_searches.record(body.device_id, body.query)
@@ -0,0 +1,197 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.services.standings import (
+    StandingRow, StandingsGame, district_key, district_name, standings,
+)
+
+router = APIRouter(prefix="/api/v1", tags=["standings"])
+
+DEFAULT_COLOR = "#1a1a1a"   # Same fallback the team import scripts use
+
+# ============================================================================
+# PYDANTIC SCHEMAS
+# ============================================================================
+
+class DistrictStanding(BaseModel):
+    team_id: str
+    team_name: str
+    team_mascot: str
+    rank: int
+    wins: int
+    losses: int
+    district_wins: int
+    district_losses: int
+    points_for: int
+    points_against: int
+
+
+class DistrictStandingTeam(BaseModel):
+    team_id: int
+    team_name: str
+    mascot: str
+    primary_color: str
+    overall_wins: int
+    overall_losses: int
+    overall_record: str
+    district_wins: int
+    district_losses: int
+    district_record: str
+    points_for: int
+    points_against: int
+    streak: int
+    streak_type: str  # "W" | "L"
+    rank: int
+
+
+class GameDistrictStanding(DistrictStandingTeam):
+    is_current_game: bool
+
+
+class TeamDistrictStanding(DistrictStandingTeam):
+    is_user_team: bool
+
+
+class DistrictGame(BaseModel):
+    game_id: int
+    home_team_id: int
+    home_team_name: str
+    home_team_color: str
+    home_score: Optional[int] = None
+    away_team_id: int
+    away_team_name: str
+    away_team_color: str
+    away_score: Optional[int] = None
+    status: str
+    quarter: Optional[str] = None
+    time_remaining: Optional[str] = None
+    game_date: Optional[str] = None
+
+
+class GameDistrictResponse(BaseModel):
+    district_name: str
+    current_game: DistrictGame
+    standings: List[GameDistrictStanding]
+    other_games: List[DistrictGame]
+
+
+class TeamDistrictResponse(BaseModel):
+    district_name: str
+    team_id: int
+    team_name: str
+    standings: List[TeamDistrictStanding]
+    recent_games: List[DistrictGame]
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+@router.get("/standings/{classification}/{district}", response_model=List[DistrictStanding])
+def get_district_standings(classification: str, district: str) -> List[DistrictStanding]:
+    """District standings in UIL tiebreaker order, e.g. /standings/6A/5."""
+    rows = standings.standings(district_key(classification, district))
+    if rows is None:
+        raise HTTPException(status_code=404, detail="District not found")
+    return [
+        DistrictStanding(
+            team_id=str(row.team.id),
+            team_name=row.team.name,
+            team_mascot=row.team.mascot or "",
+            rank=row.rank,
+            wins=row.overall_wins,
+            losses=row.overall_losses,
+            district_wins=row.district_wins,
+            district_losses=row.district_losses,
+            points_for=row.points_for,
+            points_against=row.points_against,
+        )
+        for row in rows
+    ]
+
+
+@router.get("/teams/{team_id}/district", response_model=TeamDistrictResponse)
+def get_team_district(team_id: int) -> TeamDistrictResponse:
+    """The team's district standings and its district games, most recent first."""
+    team = standings.team(team_id)
+    if team is None or team.district is None:
+        raise HTTPException(status_code=404, detail="Team has no district")
+    games = [game for game in standings.district_games(team.district)
+             if team_id in (game.home_team_id, game.away_team_id)]
+    return TeamDistrictResponse(
+        district_name=district_name(team.district),
+        team_id=team.id,
+        team_name=team.name,
+        standings=[TeamDistrictStanding(**_standing(row), is_user_team=row.team.id == team_id)
+                   for row in standings.standings(team.district)],
+        recent_games=[_district_game(game) for game in reversed(games)],
+    )
+
+
+@router.get("/games/{game_id}/district", response_model=GameDistrictResponse)
+def get_game_district(game_id: int) -> GameDistrictResponse:
+    """
+    Standings for the game's district (the home team's, for a non-district
+    game) and the district's other games the same week.
+    """
+    game = standings.game(game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    key = game.district
+    if key is None:
+        home, away = standings.team(game.home_team_id), standings.team(game.away_team_id)
+        key = (home and home.district) or (away and away.district)
+    if key is None:
+        raise HTTPException(status_code=404, detail="Game has no district")
+    playing = (game.home_team_id, game.away_team_id)
+    week = game.kickoff_at.isocalendar()[:2] if game.kickoff_at else None
+    return GameDistrictResponse(
+        district_name=district_name(key),
+        current_game=_district_game(game),
+        standings=[GameDistrictStanding(**_standing(row), is_current_game=row.team.id in playing)
+                   for row in standings.standings(key)],
+        other_games=[
+            _district_game(other) for other in standings.district_games(key)
+            if other.id != game_id and (week is None or (other.kickoff_at and other.kickoff_at.isocalendar()[:2] == week))
+        ],
+    )
+
+
+def _standing(row: StandingRow) -> dict:
+    return dict(
+        team_id=row.team.id,
+        team_name=row.team.name,
+        mascot=row.team.mascot or "",
+        primary_color=row.team.primary_color or DEFAULT_COLOR,
+        overall_wins=row.overall_wins,
+        overall_losses=row.overall_losses,
+        overall_record=f"{row.overall_wins}-{row.overall_losses}",
+        district_wins=row.district_wins,
+        district_losses=row.district_losses,
+        district_record=f"{row.district_wins}-{row.district_losses}",
+        points_for=row.points_for,
+        points_against=row.points_against,
+        streak=row.streak,
+        streak_type=row.streak_type,
+        rank=row.rank,
+    )
+
+
+def _district_game(game: StandingsGame) -> DistrictGame:
+    home, away = standings.team(game.home_team_id), standings.team(game.away_team_id)
+    return DistrictGame(
+        game_id=game.id,
+        home_team_id=game.home_team_id,
+        home_team_name=home.name if home else "",
+        home_team_color=(home and home.primary_color) or DEFAULT_COLOR,
+        home_score=game.home_score,
+        away_team_id=game.away_team_id,
+        away_team_name=away.name if away else "",
+        away_team_color=(away and away.primary_color) or DEFAULT_COLOR,
+        away_score=game.away_score,
+        status=game.status,
+        quarter=game.quarter,
+        time_remaining=game.time_remaining,
+        game_date=game.kickoff_at.date().isoformat() if game.kickoff_at else None,
+    )
@@ -0,0 +1,323 @@
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+from app.services.box_scores import CURRENT_SEASON, box_scores
+from app.services.leaderboards import TOP_N, leaderboards
+from app.services.player_stats import player_stats
+from app.services.power_rankings import power_rankings
+
+router = APIRouter(prefix="/api/v1", tags=["stats"])
+
+# Season totals and leaderboards follow every folded play
+box_scores.subscribe(leaderboards.fold)
+
+# ============================================================================
+# PYDANTIC SCHEMAS
+# ============================================================================
+
+class PlayerBoxLine(BaseModel):
+    player_id: str
+    team_id: str
+    name: Optional[str] = None
+    jersey_number: Optional[int] = None
+    position: Optional[str] = None
+    passing_yards: int = 0
+    passing_completions: int = 0
+    passing_attempts: int = 0
+    passing_tds: int = 0
+    passing_ints: int = 0
+    rushing_yards: int = 0
+    rushing_carries: int = 0
+    rushing_tds: int = 0
+    receptions: int = 0
+    receiving_yards: int = 0
+    receiving_tds: int = 0
+    tackles: int = 0
+    sacks: float = 0.0
+    interceptions: int = 0
+
+
+class TeamBoxLine(BaseModel):
+    team_id: str
+    team_name: str
+    points: int
+    total_yards: int
+    passing_yards: int
+    rushing_yards: int
+    plays: int
+    turnovers: int
+    takeaways: int
+    sacks: float
+    players: list[PlayerBoxLine]
+
+
+class BoxScoreResponse(BaseModel):
+    game_id: int
+    home_team_id: Optional[str] = None
+    away_team_id: Optional[str] = None
+    home_score: int
+    away_score: int
+    last_seq: int
+    teams: list[TeamBoxLine]
+
+
+class TeamSeasonStats(BaseModel):
+    team_id: str
+    team_name: str
+    season: str
+    games_played: int
+    # Offensive stats
+    total_points: int
+    points_per_game: float
+    total_yards: int
+    yards_per_game: float
+    passing_yards: int
+    rushing_yards: int
+    turnovers: int
+    # Defensive stats
+    points_allowed: int
+    points_allowed_per_game: float
+    yards_allowed: int
+    yards_allowed_per_game: float
+    takeaways: int
+    sacks: float
+    # Efficiency (needs down/distance on plays; 0 until the feed provides it)
+    third_down_pct: float = 0.0
+    fourth_down_pct: float = 0.0
+    red_zone_pct: float = 0.0
+    turnover_margin: int
+    # From the last power rankings run
+    power_rating: Optional[float] = None
+    power_rank: Optional[int] = None  # Within the team's classification
+
+
+class PlayerSeasonStat(BaseModel):
+    player_id: str
+    player_name: Optional[str] = None
+    jersey: Optional[int] = None
+    rushing_yards: float = 0
+    rushing_tds: float = 0
+    rushing_attempts: float = 0
+    passing_yards: float = 0
+    passing_tds: float = 0
+    passing_completions: float = 0
+    passing_attempts: float = 0
+    receiving_yards: float = 0
+    receiving_tds: float = 0
+    receptions: float = 0
+    games_played: int = 0
+
+
+class SingleGameBest(BaseModel):
+    value: float = 0
+    player: Optional[str] = None
+    game_id: Optional[int] = None
+    opponent: Optional[str] = None
+
+
+class TopPerformersResponse(BaseModel):
+    season_leaders: Dict[str, list[PlayerSeasonStat]]
+    single_game_bests: Dict[str, SingleGameBest]
+
+
+class SeasonLeader(BaseModel):
+    player_id: str
+    name: Optional[str] = None
+    position: Optional[str] = None
+    jersey: Optional[int] = None
+    yards: float
+    tds: float
+    # Passing specific
+    completions: Optional[float] = None
+    attempts: Optional[float] = None
+    ints: Optional[float] = None
+    # Rushing specific
+    long: Optional[float] = None
+    # Receiving specific
+    receptions: Optional[float] = None
+
+
+class TeamSeasonLeadersResponse(BaseModel):
+    team_id: str
+    team_name: str
+    team_color: Optional[str] = None
+    passing_leader: Optional[SeasonLeader] = None
+    rushing_leader: Optional[SeasonLeader] = None
+    receiving_leader: Optional[SeasonLeader] = None
+
+
+TOP_PERFORMER_CATEGORIES = (
+    "rushing_yards", "rushing_tds", "passing_yards", "passing_tds", "receiving_yards", "receiving_tds",
+)
+SEASON_STAT_FIELDS = [f for f in PlayerSeasonStat.__fields__ if f not in ("player_id", "player_name", "jersey", "games_played")]
+
+
+def _season_stat(player_id: str) -> PlayerSeasonStat:
+    name, jersey, _ = player_stats.info(player_id)
+    return PlayerSeasonStat(
+        player_id=player_id,
+        player_name=name,
+        jersey=jersey,
+        games_played=leaderboards.games_played(player_id),
+        **player_stats.values(player_id, SEASON_STAT_FIELDS),
+    )
+
+
+def _season_leader(team_id: str, category: str, extra: Dict[str, str]) -> Optional[SeasonLeader]:
+    """The team's top player in `category` ("passing", "rushing", "receiving")."""
+    top = leaderboards.top(f"{category}_yards", 1, scope=("team", team_id))
+    if not top:
+        return None
+    player_id, yards = top[0]
+    name, jersey, position = player_stats.info(player_id)
+    return SeasonLeader(
+        player_id=player_id,
+        name=name,
+        position=position,
+        jersey=jersey,
+        yards=yards,
+        tds=player_stats.value(player_id, f"{category}_tds"),
+        **{field: player_stats.value(player_id, stat) for field, stat in extra.items()},
+    )
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+@router.get("/games/{game_id}/box-score", response_model=BoxScoreResponse)
+def get_box_score(game_id: int) -> BoxScoreResponse:
+    """Get the team and player box score for a game, folded from its play log."""
+    box = box_scores.game(game_id)
+    if box is None:
+        raise HTTPException(status_code=404, detail="No box score for this game")
+
+    teams = []
+    for team in box.teams.values():
+        teams.append(TeamBoxLine(
+            team_id=team.team_id,
+            team_name=team.team_name,
+            points=team.points,
+            total_yards=team.total_yards,
+            passing_yards=team.passing_yards,
+            rushing_yards=team.rushing_yards,
+            plays=team.plays,
+            turnovers=team.turnovers,
+            takeaways=team.takeaways,
+            sacks=team.sacks,
+            players=[
+                PlayerBoxLine(**player.to_dict())
+                for player in box.players.values()
+                if player.team_id == team.team_id
+            ],
+        ))
+
+    return BoxScoreResponse(
+        game_id=box.game_id,
+        home_team_id=box.home_team_id,
+        away_team_id=box.away_team_id,
+        home_score=box.home_score,
+        away_score=box.away_score,
+        last_seq=box.last_seq,
+        teams=teams,
+    )
+
+
+@router.get("/teams/{team_id}/stats", response_model=TeamSeasonStats)
+def get_team_stats(
+    team_id: str,
+    season: str = Query(CURRENT_SEASON, description="Season year, e.g. '2025'"),
+) -> TeamSeasonStats:
+    """Get a team's season totals. Served from the incrementally maintained aggregate."""
+    line = box_scores.team_season(team_id, season)
+    if line is None:
+        raise HTTPException(status_code=404, detail="No stats for this team and season")
+
+    games = max(line.games_played, 1)
+    ranking = power_rankings.team(team_id, season)
+    return TeamSeasonStats(
+        team_id=line.team_id,
+        team_name=line.team_name,
+        season=season,
+        games_played=line.games_played,
+        total_points=line.points,
+        points_per_game=round(line.points / games, 1),
+        total_yards=line.total_yards,
+        yards_per_game=round(line.total_yards / games, 1),
+        passing_yards=line.passing_yards,
+        rushing_yards=line.rushing_yards,
+        turnovers=line.turnovers,
+        points_allowed=line.points_allowed,
+        points_allowed_per_game=round(line.points_allowed / games, 1),
+        yards_allowed=line.yards_allowed,
+        yards_allowed_per_game=round(line.yards_allowed / games, 1),
+        takeaways=line.takeaways,
+        sacks=line.sacks,
+        turnover_margin=line.takeaways - line.turnovers,
+        power_rating=ranking["power_rating"] if ranking else None,
+        power_rank=ranking["rank"] if ranking else None,
+    )
+
+
+@router.get("/top-performers", response_model=TopPerformersResponse)
+def get_top_performers(
+    classification: Optional[str] = Query(None, description="e.g. '5A-D1'"),
+    district: Optional[str] = Query(None, description="e.g. '7-5A'"),
+    limit: int = Query(5, ge=1, le=TOP_N),
+) -> TopPerformersResponse:
+    """
+    Season leaders per category (statewide, or within a classification or
+    district) and single-game bests. Read from incrementally maintained
+    top-N boards; nothing is sorted per request.
+    """
+    if district:
+        scope = ("district", district)
+    elif classification:
+        scope = ("classification", classification)
+    else:
+        scope = ("state", "")
+
+    season_leaders = {
+        category: [_season_stat(player_id) for player_id, _ in leaderboards.top(category, limit, scope=scope)]
+        for category in TOP_PERFORMER_CATEGORIES
+    }
+
+    single_game_bests = {}
+    for category, best in leaderboards.game_bests().items():
+        opponent = None
+        box = box_scores.game(best.game_id) if best.game_id is not None else None
+        if box is not None and best.opponent_id in box.teams:
+            opponent = box.teams[best.opponent_id].team_name or None
+        single_game_bests[category] = SingleGameBest(
+            value=best.value,
+            player=player_stats.info(best.player_id)[0] if best.player_id else None,
+            game_id=best.game_id,
+            opponent=opponent,
+        )
+
+    return TopPerformersResponse(season_leaders=season_leaders, single_game_bests=single_game_bests)
+
+
+@router.get("/teams/{team_id}/season-leaders", response_model=TeamSeasonLeadersResponse)
+def get_team_season_leaders(team_id: str) -> TeamSeasonLeadersResponse:
+    """Get a team's passing, rushing and receiving leaders from the team-scoped boards."""
+    passing = _season_leader(team_id, "passing", {"completions": "passing_completions",
+                                                  "attempts": "passing_attempts", "ints": "passing_ints"})
+    rushing = _season_leader(team_id, "rushing", {"attempts": "rushing_attempts", "long": "rushing_long"})
+    receiving = _season_leader(team_id, "receiving", {"receptions": "receptions"})
+
+    team_name = leaderboards.team_name(team_id)
+    season_line = box_scores.team_season(team_id)
+    if team_name is None and season_line is not None:
+        team_name = season_line.team_name
+    if team_name is None and not (passing or rushing or receiving):
+        raise HTTPException(status_code=404, detail="No season stats for this team")
+
+    return TeamSeasonLeadersResponse(
+        team_id=team_id,
+        team_name=team_name or "",
+        passing_leader=passing,
+        rushing_leader=rushing,
+        receiving_leader=receiving,
+    )
@@ -0,0 +1,111 @@
+import psycopg2
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+from app.services.votes import vote_store
+
+router = APIRouter(prefix="/api/v1", tags=["votes"])
+
+# ============================================================================
+# PYDANTIC SCHEMAS
+# ============================================================================
+
+class VoteRequest(BaseModel):
+    device_id: str = Field(..., min_length=1, max_length=128)   # game_votes.device_id is VARCHAR(128)
+    predicted_winner: Literal["home", "away"]
+
+
+class VoteResponse(BaseModel):
+    message: str
+    vote: Literal["home", "away"]
+
+
+class VotesResponse(BaseModel):
+    home: int
+    away: int
+    home_percentage: float
+    away_percentage: float
+
+
+class GameVoteStatus(BaseModel):
+    game_id: int
+    vote: Optional[Literal["home", "away"]] = None  # This device's pick, if any
+    home: int
+    away: int
+    home_percentage: float
+    away_percentage: float
+
+
+class BulkVotesResponse(BaseModel):
+    device_id: str
+    games: list[GameVoteStatus]
+
+
+MAX_BULK_GAMES = 200
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+@router.post("/games/{game_id}/vote", response_model=VoteResponse)
+def cast_vote(game_id: int, body: VoteRequest) -> VoteResponse:
+    """
+    Cast a fan prediction for a game.
+
+    Votes are locked: a second vote from the same device returns the
+    original pick. Counting happens in memory; the row is written to
+    Postgres by the background batch writer, so the game is checked here
+    rather than left to fail the foreign key there.
+    """
+    try:
+        known = vote_store.is_game(game_id)
+    except psycopg2.Error:
+        raise HTTPException(status_code=503, detail="Could not verify game")
+    if not known:
+        raise HTTPException(status_code=404, detail="Game not found")
+    vote, created = vote_store.cast(game_id, body.device_id, body.predicted_winner)
+    return VoteResponse(
+        message="Vote recorded" if created else "Vote already recorded",
+        vote=vote,
+    )
+
+
+@router.get("/games/{game_id}/votes", response_model=VotesResponse)
+def get_votes(game_id: int) -> VotesResponse:
+    """Get the current vote tally for a game (served from in-memory counters)."""
+    tally = vote_store.tally(game_id)
+    return VotesResponse(
+        home=tally.home,
+        away=tally.away,
+        home_percentage=tally.home_percentage,
+        away_percentage=tally.away_percentage,
+    )
+
+
+@router.get("/votes", response_model=BulkVotesResponse)
+def get_votes_for_games(
+    device_id: str = Query(..., description="Device ID used when casting votes"),
+    game_ids: list[int] = Query(..., description="Game IDs, e.g. ?game_ids=1&game_ids=2"),
+) -> BulkVotesResponse:
+    """
+    Get this device's pick and the current tally for many games in one call,
+    so the scores screen can render every prediction bar from one request.
+    Served entirely from the in-memory vote store. At most MAX_BULK_GAMES
+    games per request.
+    """
+    if len(game_ids) > MAX_BULK_GAMES:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_BULK_GAMES} game_ids per request")
+    statuses = []
+    for game_id, vote, tally in vote_store.lookup(device_id, game_ids):
+        statuses.append(GameVoteStatus(
+            game_id=game_id,
+            vote=vote,
+            home=tally.home,
+            away=tally.away,
+            home_percentage=tally.home_percentage,
+            away_percentage=tally.away_percentage,
+        ))
+
+    return BulkVotesResponse(device_id=device_id, games=statuses)
@@ -0,0 +1,72 @@
+"""
+StatIQ Postgres connection helpers
+Shared by background services that read/write outside a request.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+POOL_MIN = 1
+POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _settings() -> dict:
+    return dict(
+        host=os.getenv("DB_HOST", "localhost"),
+        database=os.getenv("DB_NAME", "statiq"),
+        user=os.getenv("DB_USER", "postgres"),
+        password=os.getenv("DB_PASSWORD", ""),
+        cursor_factory=RealDictCursor
+    )
+
+
+def connect():
+    """Open a new connection using the same env settings as the API routers."""
+    return psycopg2.connect(**_settings())
+
+
+@contextmanager
+def transaction():
+    """Yield a cursor inside a single transaction; commit on success, roll back on error."""
+    conn = connect()
+    try:
+        with conn:
+            with conn.cursor() as cursor:
+                yield cursor
+    finally:
+        conn.close()
+
+
+@contextmanager
+def pooled_cursor():
+    """
+    Yield a cursor on a connection borrowed from a shared pool.
+
+    For short, frequent request-path reads where opening a connection per
+    call would dominate the query time. Commits on success, rolls back on
+    error; a connection that failed is discarded rather than returned.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(POOL_MIN, POOL_MAX, **_settings())
+    conn = _pool.getconn()
+    broken = False
+    try:
+        with conn:
+            with conn.cursor() as cursor:
+                yield cursor
+    except psycopg2.Error:
+        broken = True
+        raise
+    finally:
+        _pool.putconn(conn, close=broken)
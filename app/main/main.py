@@ -8,6 +8,23 @@ from app.api.v1.routes.games import router as games_router, ml_router
 from app.api.v1.routes.scores import router as scores_router
 from app.api.v1.routes.playoff_bracket import router as playoff_bracket_router
 from app.api.v1.routes.moderation import router as moderation_router
+from app.api.v1.routes.votes import router as votes_router
+from app.api.v1.routes.plays import router as plays_router
+from app.api.v1.routes.stats import router as stats_router
+from app.api.v1.routes.standings import router as standings_router
+from app.api.v1.routes.rankings import router as rankings_router
+from app.services.votes import vote_store
+from app.services.play_log import play_log
+from app.services.box_scores import box_scores
+from app.services.recent_searches import recent_searches
+from app.services.bracket import brackets
+from app.services.bracket_odds import bracket_odds
+from app.services.bracket_loader import load_bracket_files
+from app.services.dashboard import dashboards
+from app.services.game_day import game_day
+from app.services.leaderboards import leaderboards
+from app.services.standings import standings
+from app.services.power_rankings import power_rankings
 
 app = FastAPI(title="StatIQ API", version="1.0.0")
 
@@ -28,6 +45,36 @@ app.include_router(ml_router)  # ML prediction endpoints (no /api/v1 prefix)
 app.include_router(scores_router)
 app.include_router(playoff_bracket_router)
 app.include_router(moderation_router)
+app.include_router(votes_router)
+app.include_router(plays_router)
+app.include_router(stats_router)
+app.include_router(standings_router)
+app.include_router(rankings_router)
+
+@app.on_event("startup")
+def start_background_services():
+    vote_store.start()
+    play_log.start()
+    box_scores.start()
+    leaderboards.warm()  # Season totals box_scores just reloaded
+    recent_searches.start()
+    dashboards.start()
+    game_day.start()
+    bracket_odds.start()
+    standings.warm()
+    power_rankings.warm()  # Also hands the ratings to the bracket odds engine
+    if not brackets.warm():
+        load_bracket_files(brackets)  # No playoff_games yet: serve the checked-in bracket files
+
+@app.on_event("shutdown")
+def stop_background_services():
+    vote_store.stop()
+    play_log.stop()
+    box_scores.stop()
+    recent_searches.stop()
+    game_day.stop()
+    dashboards.stop()
+    bracket_odds.stop()
 
 @app.get("/health")
 def health():
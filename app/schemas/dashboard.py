@@ -59,8 +59,8 @@ class TeamStats(BaseModel):
     points_per_game: float
     yards_per_game: int
     turnover_margin: str
-    third_down_pct: float
-    red_zone_efficiency: float
+    third_down_pct: Optional[float] = None       # Not derivable from tracked plays yet
+    red_zone_efficiency: Optional[float] = None
 
 
 class CoachNote(BaseModel):
@@ -78,4 +78,5 @@ class DashboardPayload(BaseModel):
     player_availability: PlayerAvailability = Field(default_factory=PlayerAvailability)
     key_performers: List[KeyPerformer] = Field(default_factory=list)
     team_stats: Optional[TeamStats] = None
-    coach_notes: List[CoachNote] = Field(default_factory=list)
\ No newline at end of file
+    coach_notes: List[CoachNote] = Field(default_factory=list)
+    stale_sections: List[str] = Field(default_factory=list)  # Sections whose loader timed out or failed
\ No newline at end of file
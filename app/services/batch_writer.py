@@ -0,0 +1,114 @@
+"""
+StatIQ Batch Writer
+Background thread that drains an in-memory queue into Postgres in batches,
+so request handlers never wait on a synchronous DB write.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Callable, Deque, List
+
+import psycopg2
+from psycopg2.pool import PoolError
+
+logger = logging.getLogger(__name__)
+dead_letter_logger = logging.getLogger(f"{__name__}.dead_letter")
+
+DEAD_LETTER_LIMIT = 1000      # Most recent dead-lettered rows kept per writer for inspection
+
+# The database is unreachable rather than rejecting the rows: keep them queued
+TRANSIENT_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError, PoolError)
+
+
+class BatchWriter:
+    """
+    Buffers rows and hands them to `flush_fn` in batches.
+
+    A flush is triggered when `batch_size` rows are pending or every
+    `interval` seconds, whichever comes first. If the database is
+    unreachable, the batch is put back at the front of the queue and retried
+    on the next cycle. Any other failure means some row in the batch was
+    rejected, so the batch is retried row by row and the rows that still
+    fail go to the dead-letter log instead of blocking the queue.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_fn: Callable[[List[tuple]], None],
+        batch_size: int = 500,
+        interval: float = 2.0,
+    ):
+        self.name = name
+        self._flush_fn = flush_fn
+        self._batch_size = batch_size
+        self._interval = interval
+        self._pending: Deque[tuple] = deque()
+        self._dead_letters: Deque[tuple] = deque(maxlen=DEAD_LETTER_LIMIT)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, row: tuple) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= self._batch_size:
+            self._wake.set()
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def dead_letters(self) -> List[tuple]:
+        return list(self._dead_letters)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"batch-writer-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and flush whatever is still queued."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> None:
+        while self._pending:
+            batch = []
+            while self._pending and len(batch) < self._batch_size:
+                batch.append(self._pending.popleft())
+            try:
+                self._flush_fn(batch)
+            except TRANSIENT_ERRORS:
+                logger.exception("%s: flush of %d rows failed, requeueing", self.name, len(batch))
+                self._pending.extendleft(reversed(batch))
+                return
+            except Exception:
+                logger.exception("%s: flush of %d rows failed, retrying row by row", self.name, len(batch))
+                if not self._flush_rows(batch):
+                    return
+
+    def _flush_rows(self, batch: List[tuple]) -> bool:
+        """Flush one row at a time. Returns False if the database went away part way through."""
+        for i, row in enumerate(batch):
+            try:
+                self._flush_fn([row])
+            except TRANSIENT_ERRORS:
+                logger.exception("%s: row flush failed, requeueing %d rows", self.name, len(batch) - i)
+                self._pending.extendleft(reversed(batch[i:]))
+                return False
+            except Exception as e:
+                self._dead_letters.append(row)
+                dead_letter_logger.error("%s: dropping row %r: %s", self.name, row, e)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            self.flush()
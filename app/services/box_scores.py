@@ -0,0 +1,439 @@
+"""
+StatIQ Box Scores
+Streaming aggregation of play events into per-game and per-season stat lines.
+
+Every play is turned into a small list of stat deltas, and each delta is
+applied to both the game box score and the season totals. Nothing is ever
+recomputed from the full play history: stat screens read the precomputed
+lines directly.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from app.db import connect, pooled_cursor, transaction
+from app.services.batch_writer import BatchWriter
+from app.services.play_log import PlayEvent, play_log
+
+logger = logging.getLogger(__name__)
+
+CURRENT_SEASON = "2025"
+
+
+# =============================================================================
+# STAT LINES
+# =============================================================================
+
+@dataclass
+class PlayerLine:
+    player_id: str
+    team_id: str = ""
+    name: Optional[str] = None
+    jersey_number: Optional[int] = None
+    position: Optional[str] = None
+    games_played: int = 0
+
+    passing_yards: int = 0
+    passing_completions: int = 0
+    passing_attempts: int = 0
+    passing_tds: int = 0
+    passing_ints: int = 0
+    rushing_yards: int = 0
+    rushing_carries: int = 0
+    rushing_tds: int = 0
+    receptions: int = 0
+    receiving_yards: int = 0
+    receiving_tds: int = 0
+    tackles: int = 0
+    sacks: float = 0.0
+    interceptions: int = 0
+
+    def to_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass
+class TeamLine:
+    team_id: str
+    team_name: str = ""
+    games_played: int = 0
+
+    points: int = 0
+    points_allowed: int = 0
+    passing_yards: int = 0
+    rushing_yards: int = 0
+    yards_allowed: int = 0
+    plays: int = 0
+    turnovers: int = 0
+    takeaways: int = 0
+    sacks: float = 0.0
+
+    @property
+    def total_yards(self) -> int:
+        return self.passing_yards + self.rushing_yards
+
+    def to_dict(self) -> dict:
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["total_yards"] = self.total_yards
+        return data
+
+
+PLAYER_STAT_FIELDS = [f.name for f in fields(PlayerLine)][6:]
+TEAM_STAT_FIELDS = [f.name for f in fields(TeamLine)][3:]
+
+
+@dataclass
+class GameBoxScore:
+    game_id: int
+    season: str = CURRENT_SEASON
+    home_team_id: Optional[str] = None
+    away_team_id: Optional[str] = None
+    home_score: int = 0
+    away_score: int = 0
+    teams: Dict[str, TeamLine] = field(default_factory=dict)
+    players: Dict[str, PlayerLine] = field(default_factory=dict)
+    last_seq: int = 0
+
+    def opponent(self, team_id: str) -> Optional[str]:
+        if team_id == self.home_team_id:
+            return self.away_team_id
+        if team_id == self.away_team_id:
+            return self.home_team_id
+        return None
+
+
+# A delta targets ("team" | "player", id, field, amount)
+Delta = Tuple[str, str, str, float]
+
+# Called after each fold with the game and the deltas it applied
+FoldListener = Callable[["GameBoxScore", List[Delta]], None]
+
+
+def play_deltas(play: PlayEvent, offense: str, defense: Optional[str]) -> List[Delta]:
+    """Translate one play into stat deltas for the offense, defense and players involved."""
+    deltas: List[Delta] = [("team", offense, "plays", 1)]
+    kind = play.play_type
+    yards = play.yards
+    td = play.is_scoring_play
+
+    def player(pid: Optional[str], name: str, amount: float = 1):
+        if pid:
+            deltas.append(("player", pid, name, amount))
+
+    def team(tid: Optional[str], name: str, amount: float = 1):
+        if tid:
+            deltas.append(("team", tid, name, amount))
+
+    if kind == "rush":
+        player(play.player_id, "rushing_carries")
+        player(play.player_id, "rushing_yards", yards)
+        if td:
+            player(play.player_id, "rushing_tds")
+        player(play.defender_id, "tackles")
+        team(offense, "rushing_yards", yards)
+        team(defense, "yards_allowed", yards)
+    elif kind == "pass":
+        player(play.player_id, "passing_attempts")
+        player(play.player_id, "passing_completions")
+        player(play.player_id, "passing_yards", yards)
+        player(play.target_id, "receptions")
+        player(play.target_id, "receiving_yards", yards)
+        if td:
+            player(play.player_id, "passing_tds")
+            player(play.target_id, "receiving_tds")
+        player(play.defender_id, "tackles")
+        team(offense, "passing_yards", yards)
+        team(defense, "yards_allowed", yards)
+    elif kind == "incomplete":
+        player(play.player_id, "passing_attempts")
+    elif kind == "sack":
+        # NFHS scoring: sack yardage counts against team rushing
+        player(play.defender_id, "sacks", 1.0)
+        player(play.defender_id, "tackles")
+        team(offense, "rushing_yards", yards)
+        team(defense, "yards_allowed", yards)
+        team(defense, "sacks", 1.0)
+    elif kind == "interception":
+        player(play.player_id, "passing_attempts")
+        player(play.player_id, "passing_ints")
+        player(play.defender_id, "interceptions")
+        team(offense, "turnovers")
+        team(defense, "takeaways")
+    elif kind == "fumble":
+        team(offense, "turnovers")
+        team(defense, "takeaways")
+
+    return deltas
+
+
+# =============================================================================
+# AGGREGATOR
+# =============================================================================
+
+class BoxScoreAggregator:
+    """
+    Folds plays into game box scores and season totals as they are appended.
+
+    A game's box score takes its home/away team IDs and season from the
+    games table when it is created, and is rebuilt from the game's earlier
+    plays (box score only; the season totals already include them) so a
+    restart mid-game does not count the scoreboard or games played twice.
+    """
+
+    def __init__(self):
+        self._games: Dict[int, GameBoxScore] = {}
+        self._season_teams: Dict[Tuple[str, str], TeamLine] = {}
+        self._season_players: Dict[Tuple[str, str], PlayerLine] = {}
+        self._lock = threading.Lock()
+        self._dirty_teams: set = set()
+        self._dirty_players: set = set()
+        self._listeners: List[FoldListener] = []
+        self._writer = BatchWriter("season-stats", _persist_season_lines, batch_size=200, interval=5.0)
+
+    def subscribe(self, listener: FoldListener) -> None:
+        self._listeners.append(listener)
+
+    # -------------------------------------------------------------------------
+    # Folding
+    # -------------------------------------------------------------------------
+
+    def fold(self, play: PlayEvent) -> None:
+        box = self._games.get(play.game_id)
+        if box is None:
+            box = self._new_box(play)
+        with self._lock:
+            box = self._games.setdefault(play.game_id, box)
+            if play.seq <= box.last_seq:
+                return  # Already folded (replayed log)
+            deltas = self._apply(box, play)
+
+        for listener in self._listeners:
+            try:
+                listener(box, deltas)
+            except Exception:
+                logger.exception("box_scores: listener failed on game %s seq %s", play.game_id, play.seq)
+
+    def _new_box(self, play: PlayEvent) -> GameBoxScore:
+        """A box score for the play's game, caught up to the play before it."""
+        box = GameBoxScore(game_id=play.game_id)
+        try:
+            record = _game_record(play.game_id)
+        except Exception:
+            logger.exception("box_scores: could not look up game %s, points will not be credited", play.game_id)
+        else:
+            if record is None:
+                logger.warning("box_scores: game %s is not in games, points will not be credited", play.game_id)
+            else:
+                box.home_team_id, box.away_team_id, box.season = record
+        for earlier in play_log.log(play.game_id).after(0, play.seq - 1):
+            self._apply(box, earlier, season=False)
+        return box
+
+    def _apply(self, box: GameBoxScore, play: PlayEvent, season: bool = True) -> List[Delta]:
+        """Fold one play into the box score, and into the season totals unless `season` is False."""
+        box.last_seq = play.seq
+        offense = play.team_id
+        self._team(box, offense, play.team_name, season)
+        defense = box.opponent(offense)
+        if defense:
+            self._team(box, defense, "", season)
+
+        deltas = play_deltas(play, offense, defense)
+        deltas.extend(self._score_deltas(box, play))
+
+        for scope, key, name, amount in deltas:
+            if scope == "team":
+                line = self._team(box, key, "", season)
+                season_line = self._season_team(box.season, key, line.team_name) if season else None
+            else:
+                owner = offense if name in _OFFENSE_FIELDS else (defense or "")
+                line = self._player(box, key, owner, season)
+                season_line = self._season_player(box.season, key, line.team_id) if season else None
+            setattr(line, name, getattr(line, name) + amount)
+            if season_line is not None:
+                setattr(season_line, name, getattr(season_line, name) + amount)
+        return deltas
+
+    def _score_deltas(self, box: GameBoxScore, play: PlayEvent) -> List[Delta]:
+        home_points = play.home_score_after - box.home_score
+        away_points = play.away_score_after - box.away_score
+        box.home_score = play.home_score_after
+        box.away_score = play.away_score_after
+
+        deltas: List[Delta] = []
+        for team_id, opponent_id, points in (
+            (box.home_team_id, box.away_team_id, home_points),
+            (box.away_team_id, box.home_team_id, away_points),
+        ):
+            if points and team_id:
+                deltas.append(("team", team_id, "points", points))
+                if opponent_id:
+                    deltas.append(("team", opponent_id, "points_allowed", points))
+        return deltas
+
+    def _team(self, box: GameBoxScore, team_id: str, team_name: str, season: bool = True) -> TeamLine:
+        line = box.teams.get(team_id)
+        if line is None:
+            line = box.teams[team_id] = TeamLine(team_id=team_id, team_name=team_name, games_played=1)
+            if season:
+                self._season_team(box.season, team_id, team_name).games_played += 1
+        elif team_name and not line.team_name:
+            line.team_name = team_name
+        return line
+
+    def _player(self, box: GameBoxScore, player_id: str, team_id: str, season: bool = True) -> PlayerLine:
+        line = box.players.get(player_id)
+        if line is None:
+            line = box.players[player_id] = PlayerLine(player_id=player_id, team_id=team_id, games_played=1)
+            if season:
+                self._season_player(box.season, player_id, team_id).games_played += 1
+        return line
+
+    def _season_team(self, season: str, team_id: str, team_name: str) -> TeamLine:
+        key = (season, team_id)
+        line = self._season_teams.get(key)
+        if line is None:
+            line = self._season_teams[key] = TeamLine(team_id=team_id, team_name=team_name)
+        elif team_name and not line.team_name:
+            line.team_name = team_name
+        if key not in self._dirty_teams:
+            self._dirty_teams.add(key)
+            self._writer.add(("team", key))
+        return line
+
+    def _season_player(self, season: str, player_id: str, team_id: str) -> PlayerLine:
+        key = (season, player_id)
+        line = self._season_players.get(key)
+        if line is None:
+            line = self._season_players[key] = PlayerLine(player_id=player_id, team_id=team_id)
+        if key not in self._dirty_players:
+            self._dirty_players.add(key)
+            self._writer.add(("player", key))
+        return line
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def game(self, game_id: int) -> Optional[GameBoxScore]:
+        return self._games.get(game_id)
+
+    def team_season(self, team_id: str, season: str = CURRENT_SEASON) -> Optional[TeamLine]:
+        return self._season_teams.get((season, team_id))
+
+    def player_season(self, player_id: str, season: str = CURRENT_SEASON) -> Optional[PlayerLine]:
+        return self._season_players.get((season, player_id))
+
+    def season_players(self, season: str = CURRENT_SEASON) -> List[PlayerLine]:
+        return [line for (line_season, _), line in list(self._season_players.items()) if line_season == season]
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def snapshot_rows(self, batch: List[tuple]) -> Tuple[list, list]:
+        """Current values for the dirty keys in `batch`, ready for upsert."""
+        team_rows, player_rows = [], []
+        with self._lock:
+            for scope, key in batch:
+                if scope == "team":
+                    self._dirty_teams.discard(key)
+                    line = self._season_teams[key]
+                    team_rows.append((key[0], line.team_id, line.team_name, line.games_played)
+                                     + tuple(getattr(line, f) for f in TEAM_STAT_FIELDS))
+                else:
+                    self._dirty_players.discard(key)
+                    line = self._season_players[key]
+                    player_rows.append((key[0], line.player_id, line.team_id, line.games_played)
+                                       + tuple(getattr(line, f) for f in PLAYER_STAT_FIELDS))
+        return team_rows, player_rows
+
+    def warm(self) -> None:
+        """Load persisted season totals so restarts continue from the last flush."""
+        conn = connect()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT * FROM team_season_stats")
+                for row in cursor.fetchall():
+                    line = TeamLine(team_id=row["team_id"], team_name=row["team_name"] or "",
+                                    games_played=row["games_played"],
+                                    **{f: row[f] for f in TEAM_STAT_FIELDS})
+                    self._season_teams[(row["season"], row["team_id"])] = line
+                cursor.execute("SELECT * FROM player_season_stats")
+                for row in cursor.fetchall():
+                    line = PlayerLine(player_id=row["player_id"], team_id=row["team_id"] or "",
+                                      games_played=row["games_played"],
+                                      **{f: row[f] for f in PLAYER_STAT_FIELDS})
+                    self._season_players[(row["season"], row["player_id"])] = line
+        finally:
+            conn.close()
+
+    def start(self) -> None:
+        try:
+            self.warm()
+        except Exception:
+            logger.exception("box scores: warm-up failed, starting with empty season totals")
+        self._writer.start()
+
+    def stop(self) -> None:
+        self._writer.stop()
+
+
+_OFFENSE_FIELDS = {
+    "passing_yards", "passing_completions", "passing_attempts", "passing_tds", "passing_ints",
+    "rushing_yards", "rushing_carries", "rushing_tds",
+    "receptions", "receiving_yards", "receiving_tds",
+}
+
+
+def _season_of(kickoff: Optional[datetime]) -> str:
+    """Seasons start in August, so a January playoff game belongs to the previous year."""
+    if kickoff is None:
+        return CURRENT_SEASON
+    return str(kickoff.year if kickoff.month >= 8 else kickoff.year - 1)
+
+
+def _game_record(game_id: int) -> Optional[Tuple[str, str, str]]:
+    """(home team ID, away team ID, season) from the games table, as the play log's string IDs."""
+    with pooled_cursor() as cursor:
+        cursor.execute("SELECT home_team_id, away_team_id, kickoff_at FROM games WHERE id = %s", (game_id,))
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    return str(row["home_team_id"]), str(row["away_team_id"]), _season_of(row["kickoff_at"])
+
+
+def _persist_season_lines(batch: List[tuple]) -> None:
+    team_rows, player_rows = box_scores.snapshot_rows(batch)
+    with transaction() as cursor:
+        if team_rows:
+            columns = ["season", "team_id", "team_name", "games_played"] + TEAM_STAT_FIELDS
+            execute_values(
+                cursor,
+                f"""
+                INSERT INTO team_season_stats ({", ".join(columns)}) VALUES %s
+                ON CONFLICT (season, team_id) DO UPDATE SET
+                {", ".join(f"{c} = EXCLUDED.{c}" for c in columns[2:])}
+                """,
+                team_rows,
+            )
+        if player_rows:
+            columns = ["season", "player_id", "team_id", "games_played"] + PLAYER_STAT_FIELDS
+            execute_values(
+                cursor,
+                f"""
+                INSERT INTO player_season_stats ({", ".join(columns)}) VALUES %s
+                ON CONFLICT (season, player_id) DO UPDATE SET
+                {", ".join(f"{c} = EXCLUDED.{c}" for c in columns[2:])}
+                """,
+                player_rows,
+            )
+
+
+# Process-wide aggregator fed by the play log
+box_scores = BoxScoreAggregator()
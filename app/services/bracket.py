@@ -0,0 +1,447 @@
+"""
+StatIQ Playoff Brackets
+Playoff brackets as game graphs with automatic winner advancement.
+
+Every game node knows the game its winner plays next and which slot (home
+or away) it fills, and remembers its own feeder games. Recording a final
+walks that chain upward, so advancing a winner (or correcting a score that
+flips one) touches at most one node per remaining round. Each conference
+keeps its serialized JSON response and rebuilds it only after a write.
+
+Conferences are independent: each bracket has its own version counter and
+cached body, so a final in 5A D1 leaves every other conference's cache (and
+the ETags clients already hold for it) intact. At startup every conference
+is loaded from playoff_games in one query.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from app.db import connect, transaction
+
+logger = logging.getLogger(__name__)
+
+# Display order; unknown round names sort after these in first-seen order
+ROUND_ORDER = (
+    "Bi-District", "Area", "Regional Quarterfinal", "Regional Quarterfinals",
+    "Regional", "Regional Semifinal", "Regional Semifinals", "Regional Final", "Regional Finals",
+    "State Semifinal", "State Semifinals", "State Championship", "Championship",
+)
+
+# "Winner of G1 vs Winner of G2", or a placeholder team named "Winner G61"
+FEEDER_PATTERN = re.compile(r"\bWinner\s+(?:of\s+)?(G\d+)\b", re.IGNORECASE)
+
+FINAL = "final"
+
+
+@dataclass(frozen=True)
+class BracketTeam:
+    id: int
+    name: str
+    mascot: str = ""
+    seed: Optional[str] = None
+
+
+TBD = BracketTeam(id=0, name="TBD")
+
+
+@dataclass(eq=False)
+class BracketGame:
+    id: int
+    game_id: str
+    round: str
+    region: int
+    home_team: BracketTeam = TBD
+    away_team: BracketTeam = TBD
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+    status: str = "scheduled"
+    kickoff_at: Optional[str] = None
+    location: str = "TBD"
+    notes: Optional[str] = None
+    broadcaster: Optional[str] = None
+    home_feeder: Optional[str] = None
+    away_feeder: Optional[str] = None
+    # Where this game's winner goes: (next game, "home" | "away")
+    next_game: Optional["BracketGame"] = field(default=None, repr=False)
+    next_slot: Optional[str] = None
+
+    def winner(self) -> Optional[BracketTeam]:
+        if self.status != FINAL or self.home_score is None or self.away_score is None:
+            return None
+        if self.home_score == self.away_score:
+            return None
+        return self.home_team if self.home_score > self.away_score else self.away_team
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "game_id": self.game_id,
+            "region": self.region,
+            "home_team": team_dict(self.home_team),
+            "away_team": team_dict(self.away_team),
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "status": self.status,
+            "kickoff_at": self.kickoff_at,
+            "location": self.location,
+            "notes": self.notes,
+            "broadcaster": self.broadcaster,
+            "home_feeder": self.home_feeder,
+            "away_feeder": self.away_feeder,
+        }
+
+
+@dataclass(frozen=True)
+class BracketSnapshot:
+    """A serialized bracket body with the validators served alongside it."""
+    payload: bytes
+    etag: str
+    version: int
+
+
+class Bracket:
+    """One conference's games, linked feeder -> next game."""
+
+    def __init__(self, conference: str, games: Iterable[BracketGame], version: int = 1):
+        self.conference = conference
+        self.version = version
+        self._lock = threading.Lock()
+        self._games: Dict[str, BracketGame] = {}
+        self._rounds: Dict[str, List[BracketGame]] = {}
+        self._snapshot: Optional[BracketSnapshot] = None
+
+        for game in games:
+            self._games[game.game_id] = game
+            self._rounds.setdefault(game.round, []).append(game)
+        self._rounds = dict(sorted(self._rounds.items(), key=lambda item: _round_rank(item[0])))
+        for round_games in self._rounds.values():
+            round_games.sort(key=lambda game: (_game_number(game.game_id), game.game_id))
+        self._link()
+        # Fill later-round slots from finals already on the books
+        for round_games in self._rounds.values():
+            for game in round_games:
+                if game.winner() is not None:
+                    self._advance(game, None, game.winner())
+
+    def _link(self) -> None:
+        for game in self._games.values():
+            if game.home_feeder is None and game.away_feeder is None:
+                game.home_feeder, game.away_feeder = _parse_feeders(game)
+            for slot, feeder_id in (("home", game.home_feeder), ("away", game.away_feeder)):
+                feeder = self._games.get(feeder_id) if feeder_id else None
+                if feeder is not None:
+                    feeder.next_game, feeder.next_slot = game, slot
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._games
+
+    def games(self) -> List[BracketGame]:
+        return list(self._games.values())
+
+    def game(self, game_id: str) -> Optional[BracketGame]:
+        return self._games.get(game_id)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def record_score(self, game_id: str, home_score: Optional[int], away_score: Optional[int],
+                     status: str = FINAL) -> List[BracketGame]:
+        """
+        Update one game's score and status. A change of winner (a new final,
+        a corrected final, or a final reopened) is carried into every later
+        slot the old winner had reached. Returns the games that changed.
+        """
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None:
+                raise KeyError(game_id)
+            before = game.winner()
+            game.home_score, game.away_score, game.status = home_score, away_score, status
+            changed = [game] + self._advance(game, before, game.winner())
+            self.version += 1
+            self._snapshot = None
+            return changed
+
+    def _advance(self, game: BracketGame, old: Optional[BracketTeam],
+                 new: Optional[BracketTeam]) -> List[BracketGame]:
+        """Replace `old` with `new` up the winner chain: O(rounds remaining)."""
+        changed = []
+        new = new or TBD
+        while game.next_game is not None and old != new:
+            parent, slot = game.next_game, game.next_slot
+            current = getattr(parent, f"{slot}_team")
+            if current == new:
+                break
+            if old is not None and current not in (old, TBD):
+                break  # Slot was set by hand to someone else; leave it
+            parent_winner = parent.winner()
+            setattr(parent, f"{slot}_team", new)
+            changed.append(parent)
+            if parent_winner is None or parent_winner != old:
+                break
+            # The replaced team had won the next game too, so that result moves up as well
+            game = parent
+        return changed
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> BracketSnapshot:
+        """The serialized bracket response, rebuilt only after a write."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = _snapshot(self.as_dict(), self.version)
+                snapshot = self._snapshot
+        return snapshot
+
+    def payload(self) -> bytes:
+        return self.snapshot().payload
+
+    def view(self) -> Tuple[int, List[Tuple[str, List[BracketGame]]]]:
+        """(version, [(round, games)]) with the games copied, consistent with each other."""
+        with self._lock:
+            return self.version, [
+                (name, [replace(game, next_game=None) for game in games])
+                for name, games in self._rounds.items()
+            ]
+
+    def as_dict(self) -> dict:
+        return {
+            "conference": self.conference,
+            "rounds": [
+                {"round": name, "games": [game.as_dict() for game in games]}
+                for name, games in self._rounds.items()
+            ],
+        }
+
+
+# Called after a write with the bracket and the games it changed; None means
+# the whole bracket was (re)loaded
+BracketListener = Callable[[Bracket, Optional[List[BracketGame]]], None]
+
+
+class BracketStore:
+    """Brackets by conference, plus a lookup from game row id to conference."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._brackets: Dict[str, Bracket] = {}
+        self._by_id: Dict[int, Tuple[str, str]] = {}
+        self._listeners: List[BracketListener] = []
+
+    def subscribe(self, listener: BracketListener) -> None:
+        self._listeners.append(listener)
+
+    def _notify(self, bracket: Bracket, changed: Optional[List[BracketGame]]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(bracket, changed)
+            except Exception:
+                logger.exception("brackets: listener failed on %s", bracket.conference)
+
+    def load(self, conference: str, games: Iterable[BracketGame]) -> Bracket:
+        """Replace a conference's bracket; its version keeps counting up."""
+        key = conference_key(conference)
+        with self._lock:
+            old = self._brackets.get(key)
+            bracket = Bracket(key, games, version=old.version + 1 if old is not None else 1)
+            if old is not None:
+                for game in old.games():
+                    self._by_id.pop(game.id, None)
+            self._brackets[key] = bracket
+            for game in bracket.games():
+                self._by_id[game.id] = (key, game.game_id)
+        self._notify(bracket, None)
+        return bracket
+
+    def get(self, conference: str) -> Optional[Bracket]:
+        return self._brackets.get(conference_key(conference))
+
+    def locate(self, game_row_id: int) -> Optional[Tuple[Bracket, str]]:
+        """(bracket, game_id) for a playoff game's row id."""
+        found = self._by_id.get(game_row_id)
+        if found is None:
+            return None
+        return self._brackets[found[0]], found[1]
+
+    def conferences(self) -> List[str]:
+        return sorted(self._brackets)
+
+    def snapshot(self, conference: str) -> BracketSnapshot:
+        """A conference's cached response; conferences without a bracket get empty rounds (version 0)."""
+        bracket = self.get(conference)
+        if bracket is None:
+            return _snapshot({"conference": conference_key(conference), "rounds": []}, 0)
+        return bracket.snapshot()
+
+    def payload(self, conference: str) -> bytes:
+        return self.snapshot(conference).payload
+
+    # -------------------------------------------------------------------------
+    # Postgres
+    # -------------------------------------------------------------------------
+
+    def warm(self) -> int:
+        """
+        Load every conference from playoff_games in one query. Brackets
+        already in memory stay as they are if the database is unreachable.
+        Returns the number of conferences loaded.
+        """
+        try:
+            conn = connect()
+        except Exception:
+            logger.exception("brackets: could not load playoff_games")
+            return 0
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT {', '.join(GAME_COLUMNS)} FROM playoff_games")
+                rows = cursor.fetchall()
+        except Exception:
+            logger.exception("brackets: could not load playoff_games")
+            return 0
+        finally:
+            conn.close()
+
+        by_conference: Dict[str, List[BracketGame]] = defaultdict(list)
+        for row in rows:
+            by_conference[conference_key(row["conference"])].append(game_from_row(row))
+        for conference, games in by_conference.items():
+            self.load(conference, games)
+        logger.info("brackets: loaded %d games across %d conferences", len(rows), len(by_conference))
+        return len(by_conference)
+
+    def record_score(self, game_row_id: int, home_score: Optional[int], away_score: Optional[int],
+                     status: str = FINAL) -> Optional[List[BracketGame]]:
+        """
+        Score one game by row id and write it, plus any slots its winner
+        moved into, back to playoff_games. Only that game's conference is
+        invalidated. Returns the changed games, or None for an unknown id.
+        """
+        found = self.locate(game_row_id)
+        if found is None:
+            return None
+        bracket, game_id = found
+        changed = bracket.record_score(game_id, home_score, away_score, status)
+        self._notify(bracket, changed)
+        try:
+            _persist_games(changed)
+        except Exception:
+            logger.exception("brackets: could not save playoff game %s", game_row_id)
+        return changed
+
+
+# playoff_games columns read by warm(), in table order
+GAME_COLUMNS = (
+    "id", "conference", "game_id", "round", "region",
+    "home_team_id", "home_team_name", "home_team_mascot", "home_seed",
+    "away_team_id", "away_team_name", "away_team_mascot", "away_seed",
+    "home_feeder", "away_feeder",
+    "home_score", "away_score", "status", "kickoff_at", "location", "notes", "broadcaster",
+)
+
+
+def game_from_row(row: dict) -> BracketGame:
+    kickoff_at = row["kickoff_at"]
+    return BracketGame(
+        id=row["id"], game_id=row["game_id"], round=row["round"], region=row["region"] or 0,
+        home_team=team(row["home_team_id"] or 0, row["home_team_name"] or "TBD",
+                       row["home_team_mascot"] or "", row["home_seed"]),
+        away_team=team(row["away_team_id"] or 0, row["away_team_name"] or "TBD",
+                       row["away_team_mascot"] or "", row["away_seed"]),
+        home_score=row["home_score"], away_score=row["away_score"], status=row["status"],
+        kickoff_at=kickoff_at.isoformat() if hasattr(kickoff_at, "isoformat") else kickoff_at,
+        location=row["location"] or "TBD", notes=row["notes"], broadcaster=row["broadcaster"],
+        home_feeder=row["home_feeder"], away_feeder=row["away_feeder"],
+    )
+
+
+def _persist_games(games: List[BracketGame]) -> None:
+    """Write scores, status and (advanced) team slots for a set of games in one statement."""
+    rows = [(game.id, game.home_score, game.away_score, game.status)
+            + team_columns(game.home_team) + team_columns(game.away_team) for game in games]
+    with transaction() as cursor:
+        execute_values(
+            cursor,
+            """
+            UPDATE playoff_games p SET
+                home_score = v.home_score, away_score = v.away_score, status = v.status,
+                home_team_id = v.home_team_id, home_team_name = v.home_team_name,
+                home_team_mascot = v.home_team_mascot, home_seed = v.home_seed,
+                away_team_id = v.away_team_id, away_team_name = v.away_team_name,
+                away_team_mascot = v.away_team_mascot, away_seed = v.away_seed,
+                updated_at = CURRENT_TIMESTAMP
+            FROM (VALUES %s) AS v(id, home_score, away_score, status,
+                                  home_team_id, home_team_name, home_team_mascot, home_seed,
+                                  away_team_id, away_team_name, away_team_mascot, away_seed)
+            WHERE p.id = v.id
+            """,
+            rows,
+            template="(%s, %s::int, %s::int, %s, %s::int, %s, %s, %s, %s::int, %s, %s, %s)",
+        )
+
+
+def team_columns(team: BracketTeam) -> tuple:
+    """(team_id, team_name, team_mascot, seed) as stored in playoff_games; TBD is all NULL."""
+    if team is TBD:
+        return (None, None, None, None)
+    return (team.id or None, team.name, team.mascot or None, team.seed)
+
+
+def conference_key(conference: str) -> str:
+    """'5a-d1', '5A D1' and '5A-D1' all name the '5A D1' bracket."""
+    return " ".join(conference.replace("-", " ").upper().split())
+
+
+def _snapshot(body: dict, version: int) -> BracketSnapshot:
+    payload = json.dumps(body, separators=(",", ":")).encode()
+    # Content-derived so every API worker (and a restarted one) agrees on it
+    etag = '"%s"' % hashlib.blake2b(payload, digest_size=12).hexdigest()
+    return BracketSnapshot(payload, etag, version)
+
+
+def _parse_feeders(game: BracketGame) -> Tuple[Optional[str], Optional[str]]:
+    """Feeder game ids from placeholder team names, else from the notes."""
+    home = FEEDER_PATTERN.search(game.home_team.name)
+    away = FEEDER_PATTERN.search(game.away_team.name)
+    if home or away:
+        return (home.group(1).upper() if home else None, away.group(1).upper() if away else None)
+    found = [match.upper() for match in FEEDER_PATTERN.findall(game.notes or "")]
+    return (found[0] if found else None, found[1] if len(found) > 1 else None)
+
+
+def team_dict(team: BracketTeam) -> dict:
+    """A team as it appears in bracket responses."""
+    return {"id": team.id, "name": team.name, "mascot": team.mascot, "seed": team.seed}
+
+
+def _round_rank(name: str) -> int:
+    return ROUND_ORDER.index(name) if name in ROUND_ORDER else len(ROUND_ORDER)
+
+
+def _game_number(game_id: str) -> int:
+    digits = "".join(ch for ch in game_id if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def team(id: int, name: str, mascot: str = "", seed: Optional[str] = None) -> BracketTeam:
+    """A bracket team, or the shared TBD placeholder for unfilled slots."""
+    if not id and name == "TBD":
+        return TBD
+    return BracketTeam(id, name, mascot, seed)
+
+
+# Process-wide brackets shared by the playoff bracket routes
+brackets = BracketStore()
@@ -0,0 +1,173 @@
+"""
+StatIQ Bracket Loader
+Reads bracket JSON files (the bracket_output.json format) into bracket games
+and bulk-upserts them into playoff_games.
+
+Files are parsed here, once, by the CLI or at startup; the API serves the
+in-memory brackets and never touches JSON on a request. Every conference in
+a run is written in one transaction with multi-row INSERT ... ON CONFLICT
+statements. Re-running a load never undoes what happened since: a file's
+empty scores, "scheduled" status and "Winner G61" placeholders do not
+overwrite recorded finals or winners that have already advanced.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from app.db import transaction
+from app.services.bracket import (
+    FEEDER_PATTERN, GAME_COLUMNS, TBD, BracketGame, BracketStore, BracketTeam, conference_key, team,
+    team_columns,
+)
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BRACKET_FILES = [ROOT / "bracket_output.json"]
+
+# Bi-district notes carry the seeds: "W1El Dorado * F2Amarillo"
+SEED_NOTES = re.compile(r"^([A-Z]\d+)(.+?)\s*\*\s*([A-Z]\d+)(.+)$")
+
+PAGE_SIZE = 1000
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def parse_bracket(data: dict) -> Tuple[str, List[BracketGame]]:
+    """One bracket document -> (conference key, games)."""
+    conference = conference_key(data["conference"])
+    games = []
+    for round_data in data.get("rounds", []):
+        for game in round_data.get("games", []):
+            home_seed, away_seed = _note_seeds(game.get("notes"))
+            games.append(BracketGame(
+                id=int(game["id"]),
+                game_id=game["game_id"],
+                round=round_data["round"],
+                region=int(game.get("region") or 0),
+                home_team=_team(game.get("home_team"), home_seed),
+                away_team=_team(game.get("away_team"), away_seed),
+                home_score=game.get("home_score"),
+                away_score=game.get("away_score"),
+                status=game.get("status") or "scheduled",
+                kickoff_at=game.get("kickoff_at"),
+                location=game.get("location") or "TBD",
+                notes=game.get("notes"),
+                broadcaster=game.get("broadcaster"),
+                home_feeder=game.get("home_feeder"),
+                away_feeder=game.get("away_feeder"),
+            ))
+    return conference, games
+
+
+def read_bracket_files(paths: Iterable[Path]) -> Dict[str, List[BracketGame]]:
+    """
+    Parse bracket files (a directory means every *.json in it). A file holds
+    one bracket or a list of them; a conference seen twice keeps the last.
+    """
+    by_conference: Dict[str, List[BracketGame]] = {}
+    for path in _expand(paths):
+        data = json.loads(path.read_text())
+        for document in data if isinstance(data, list) else [data]:
+            conference, games = parse_bracket(document)
+            by_conference[conference] = games
+    return by_conference
+
+
+def _expand(paths: Iterable[Path]) -> List[Path]:
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.glob("*.json")) if path.is_dir() else [path])
+    return files
+
+
+def _team(data: Optional[dict], seed: Optional[str]) -> BracketTeam:
+    if not data or not data.get("name"):
+        return TBD
+    name = data["name"]
+    # Placeholder slots carry arbitrary ids in the export; they are not teams
+    if name == "TBD" or FEEDER_PATTERN.search(name):
+        return team(0, name)
+    return team(int(data.get("id") or 0), name, data.get("mascot") or "", data.get("seed") or seed)
+
+
+def _note_seeds(notes: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    match = SEED_NOTES.match(notes or "")
+    return (match.group(1), match.group(3)) if match else (None, None)
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def load_bracket_files(store: BracketStore, paths: Iterable[Path] = DEFAULT_BRACKET_FILES) -> int:
+    """Load bracket files straight into memory (no database). Returns conferences loaded."""
+    try:
+        by_conference = read_bracket_files(paths)
+    except (OSError, ValueError, KeyError):
+        logger.exception("brackets: could not read bracket files")
+        return 0
+    for conference, games in by_conference.items():
+        store.load(conference, games)
+    return len(by_conference)
+
+
+def _row(conference: str, game: BracketGame) -> tuple:
+    return (
+        (game.id, conference, game.game_id, game.round, game.region)
+        + team_columns(game.home_team) + team_columns(game.away_team)
+        + (game.home_feeder, game.away_feeder,
+           game.home_score, game.away_score, game.status, game.kickoff_at, game.location,
+           game.notes, game.broadcaster)
+    )
+
+
+# Slot columns keep the stored team when the file only has a placeholder there
+_SLOT_UPDATES = ",\n    ".join(
+    f"{column} = CASE WHEN EXCLUDED.{side}_team_id IS NULL AND playoff_games.{side}_team_id IS NOT NULL "
+    f"THEN playoff_games.{column} ELSE EXCLUDED.{column} END"
+    for side in ("home", "away")
+    for column in (f"{side}_team_id", f"{side}_team_name", f"{side}_team_mascot", f"{side}_seed")
+)
+
+UPSERT_SQL = f"""
+INSERT INTO playoff_games ({", ".join(GAME_COLUMNS)})
+VALUES %s
+ON CONFLICT (id) DO UPDATE SET
+    conference = EXCLUDED.conference,
+    game_id = EXCLUDED.game_id,
+    round = EXCLUDED.round,
+    region = EXCLUDED.region,
+    {_SLOT_UPDATES},
+    home_feeder = EXCLUDED.home_feeder,
+    away_feeder = EXCLUDED.away_feeder,
+    home_score = COALESCE(EXCLUDED.home_score, playoff_games.home_score),
+    away_score = COALESCE(EXCLUDED.away_score, playoff_games.away_score),
+    status = CASE WHEN EXCLUDED.status = 'scheduled' THEN playoff_games.status ELSE EXCLUDED.status END,
+    kickoff_at = EXCLUDED.kickoff_at,
+    location = EXCLUDED.location,
+    notes = EXCLUDED.notes,
+    broadcaster = EXCLUDED.broadcaster,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def upsert_brackets(by_conference: Dict[str, List[BracketGame]]) -> int:
+    """Write every conference's games in one transaction. Returns rows written."""
+    rows = [_row(conference, game) for conference, games in by_conference.items() for game in games]
+    if not rows:
+        return 0
+    with transaction() as cursor:
+        execute_values(
+            cursor, UPSERT_SQL, rows, page_size=PAGE_SIZE,
+            template="(" + ", ".join("%s::timestamp" if column == "kickoff_at" else "%s"
+                                     for column in GAME_COLUMNS) + ")",
+        )
+    return len(rows)
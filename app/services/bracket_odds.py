@@ -0,0 +1,280 @@
+"""
+StatIQ Bracket Odds
+Monte Carlo advancement odds: each team's chance of reaching every round
+of its playoff bracket, and of winning it all.
+
+A bracket is compiled once into flat arrays (feeder index or fixed team
+per slot, a win probability per game) and every simulated pass runs at
+once: one vectorized draw per game, walking the games in round order, so
+the Python loop is ~63 iterations no matter how many passes. Finals are
+certain, live games use the live win probability, and everything else is
+priced from team ratings (even odds until ratings are set).
+
+Requested run sizes are rounded up to a few fixed counts and results are
+cached per (conference, count) until the bracket version moves, so repeated
+reads between score updates are free and a client cannot force a fresh
+simulation by varying the count. Concurrent misses for the same
+conference and count wait for one simulation instead of each running
+their own. Large runs can be split across a long-lived worker pool
+started with the app.
+"""
+
+import math
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.bracket import TBD, Bracket, BracketTeam, team_dict
+from app.services.win_probability import live_win_probability
+
+DEFAULT_SIMULATIONS = 10_000
+MAX_SIMULATIONS = 1_000_000
+PUBLIC_MAX_SIMULATIONS = 100_000    # Largest run the unauthenticated odds route asks for
+SIMULATION_COUNTS = (1_000, DEFAULT_SIMULATIONS, PUBLIC_MAX_SIMULATIONS, MAX_SIMULATIONS)   # Run sizes actually served
+CHUNK_SIMULATIONS = 100_000   # Passes per vectorized batch; bounds the (games x passes) array
+POINTS_PER_LOGIT = 7.0        # A one-touchdown rating edge is ~73% to win
+CHAMPION = "Champion"
+
+
+@dataclass
+class SimulationPlan:
+    """A bracket flattened for simulation. Team index 0 is an unknown/TBD team."""
+    rounds: List[str]
+    teams: List[BracketTeam]        # index i + 1 -> team
+    game_round: np.ndarray          # (games,) round index, games in play order
+    home_feeder: np.ndarray         # (games,) game index whose winner is home, or -1
+    away_feeder: np.ndarray
+    home_team: np.ndarray           # (games,) fixed team index where there is no feeder
+    away_team: np.ndarray
+    home_prob: np.ndarray           # (games,) P(home wins), NaN = price from ratings
+    ratings: np.ndarray             # (teams + 1,) rating points
+    champion_games: List[int]
+
+
+@dataclass
+class BracketOdds:
+    conference: str
+    version: int
+    simulations: int
+    rounds: List[str]               # bracket rounds, then CHAMPION
+    teams: List[Tuple[BracketTeam, List[float]]]  # (team, probability per round), best first
+
+    def as_dict(self) -> dict:
+        return {
+            "conference": self.conference,
+            "version": self.version,
+            "simulations": self.simulations,
+            "rounds": self.rounds,
+            "teams": [
+                {
+                    "team": team_dict(team),
+                    "odds": {name: round(pct * 100, 1) for name, pct in zip(self.rounds, odds)},
+                }
+                for team, odds in self.teams
+            ],
+        }
+
+
+# =============================================================================
+# PLAN
+# =============================================================================
+
+def compile_plan(bracket: Bracket, ratings: Dict[int, float]) -> Tuple[int, SimulationPlan]:
+    """(bracket version, plan) from a consistent view of the bracket."""
+    version, rounds = bracket.view()
+    games = [game for _, round_games in rounds for game in round_games]
+    index = {game.game_id: i for i, game in enumerate(games)}
+    round_of = {name: r for r, (name, _) in enumerate(rounds)}
+
+    teams: List[BracketTeam] = []
+    team_index: Dict[BracketTeam, int] = {}
+
+    def slot(team: BracketTeam) -> int:
+        if team is TBD or not team.id:
+            return 0
+        if team not in team_index:
+            teams.append(team)
+            team_index[team] = len(teams)
+        return team_index[team]
+
+    n = len(games)
+    plan = SimulationPlan(
+        rounds=[name for name, _ in rounds],
+        teams=teams,
+        game_round=np.array([round_of[game.round] for game in games], dtype=np.int32),
+        home_feeder=np.full(n, -1, dtype=np.int32),
+        away_feeder=np.full(n, -1, dtype=np.int32),
+        home_team=np.zeros(n, dtype=np.int32),
+        away_team=np.zeros(n, dtype=np.int32),
+        home_prob=np.full(n, np.nan),
+        ratings=np.zeros(0),
+        champion_games=[],
+    )
+    last_round = len(rounds) - 1
+    for i, game in enumerate(games):
+        # A feeder still in this bracket decides the slot; a final feeder just decides it every time
+        for feeders, fixed, feeder_id, team in ((plan.home_feeder, plan.home_team, game.home_feeder, game.home_team),
+                                                (plan.away_feeder, plan.away_team, game.away_feeder, game.away_team)):
+            if feeder_id in index and index[feeder_id] < i:
+                feeders[i] = index[feeder_id]
+            else:
+                fixed[i] = slot(team)
+        winner = game.winner()
+        if winner is not None:
+            plan.home_prob[i] = 1.0 if winner == game.home_team else 0.0
+        elif game.status == "live":
+            live = live_win_probability.get(game.id)
+            if live is not None:
+                plan.home_prob[i] = live.home_win_probability / 100.0
+        if plan.game_round[i] == last_round:
+            plan.champion_games.append(i)
+
+    plan.ratings = np.array([0.0] + [ratings.get(team.id, 0.0) for team in teams])
+    return version, plan
+
+
+def _live_key(bracket: Bracket) -> tuple:
+    """Live win probabilities move without a bracket write, so they are part of the cache key."""
+    key = []
+    for game in bracket.games():
+        if game.status == "live":
+            live = live_win_probability.get(game.id)
+            key.append((game.id, live.home_win_probability if live else None))
+    return tuple(sorted(key))
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+def run_passes(plan: SimulationPlan, simulations: int, seed) -> np.ndarray:
+    """
+    Simulate `simulations` passes. Returns counts[round, team]: passes in
+    which the team played in that round (the last row: won the final).
+    """
+    rng = np.random.default_rng(seed)
+    team_count = len(plan.teams) + 1
+    counts = np.zeros((len(plan.rounds) + 1, team_count), dtype=np.int64)
+    winners = np.empty((len(plan.game_round), simulations), dtype=np.int32)
+
+    for g in range(len(plan.game_round)):
+        home = winners[plan.home_feeder[g]] if plan.home_feeder[g] >= 0 else plan.home_team[g]
+        away = winners[plan.away_feeder[g]] if plan.away_feeder[g] >= 0 else plan.away_team[g]
+        p = plan.home_prob[g]
+        if math.isnan(p):
+            edge = plan.ratings[home] - plan.ratings[away]
+            p = 1.0 / (1.0 + np.exp(-edge / POINTS_PER_LOGIT))
+        winners[g] = np.where(rng.random(simulations) < p, home, away)
+
+        row = counts[plan.game_round[g]]
+        for side in (home, away):
+            if np.ndim(side):
+                row += np.bincount(side, minlength=team_count)
+            else:
+                row[side] += simulations
+    for g in plan.champion_games:
+        counts[-1] += np.bincount(winners[g], minlength=team_count)
+    return counts
+
+
+def worker_pool(processes: int) -> ProcessPoolExecutor:
+    # spawn, not fork: the API process is threaded
+    return ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn"))
+
+
+def simulation_count(requested: int) -> int:
+    """The smallest served run size covering `requested`."""
+    return next((count for count in SIMULATION_COUNTS if count >= requested), MAX_SIMULATIONS)
+
+
+def simulate(plan: SimulationPlan, simulations: int, pool: Optional[Executor] = None,
+             seed: Optional[int] = None) -> np.ndarray:
+    """
+    Counts summed over CHUNK_SIMULATIONS-pass batches, each with its own
+    random stream. With a pool (see worker_pool) the batches run in it.
+    """
+    sizes = [CHUNK_SIMULATIONS] * (simulations // CHUNK_SIMULATIONS)
+    if simulations % CHUNK_SIMULATIONS:
+        sizes.append(simulations % CHUNK_SIMULATIONS)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if pool is not None and len(sizes) > 1:
+        return sum(pool.map(run_passes, [plan] * len(sizes), sizes, seeds))
+    return sum(run_passes(plan, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds))
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class BracketOddsEngine:
+    """Simulated odds per conference, cached until the bracket, ratings or live odds change."""
+
+    def __init__(self, processes: int = 1):
+        self.processes = processes
+        self._lock = threading.Lock()
+        self._ratings: Dict[int, float] = {}
+        self._ratings_version = 0
+        self._cache: Dict[Tuple[str, int], Tuple[tuple, BracketOdds]] = {}
+        self._slot_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Start the worker pool, if configured for more than one process, so requests never spawn it."""
+        if self.processes > 1 and self._pool is None:
+            self._pool = worker_pool(self.processes)
+            for _ in range(self.processes):
+                self._pool.submit(int)  # Spawn the workers now rather than on the first large run
+
+    def stop(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def set_ratings(self, ratings: Dict[int, float]) -> None:
+        """Team id -> rating in points (a power rating's margin scale)."""
+        with self._lock:
+            self._ratings = dict(ratings)
+            self._ratings_version += 1
+
+    def odds(self, bracket: Bracket, simulations: int = DEFAULT_SIMULATIONS) -> BracketOdds:
+        """Odds from `simulations` passes, rounded up to the next of SIMULATION_COUNTS."""
+        simulations = simulation_count(simulations)
+        slot = (bracket.conference, simulations)
+        with self._lock:
+            slot_lock = self._slot_locks.setdefault(slot, threading.Lock())
+        # One caller per slot simulates; the rest wait and take its result
+        with slot_lock:
+            with self._lock:
+                ratings, ratings_version = self._ratings, self._ratings_version
+            key = (bracket.version, ratings_version, _live_key(bracket))
+            cached = self._cache.get(slot)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            return self._simulate(bracket, simulations, slot, key, ratings)
+
+    def _simulate(self, bracket: Bracket, simulations: int, slot: Tuple[str, int], key: tuple,
+                  ratings: Dict[int, float]) -> BracketOdds:
+        version, plan = compile_plan(bracket, ratings)
+        counts = simulate(plan, simulations, pool=self._pool)
+        probabilities = counts[:, 1:].T / simulations  # (teams, rounds + 1)
+        order = sorted(range(len(plan.teams)), key=lambda t: tuple(-probabilities[t][::-1]))
+        result = BracketOdds(
+            conference=bracket.conference,
+            version=version,
+            simulations=simulations,
+            rounds=plan.rounds + [CHAMPION],
+            teams=[(plan.teams[t], [float(p) for p in probabilities[t]]) for t in order],
+        )
+        # Keyed on the version the plan was built from, in case a write landed in between
+        self._cache[slot] = ((version,) + key[1:], result)
+        return result
+
+
+# Process-wide engine shared by the playoff bracket routes
+bracket_odds = BracketOddsEngine(processes=int(os.getenv("BRACKET_SIM_PROCESSES", "1")))
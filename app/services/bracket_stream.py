@@ -0,0 +1,172 @@
+"""
+StatIQ Bracket Stream
+Per-conference feed of changed bracket games for live bracket screens.
+
+Every bracket write becomes one event carrying only the games it touched
+(the scored game plus any slots its winner moved into), numbered with a
+per-conference sequence. The last MAX_EVENTS events stay in a ring buffer,
+so a client that reconnects with the last seq it saw gets exactly what it
+missed. A client too far behind, or a bracket that was reloaded, gets a
+"reset" event telling it to refetch the full bracket instead.
+
+Writes happen on worker threads; SSE responses are async generators on
+the event loop. Publishing wakes each waiting stream through its own loop.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from app.services.bracket import Bracket, BracketGame, brackets, conference_key, team_dict
+
+MAX_EVENTS = 256
+HEARTBEAT_SECONDS = 15.0
+
+GAMES = "games"
+RESET = "reset"
+
+
+@dataclass(frozen=True)
+class BracketEvent:
+    seq: int
+    kind: str                 # GAMES | RESET
+    version: int              # bracket version after the write
+    data: str                 # serialized once, sent to every subscriber
+
+    def sse(self) -> str:
+        return f"id: {self.seq}\nevent: {self.kind}\ndata: {self.data}\n\n"
+
+
+def game_node(game: BracketGame) -> dict:
+    """The parts of a game a bracket screen redraws."""
+    return {
+        "id": game.id,
+        "game_id": game.game_id,
+        "home_team": team_dict(game.home_team),
+        "away_team": team_dict(game.away_team),
+        "home_score": game.home_score,
+        "away_score": game.away_score,
+        "status": game.status,
+    }
+
+
+class _Channel:
+    __slots__ = ("lock", "seq", "events", "waiters")
+
+    def __init__(self, capacity: int):
+        self.lock = threading.Lock()
+        self.seq = 0
+        self.events: Deque[BracketEvent] = deque(maxlen=capacity)
+        self.waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+
+class BracketFeed:
+    """Change events per conference, fed by the bracket store's listener hook."""
+
+    def __init__(self, capacity: int = MAX_EVENTS):
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._channels: Dict[str, _Channel] = {}
+
+    def _channel(self, conference: str) -> _Channel:
+        """The conference's channel; raises KeyError for a conference with no bracket."""
+        key = conference_key(conference)
+        channel = self._channels.get(key)
+        if channel is None:
+            if brackets.get(key) is None:
+                raise KeyError(key)  # Don't keep a channel for every string a client sends
+            with self._lock:
+                channel = self._channels.setdefault(key, _Channel(self._capacity))
+        return channel
+
+    # -------------------------------------------------------------------------
+    # Publishing
+    # -------------------------------------------------------------------------
+
+    def publish(self, bracket: Bracket, changed: Optional[List[BracketGame]]) -> None:
+        """bracket_store listener: one event per write, RESET for a reload."""
+        channel = self._channel(bracket.conference)
+        with channel.lock:
+            channel.seq += 1
+            body = {"seq": channel.seq, "conference": bracket.conference, "version": bracket.version}
+            if changed is None:
+                kind = RESET
+            else:
+                kind = GAMES
+                # A game can be touched twice in one write (scored, then a slot refilled); send it once
+                body["games"] = [game_node(game) for game in {id(game): game for game in changed}.values()]
+            channel.events.append(BracketEvent(channel.seq, kind, bracket.version,
+                                               json.dumps(body, separators=(",", ":"))))
+            waiters = list(channel.waiters)
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def last_seq(self, conference: str) -> int:
+        return self._channel(conference).seq
+
+    def after(self, conference: str, seq: int) -> Optional[List[BracketEvent]]:
+        """Events with seq > `seq`, or None if some of them are no longer buffered."""
+        channel = self._channel(conference)
+        with channel.lock:
+            if seq >= channel.seq:
+                return [] if seq == channel.seq else None  # Ahead of us: from before a restart
+            oldest = channel.events[0].seq if channel.events else channel.seq + 1
+            if seq + 1 < oldest:
+                return None
+            return [event for event in channel.events if event.seq > seq]
+
+    async def wait(self, conference: str, seq: int, timeout: float) -> bool:
+        """Wait until there is an event after `seq`; False on timeout."""
+        channel = self._channel(conference)
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with channel.lock:
+            if channel.seq > seq:
+                return True
+            channel.waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with channel.lock:
+                channel.waiters.discard(waiter)
+
+    async def stream(self, conference: str, since: Optional[int],
+                     disconnected=None) -> AsyncIterator[str]:
+        """
+        SSE text for one subscriber: a "ready" event with the current seq,
+        then everything after `since` (or after now if not given), then live
+        events, with comment heartbeats so proxies keep the connection open.
+        """
+        key = conference_key(conference)
+        seq = self.last_seq(key) if since is None else since
+        yield f"event: ready\ndata: {json.dumps({'conference': key, 'seq': self.last_seq(key)})}\n\n"
+        while True:
+            events = self.after(key, seq)
+            if events is None:
+                # Missed more than we keep: start the client over from a full fetch
+                seq = self.last_seq(key)
+                yield (f"id: {seq}\nevent: {RESET}\n"
+                       f"data: {json.dumps({'conference': key, 'seq': seq})}\n\n")
+                continue
+            for event in events:
+                yield event.sse()
+                seq = event.seq
+            if events:
+                continue
+            if not await self.wait(key, seq, HEARTBEAT_SECONDS):
+                if disconnected is not None and await disconnected():
+                    return
+                yield ": keep-alive\n\n"
+
+
+# Process-wide feed shared by the playoff bracket routes
+bracket_feed = BracketFeed()
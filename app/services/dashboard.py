@@ -0,0 +1,498 @@
+"""
+StatIQ Coach Dashboard
+Precomputed, serialized dashboard payloads per team.
+
+A dashboard is seven independent sections (team, last game, upcoming game,
+availability, key performers, team stats, coach notes), each with its own
+query. Rather than run all of them on every dashboard load, the full payload
+is rebuilt in the background whenever one of its inputs changes (a game
+final, an availability change, a new note) and stored as JSON bytes, so a
+load is one dict read. A team's first load builds it inline.
+
+Payloads also expire on a TTL from the game-day schedule: short for teams
+playing today, whose box score and season lines move with every play, and
+long otherwise. An expired payload keeps being served while a background
+rebuild replaces it, and teams are prefetched ahead of kickoff, so game-day
+readers do not wait on a build.
+
+A build fans the section loaders out concurrently, each on its own worker
+thread and pooled connection, with a per-section timeout. A section that
+times out or fails is filled from the team's last good copy and listed in
+`stale_sections`; such a partial payload is served but not kept, so the
+next load tries again. Every loader's latency is recorded per section.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.db import pooled_cursor, transaction
+from app.schemas.dashboard import (
+    AvailabilityItem, CoachNote, DashboardPayload, KeyPerformer, LastGame, LastGameScore,
+    PlayerAvailability, Team, TeamStats, UpcomingGame,
+)
+from app.services.batch_writer import BatchWriter
+from app.services.box_scores import PlayerLine, box_scores
+from app.services.game_day import game_day, local_today
+
+logger = logging.getLogger(__name__)
+
+KEY_PERFORMER_COUNT = 3
+COACH_NOTE_COUNT = 10
+SECTION_TIMEOUT = float(os.getenv("DASHBOARD_SECTION_TIMEOUT", "2.0"))  # seconds
+LATENCY_SAMPLES = 512         # Recent loads kept per section for percentiles
+SWEEP_INTERVAL = 10 * 60.0    # seconds between drops of idle off-day payloads
+
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+class TeamNotFound(LookupError):
+    pass
+
+
+class DashboardUnavailable(RuntimeError):
+    """The team section could not be loaded and there is no earlier copy to fall back on."""
+
+
+# =============================================================================
+# SECTIONS
+# =============================================================================
+
+def load_team(team_id: str) -> Team:
+    with pooled_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT id, name, mascot, wins, losses
+            FROM teams
+            WHERE id = %s::int
+            """,
+            (team_id,),
+        )
+        row = cursor.fetchone()
+    if row is None:
+        raise TeamNotFound(team_id)
+    return Team(
+        id=str(row["id"]),
+        name=row["name"],
+        mascot=row["mascot"] or "",
+        record=f"{row['wins'] or 0}-{row['losses'] or 0}",
+    )
+
+
+# One team's games with its side and opponent; %(team)s is the team id. The
+# parameter is cast rather than the columns so the team id indexes still apply.
+_TEAM_GAMES = """
+    SELECT g.id, g.kickoff_at, g.home_score, g.away_score, g.status,
+           (g.home_team_id = %(team)s::int) AS is_home,
+           o.name AS opponent, o.mascot AS opponent_mascot
+    FROM games g
+    JOIN teams o ON o.id = CASE WHEN g.home_team_id = %(team)s::int THEN g.away_team_id ELSE g.home_team_id END
+    WHERE (g.home_team_id = %(team)s::int OR g.away_team_id = %(team)s::int)
+"""
+
+
+def _last_final(team_id: str) -> Optional[dict]:
+    with pooled_cursor() as cursor:
+        cursor.execute(
+            _TEAM_GAMES + " AND g.status = 'final' ORDER BY g.kickoff_at DESC LIMIT 1",
+            {"team": team_id},
+        )
+        return cursor.fetchone()
+
+
+def load_last_game(team_id: str) -> Optional[LastGame]:
+    row = _last_final(team_id)
+    if row is None:
+        return None
+    ours, theirs = ((row["home_score"], row["away_score"]) if row["is_home"]
+                    else (row["away_score"], row["home_score"]))
+    return LastGame(
+        date=row["kickoff_at"].date(),
+        opponent=_opponent(row),
+        location="Home" if row["is_home"] else "Away",
+        score=LastGameScore(home=row["home_score"] or 0, away=row["away_score"] or 0),
+        result="W" if ours > theirs else "L" if ours < theirs else "T",
+    )
+
+
+def load_upcoming_game(team_id: str) -> Optional[UpcomingGame]:
+    with pooled_cursor() as cursor:
+        cursor.execute(
+            _TEAM_GAMES + " AND g.status <> 'final' AND g.kickoff_at >= %(today)s"
+                          " ORDER BY g.kickoff_at LIMIT 1",
+            {"team": team_id, "today": local_today()},
+        )
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    return UpcomingGame(
+        date=row["kickoff_at"].date(),
+        opponent=_opponent(row),
+        location="Home" if row["is_home"] else "Away",
+        kickoff_time=row["kickoff_at"],
+    )
+
+
+def load_availability(team_id: str) -> PlayerAvailability:
+    with pooled_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT jersey_number, name, position, status, note
+            FROM player_availability
+            WHERE team_id = %s
+            ORDER BY jersey_number
+            """,
+            (team_id,),
+        )
+        rows = cursor.fetchall()
+    availability = PlayerAvailability()
+    for row in rows:
+        getattr(availability, row["status"]).append(AvailabilityItem(
+            number=row["jersey_number"], name=row["name"], position=row["position"], note=row["note"],
+        ))
+    return availability
+
+
+def load_key_performers(team_id: str) -> List[KeyPerformer]:
+    """The team's top players from its last final's box score (empty if it is not in memory)."""
+    row = _last_final(team_id)
+    box = box_scores.game(row["id"]) if row is not None else None
+    if box is None:
+        return []
+    players = [line for line in box.players.values() if line.team_id == team_id]
+    players.sort(key=_impact, reverse=True)
+    return [
+        KeyPerformer(player_id=line.player_id, name=line.name or "", position=line.position,
+                     statline=_statline(line))
+        for line in players[:KEY_PERFORMER_COUNT] if _impact(line) > 0
+    ]
+
+
+def load_team_stats(team_id: str) -> Optional[TeamStats]:
+    line = box_scores.team_season(team_id)
+    if line is None or not line.games_played:
+        return None
+    margin = line.takeaways - line.turnovers
+    return TeamStats(
+        points_per_game=round(line.points / line.games_played, 1),
+        yards_per_game=round(line.total_yards / line.games_played),
+        turnover_margin=f"{margin:+d}",
+    )
+
+
+def load_coach_notes(team_id: str) -> List[CoachNote]:
+    with pooled_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT id, author, body, created_at
+            FROM coach_notes
+            WHERE team_id = %s
+            ORDER BY created_at DESC
+            LIMIT %s
+            """,
+            (team_id, COACH_NOTE_COUNT),
+        )
+        return [CoachNote(id=str(row["id"]), author=row["author"], body=row["body"],
+                          created_at=row["created_at"]) for row in cursor.fetchall()]
+
+
+# payload field -> loader
+SECTIONS: Dict[str, Callable[[str], object]] = {
+    "team": load_team,
+    "last_game": load_last_game,
+    "upcoming_game": load_upcoming_game,
+    "player_availability": load_availability,
+    "key_performers": load_key_performers,
+    "team_stats": load_team_stats,
+    "coach_notes": load_coach_notes,
+}
+
+
+def _opponent(row: dict) -> str:
+    return " ".join(part for part in (row["opponent"], row["opponent_mascot"]) if part)
+
+
+def _impact(line: PlayerLine) -> float:
+    """Rough yardage-equivalent of a stat line, for picking key performers."""
+    touchdowns = line.passing_tds + line.rushing_tds + line.receiving_tds
+    return (line.passing_yards / 2 + line.rushing_yards + line.receiving_yards + 20 * touchdowns
+            + 5 * line.tackles + 15 * line.sacks + 25 * line.interceptions)
+
+
+def _statline(line: PlayerLine) -> str:
+    parts = []
+    if line.passing_attempts:
+        parts.append(f"{line.passing_completions}/{line.passing_attempts}, {line.passing_yards} yds, "
+                     f"{line.passing_tds} TD, {line.passing_ints} INT")
+    if line.rushing_carries:
+        parts.append(f"{line.rushing_carries} rushes, {line.rushing_yards} yds, {line.rushing_tds} TD")
+    if line.receptions:
+        parts.append(f"{line.receptions} rec, {line.receiving_yards} yds, {line.receiving_tds} TD")
+    if line.tackles or line.sacks or line.interceptions:
+        parts.append(f"{line.tackles} tkl, {line.sacks:g} sacks, {line.interceptions} INT")
+    return "; ".join(parts)
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+@dataclass(frozen=True)
+class SectionResult:
+    name: str
+    outcome: str              # OK | TIMEOUT | ERROR
+    seconds: float
+    value: object = None
+
+
+class SectionLatency:
+    """Rolling per-section load latency, with timeout and error counts."""
+
+    def __init__(self, samples: int = LATENCY_SAMPLES):
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {name: deque(maxlen=samples) for name in SECTIONS}
+        self._outcomes: Dict[str, Counter] = {name: Counter() for name in SECTIONS}
+
+    def record(self, result: SectionResult) -> None:
+        with self._lock:
+            self._samples.setdefault(result.name, deque(maxlen=LATENCY_SAMPLES)).append(result.seconds)
+            self._outcomes.setdefault(result.name, Counter())[result.outcome] += 1
+
+    def summary(self) -> Dict[str, dict]:
+        with self._lock:
+            snapshot = {name: (sorted(samples), dict(self._outcomes[name])) for name, samples in self._samples.items()}
+        return {
+            name: {
+                "loads": sum(outcomes.values()),
+                "timeouts": outcomes.get(TIMEOUT, 0),
+                "errors": outcomes.get(ERROR, 0),
+                "p50_ms": _percentile_ms(samples, 0.50),
+                "p95_ms": _percentile_ms(samples, 0.95),
+                "max_ms": _percentile_ms(samples, 1.0),
+            }
+            for name, (samples, outcomes) in snapshot.items()
+        }
+
+
+def _percentile_ms(ordered: List[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+
+async def load_section(name: str, team_id: str, timeout: float) -> SectionResult:
+    """Run one loader on a worker thread. TeamNotFound propagates; other failures become outcomes."""
+    start = time.perf_counter()
+    try:
+        value = await asyncio.wait_for(asyncio.to_thread(SECTIONS[name], team_id), timeout)
+        return SectionResult(name, OK, time.perf_counter() - start, value)
+    except TeamNotFound:
+        raise
+    except asyncio.TimeoutError:
+        # The thread finishes on its own; its result is dropped
+        logger.warning("dashboards: %s section timed out for team %s after %.1fs", name, team_id, timeout)
+        return SectionResult(name, TIMEOUT, time.perf_counter() - start)
+    except Exception:
+        logger.exception("dashboards: %s section failed for team %s", name, team_id)
+        return SectionResult(name, ERROR, time.perf_counter() - start)
+
+
+class DashboardStore:
+    """
+    team_id -> (day built, expiry, serialized payload). A payload from an
+    earlier day is never served, since is_game_day is baked into it. The last
+    good value of each section is kept separately, as the fallback for a slow
+    or failed loader.
+    """
+
+    def __init__(self, section_timeout: float = SECTION_TIMEOUT):
+        self.section_timeout = section_timeout
+        self.latency = SectionLatency()
+        self._lock = threading.Lock()
+        self._payloads: Dict[str, Tuple[date, float, bytes]] = {}
+        self._sections: Dict[str, Dict[str, object]] = {}
+        self._queued: Set[str] = set()
+        self._swept_at = time.time()
+        self._writer = BatchWriter("dashboards", self._rebuild_batch, batch_size=50, interval=0.5)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def cached(self, team_id: str) -> Optional[bytes]:
+        cached = self._payloads.get(team_id)
+        if cached is None or cached[0] != local_today():
+            return None
+        if time.time() >= cached[1]:
+            self.refresh(team_id)  # Past its TTL: keep serving it until the rebuild lands
+        return cached[2]
+
+    async def get(self, team_id: str) -> bytes:
+        """The team's dashboard JSON. Raises TeamNotFound, or DashboardUnavailable on a cold build."""
+        payload = self.cached(team_id)
+        if payload is None:
+            payload = await self.build(team_id)
+        return payload
+
+    async def build(self, team_id: str) -> bytes:
+        if not team_id.isdigit():
+            raise TeamNotFound(team_id)  # The section queries cast it to an integer id
+        results = await asyncio.gather(*(load_section(name, team_id, self.section_timeout) for name in SECTIONS))
+        for result in results:
+            self.latency.record(result)
+
+        with self._lock:
+            last_good = self._sections.setdefault(team_id, {})
+            sections, stale = {}, []
+            for result in results:
+                if result.outcome == OK:
+                    sections[result.name] = last_good[result.name] = result.value
+                elif result.name in last_good:
+                    sections[result.name] = last_good[result.name]
+                    stale.append(result.name)
+                else:
+                    stale.append(result.name)
+            if "team" not in sections:
+                raise DashboardUnavailable(team_id)
+
+            payload = serialize(assemble(sections, stale))
+            if stale:
+                self._payloads.pop(team_id, None)  # Serve it this once; the next load retries
+            else:
+                self._payloads[team_id] = (local_today(), time.time() + game_day.ttl(team_id), payload)
+        if time.time() - self._swept_at >= SWEEP_INTERVAL:
+            self.sweep()
+        return payload
+
+    def sweep(self) -> int:
+        """Drop payloads from earlier days and expired off-day ones (with their fallbacks). Returns the count."""
+        now, today = time.time(), local_today()
+        with self._lock:
+            idle = [team_id for team_id, (day, expires, _) in self._payloads.items()
+                    if day != today or (expires <= now and not game_day.is_game_day(team_id))]
+            for team_id in idle:
+                del self._payloads[team_id]
+                self._sections.pop(team_id, None)
+            self._swept_at = now
+        return len(idle)
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def refresh(self, team_id: str) -> None:
+        """An input changed: rebuild the team's payload in the background."""
+        with self._lock:
+            if team_id in self._queued:
+                return
+            self._queued.add(team_id)
+        self._writer.add((team_id,))
+
+    def prefetch(self, team_ids: List[str]) -> None:
+        """game_day listener: build the dashboards of teams about to kick off."""
+        for team_id in team_ids:
+            self.refresh(team_id)
+
+    def game_final(self, *team_ids) -> None:
+        """A game ended: last game, key performers and season stats move for both teams."""
+        for team_id in team_ids:
+            if team_id:
+                self.refresh(str(team_id))
+
+    def on_bracket_write(self, bracket, changed) -> None:
+        """bracket_store listener: playoff finals feed the same dashboards as regular-season ones."""
+        for game in changed or ():
+            if game.status == "final":
+                self.game_final(game.home_team.id, game.away_team.id)
+
+    # -------------------------------------------------------------------------
+    # Coach inputs
+    # -------------------------------------------------------------------------
+
+    def set_availability(self, team_id: str, number: int, name: str, position: Optional[str],
+                         status: str, note: Optional[str]) -> None:
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO player_availability (team_id, jersey_number, name, position, status, note)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (team_id, jersey_number) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    position = EXCLUDED.position,
+                    status = EXCLUDED.status,
+                    note = EXCLUDED.note,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (team_id, number, name, position, status, note),
+            )
+        self.refresh(team_id)
+
+    def add_note(self, team_id: str, author: str, body: str) -> CoachNote:
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO coach_notes (team_id, author, body)
+                VALUES (%s, %s, %s)
+                RETURNING id, author, body, created_at
+                """,
+                (team_id, author, body),
+            )
+            row = cursor.fetchone()
+        self.refresh(team_id)
+        return CoachNote(id=str(row["id"]), author=row["author"], body=row["body"], created_at=row["created_at"])
+
+    # -------------------------------------------------------------------------
+    # Rebuilds
+    # -------------------------------------------------------------------------
+
+    def _rebuild_batch(self, batch: List[tuple]) -> None:
+        # Each team once, in order, on one event loop for the whole batch
+        asyncio.run(self._rebuild(list(dict.fromkeys(team_id for team_id, in batch))))
+
+    async def _rebuild(self, team_ids: List[str]) -> None:
+        for team_id in team_ids:
+            with self._lock:
+                self._queued.discard(team_id)
+            try:
+                await self.build(team_id)
+            except TeamNotFound:
+                with self._lock:
+                    self._payloads.pop(team_id, None)
+                    self._sections.pop(team_id, None)
+            except Exception:
+                # Keep serving the previous payload; the next input change retries
+                logger.exception("dashboards: rebuild failed for team %s", team_id)
+
+    def start(self) -> None:
+        self._writer.start()
+
+    def stop(self) -> None:
+        self._writer.stop()
+
+
+def assemble(sections: dict, stale: Sequence[str] = ()) -> DashboardPayload:
+    upcoming = sections.get("upcoming_game")
+    return DashboardPayload(
+        is_game_day=upcoming is not None and upcoming.date == local_today(),
+        stale_sections=list(stale),
+        **{name: value for name, value in sections.items() if value is not None},
+    )
+
+
+def serialize(payload: DashboardPayload) -> bytes:
+    return json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+
+
+# Process-wide store shared by the dashboard routes
+dashboards = DashboardStore()
@@ -0,0 +1,122 @@
+"""
+StatIQ Fuzzy Search
+SymSpell-style deletion dictionary for typo-tolerant lookups.
+
+Every indexed key (whole names and their individual words) is stored under
+all strings reachable by deleting up to MAX_DISTANCE characters from its
+first PREFIX_LENGTH characters. A query generates its own deletes the same
+way, so candidate keys come from a handful of dict lookups; only those are
+checked with a real edit distance. Nothing is compared against every name.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+
+def max_distance_for(query: str) -> int:
+    """Short queries get less slack: 'tx' should not match every two-letter word."""
+    if len(query) < 3:
+        return 0
+    if len(query) < 6:
+        return 1
+    return MAX_DISTANCE
+
+
+def deletes(word: str, distance: int = MAX_DISTANCE) -> Set[str]:
+    """All strings formed by deleting up to `distance` characters from the word's prefix."""
+    word = word[:PREFIX_LENGTH]
+    out = {word}
+    frontier = {word}
+    for _ in range(distance):
+        next_frontier = set()
+        for w in frontier:
+            for i in range(len(w)):
+                next_frontier.add(w[:i] + w[i + 1:])
+        next_frontier -= out
+        out |= next_frontier
+        frontier = next_frontier
+    return out
+
+
+def edit_distance(a: str, b: str, limit: int = MAX_DISTANCE) -> int:
+    """Optimal string alignment distance (adjacent transpositions cost 1), capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if (prev2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+            row_min = min(row_min, cur[j])
+        if row_min > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzyIndex:
+    """
+    Deletion dictionary mapping keys (names, words, synonyms) to search slots.
+
+    Removing a slot only detaches it from its keys; stale delete entries are
+    harmless because candidates are resolved through the key -> slots map.
+    """
+
+    def __init__(self):
+        self._deletes: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, Set[int]] = {}
+
+    def add(self, slot: int, keys: Iterable[str]) -> None:
+        for key in keys:
+            if len(key) < 3:
+                continue
+            slots = self._keys.get(key)
+            if slots is None:
+                slots = self._keys[key] = set()
+                for d in deletes(key):
+                    self._deletes.setdefault(d, set()).add(key)
+            slots.add(slot)
+
+    def remove(self, slot: int, keys: Iterable[str]) -> None:
+        for key in keys:
+            slots = self._keys.get(key)
+            if slots is not None:
+                slots.discard(slot)
+
+    def lookup(self, query: str) -> List[Tuple[int, str, Set[int]]]:
+        """(distance, key, slots) for every key within the allowed edit distance, closest first."""
+        limit = max_distance_for(query)
+        if limit == 0:
+            return []
+
+        keys: Set[str] = set()
+        for d in deletes(query, limit):
+            keys |= self._deletes.get(d, set())
+
+        matches = []
+        for key in keys:
+            slots = self._keys.get(key)
+            if not slots:
+                continue
+            distance = edit_distance(query, key, limit)
+            if distance <= limit:
+                matches.append((distance, key, slots))
+        matches.sort(key=lambda m: (m[0], m[1]))
+        return matches
+
+
+def fuzzy_keys(terms: Iterable[str], synonyms: Iterable[str] = ()) -> Set[str]:
+    """Whole terms, their individual words, and any synonyms."""
+    keys = set()
+    for term in list(terms) + list(synonyms):
+        keys.add(term)
+        keys.update(term.split())
+    return keys
@@ -0,0 +1,179 @@
+"""
+StatIQ Game Day
+Which teams play today, and when, so caches can follow the games.
+
+Today's kickoffs are loaded from the games table at startup, every
+RELOAD_INTERVAL (to pick up reschedules) and again after midnight. Teams
+with a game today get a short cache TTL; everyone else gets a long one, so
+refresh work and memory go to the games people are watching. At kickoff
+minus PREFETCH_LEAD, each subscriber is told which teams are about to
+play so it can warm their caches before the rush.
+
+kickoff_at is stored as Texas wall-clock time (no zone), so "today" and
+"now" are taken in America/Chicago (see local_now) rather than the
+server's zone; on a UTC server, Friday's game day would otherwise end at
+7 pm Central.
+"""
+
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from app.db import pooled_cursor
+
+logger = logging.getLogger(__name__)
+
+GAME_DAY_TTL = 60.0                   # seconds
+OFF_DAY_TTL = 6 * 60 * 60.0
+PREFETCH_LEAD = timedelta(minutes=30)
+RELOAD_INTERVAL = 15 * 60.0
+SCHEDULE_ZONE = ZoneInfo("America/Chicago")
+
+# Called with the team ids whose kickoff is PREFETCH_LEAD away
+PrefetchListener = Callable[[List[str]], None]
+
+
+def local_now() -> datetime:
+    """The current time in SCHEDULE_ZONE, naive like kickoff_at."""
+    return datetime.now(SCHEDULE_ZONE).replace(tzinfo=None)
+
+
+def local_today() -> date:
+    return local_now().date()
+
+
+class GameDaySchedule:
+    """team_id -> today's kickoff, plus a thread that fires prefetches on time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._day: Optional[date] = None
+        self._kickoffs: Dict[str, datetime] = {}
+        self._prefetched: Set[Tuple[str, datetime]] = set()
+        self._listeners: List[PrefetchListener] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # -------------------------------------------------------------------------
+    # Schedule
+    # -------------------------------------------------------------------------
+
+    def load(self, day: Optional[date] = None) -> int:
+        """Read the day's kickoffs from the games table. Returns the number of teams playing."""
+        day = day or local_today()
+        try:
+            with pooled_cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT home_team_id, away_team_id, kickoff_at
+                    FROM games
+                    WHERE kickoff_at >= %s AND kickoff_at < %s
+                    """,
+                    (day, day + timedelta(days=1)),
+                )
+                rows = cursor.fetchall()
+        except Exception:
+            logger.exception("game day: could not load the schedule for %s", day)
+            return 0
+        self.set_games(day, ((str(row["home_team_id"]), str(row["away_team_id"]), row["kickoff_at"])
+                             for row in rows))
+        return len(self._kickoffs)
+
+    def set_games(self, day: date, games: Iterable[Tuple[str, str, datetime]]) -> None:
+        kickoffs: Dict[str, datetime] = {}
+        for home, away, kickoff in games:
+            for team_id in (home, away):
+                if team_id and (team_id not in kickoffs or kickoff < kickoffs[team_id]):
+                    kickoffs[team_id] = kickoff
+        with self._lock:
+            if day != self._day:
+                self._prefetched.clear()
+            self._day = day
+            self._kickoffs = kickoffs
+        self._wake.set()
+
+    def is_game_day(self, team_id: str) -> bool:
+        return self._day == local_today() and team_id in self._kickoffs
+
+    def kickoff(self, team_id: str) -> Optional[datetime]:
+        return self._kickoffs.get(team_id) if self._day == local_today() else None
+
+    def has_games_today(self) -> bool:
+        return self._day == local_today() and bool(self._kickoffs)
+
+    def ttl(self, team_id: str) -> float:
+        """Seconds a cached view of this team stays fresh."""
+        return GAME_DAY_TTL if self.is_game_day(team_id) else OFF_DAY_TTL
+
+    # -------------------------------------------------------------------------
+    # Prefetch
+    # -------------------------------------------------------------------------
+
+    def subscribe(self, listener: PrefetchListener) -> None:
+        self._listeners.append(listener)
+
+    def due(self, now: datetime) -> List[str]:
+        """Teams whose prefetch time has passed and that have not been prefetched yet."""
+        with self._lock:
+            due = [(team_id, kickoff) for team_id, kickoff in self._kickoffs.items()
+                   if kickoff - PREFETCH_LEAD <= now and (team_id, kickoff) not in self._prefetched]
+            self._prefetched.update(due)
+        return [team_id for team_id, _ in due]
+
+    def _next_prefetch(self, now: datetime) -> Optional[datetime]:
+        with self._lock:
+            pending = [kickoff - PREFETCH_LEAD for team_id, kickoff in self._kickoffs.items()
+                       if (team_id, kickoff) not in self._prefetched and kickoff - PREFETCH_LEAD > now]
+        return min(pending, default=None)
+
+    def _fire(self, team_ids: List[str]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(team_ids)
+            except Exception:
+                logger.exception("game day: prefetch listener failed")
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="game-day", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        loaded_at = None
+        while not self._stop.is_set():
+            now = local_now()
+            if loaded_at is None or self._day != now.date() or (now - loaded_at).total_seconds() >= RELOAD_INTERVAL:
+                self.load(now.date())
+                loaded_at = now
+            # A game scheduled less than PREFETCH_LEAD out (or a restart mid-day) is prefetched right away
+            due = self.due(now)
+            if due:
+                self._fire(due)
+
+            wake_at = loaded_at + timedelta(seconds=RELOAD_INTERVAL)
+            next_prefetch = self._next_prefetch(now)
+            if next_prefetch is not None:
+                wake_at = min(wake_at, next_prefetch)
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._wake.wait(max(0.0, (min(wake_at, midnight) - now).total_seconds()))
+            self._wake.clear()
+
+
+# Process-wide schedule shared by the dashboard and scores routes
+game_day = GameDaySchedule()
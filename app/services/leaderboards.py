@@ -0,0 +1,225 @@
+"""
+StatIQ Leaderboards
+Incrementally maintained top-N boards per stat category and scope
+(statewide, classification, district, team).
+
+Season totals live in the columnar player stats store, seeded at startup
+from the totals box_scores reloads from player_season_stats. As game stats
+are folded in, only the boards the player belongs to are touched: the
+player's entry is re-positioned with a bisect. Each board keeps a few more entries
+than it serves and tracks a floor that every player not on it is known to
+be at or below, so a read is a slice. A board rebuilds itself from a
+partial sort of one column only if evictions leave it too short to answer.
+"""
+
+import bisect
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.services.box_scores import CURRENT_SEASON, PLAYER_STAT_FIELDS, Delta, GameBoxScore, box_scores
+from app.services.player_stats import PlayerStatsStore, player_stats
+
+TOP_N = 25
+BOARD_CAPACITY = TOP_N * 2
+
+SEASON_CATEGORIES = (
+    "rushing_yards", "rushing_tds",
+    "passing_yards", "passing_tds",
+    "receiving_yards", "receiving_tds",
+    "tackles", "sacks", "interceptions",
+)
+
+# Box score field -> stats store column where the names differ
+FIELD_ALIASES = {"rushing_carries": "rushing_attempts"}
+
+# Single-game bests: category -> box score fields summed for it
+GAME_BEST_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "rushing_yards": ("rushing_yards",),
+    "rushing_tds": ("rushing_tds",),
+    "passing_yards": ("passing_yards",),
+    "total_tds": ("rushing_tds", "receiving_tds", "passing_tds"),
+}
+
+# ("state" | "classification" | "district" | "team", label)
+Scope = Tuple[str, str]
+STATEWIDE: Scope = ("state", "")
+
+
+class TopN:
+    """
+    Entries sorted by (-value, player_id), capped at `capacity`.
+
+    Invariant: every ranked player not on the board has value <= floor.
+    A floor of 0 means the board holds every player with a positive value.
+    """
+
+    def __init__(self, capacity: int = BOARD_CAPACITY):
+        self.capacity = capacity
+        self.entries: List[Tuple[float, str]] = []
+        self.values: Dict[str, float] = {}
+        self.floor = 0.0
+
+    def load(self, leaders: List[Tuple[str, float]]) -> None:
+        """Replace contents with a complete top list (highest first)."""
+        leaders = [(player_id, value) for player_id, value in leaders if value > 0]
+        self.entries = sorted((-value, player_id) for player_id, value in leaders)
+        self.values = {player_id: value for player_id, value in leaders}
+        self.floor = leaders[-1][1] if len(leaders) >= self.capacity else 0.0
+
+    def update(self, player_id: str, value: float) -> None:
+        old = self.values.pop(player_id, None)
+        if old is not None:
+            i = bisect.bisect_left(self.entries, (-old, player_id))
+            del self.entries[i]
+            if value < self.floor:
+                return  # Now an outsider below the floor; invariant still holds
+        elif value <= self.floor:
+            return
+        if value <= 0:
+            return
+        bisect.insort(self.entries, (-value, player_id))
+        self.values[player_id] = value
+        if len(self.entries) > self.capacity:
+            dropped_value, dropped_id = self.entries.pop()
+            del self.values[dropped_id]
+            self.floor = max(self.floor, -dropped_value)
+
+    def top(self, limit: int) -> Optional[List[Tuple[str, float]]]:
+        """Top `limit` (player_id, value), or None if the board must be rebuilt to know."""
+        if len(self.entries) < limit and self.floor > 0:
+            return None
+        return [(player_id, -value) for value, player_id in self.entries[:limit]]
+
+
+@dataclass
+class GameBest:
+    value: float = 0
+    player_id: Optional[str] = None
+    game_id: Optional[int] = None
+    opponent_id: Optional[str] = None
+
+
+class Leaderboards:
+    """Top-N boards over a PlayerStatsStore, kept current from box score folds."""
+
+    def __init__(self, store: PlayerStatsStore):
+        self._store = store
+        self._lock = threading.Lock()
+        self._boards: Dict[Tuple[str, Scope], TopN] = {}
+        self._game_bests: Dict[str, GameBest] = {c: GameBest() for c in GAME_BEST_CATEGORIES}
+        self._team_names: Dict[str, str] = {}
+
+    def register_team(self, team_id: str, name: str) -> None:
+        self._team_names[team_id] = name
+
+    def team_name(self, team_id: str) -> Optional[str]:
+        return self._team_names.get(team_id)
+
+    # -------------------------------------------------------------------------
+    # Ingestion
+    # -------------------------------------------------------------------------
+
+    def warm(self, season: str = CURRENT_SEASON) -> int:
+        """
+        Add the season totals box_scores loaded from player_season_stats to
+        the store, so leaders survive a restart. Call after box_scores.start().
+        """
+        lines = box_scores.season_players(season)
+        for line in lines:
+            if line.player_id not in self._store:
+                self._store.register(line.player_id, team_id=line.team_id or None)
+            self._store.add(line.player_id, {FIELD_ALIASES.get(f, f): getattr(line, f) for f in PLAYER_STAT_FIELDS})
+        self.invalidate()
+        return len(lines)
+
+    def record(self, player_id: str, deltas: Dict[str, float]) -> None:
+        """Add one batch of stat deltas to a player's season and re-rank them."""
+        self._store.add(player_id, deltas)
+        labels = self._store.labels(player_id)
+        scopes = _scopes(labels)
+        with self._lock:
+            for category in SEASON_CATEGORIES:
+                if category not in deltas:
+                    continue
+                value = self._store.value(player_id, category)
+                for scope in scopes:
+                    board = self._boards.get((category, scope))
+                    if board is not None:
+                        board.update(player_id, value)
+
+    def fold(self, box: GameBoxScore, deltas: List[Delta]) -> None:
+        """box_scores listener: route each player's deltas from one play into record()."""
+        per_player: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for scope, key, name, amount in deltas:
+            if scope == "player":
+                stat = FIELD_ALIASES.get(name, name)
+                per_player[key][stat] = per_player[key].get(stat, 0) + amount
+
+        for player_id, player_deltas in per_player.items():
+            line = box.players.get(player_id)
+            if line is not None and player_id not in self._store:
+                self._store.register(player_id, team_id=line.team_id or None, name=line.name,
+                                     jersey=line.jersey_number, position=line.position)
+            self.record(player_id, player_deltas)
+            if line is not None:
+                self._update_game_bests(box, line)
+
+    def _update_game_bests(self, box: GameBoxScore, line) -> None:
+        with self._lock:
+            for category, parts in GAME_BEST_CATEGORIES.items():
+                value = sum(getattr(line, part) for part in parts)
+                best = self._game_bests[category]
+                if value > best.value:
+                    self._game_bests[category] = GameBest(
+                        value, line.player_id, box.game_id, box.opponent(line.team_id),
+                    )
+
+    def invalidate(self) -> None:
+        """Drop every board; call after bulk-loading the store outside record()."""
+        with self._lock:
+            self._boards.clear()
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def top(self, category: str, limit: int = 10, scope: Scope = STATEWIDE) -> List[Tuple[str, float]]:
+        limit = min(limit, TOP_N)
+        with self._lock:
+            board = self._boards.get((category, scope))
+            leaders = board.top(limit) if board is not None else None
+            if leaders is None:
+                board = self._boards[(category, scope)] = TopN()
+                board.load(self._store.leaders(category, BOARD_CAPACITY, **_filter(scope)))
+                leaders = board.top(limit)
+            return leaders
+
+    def games_played(self, player_id: str, season: str = CURRENT_SEASON) -> int:
+        """Games with a stat for the player, from the persisted season line."""
+        line = box_scores.player_season(player_id, season)
+        return line.games_played if line is not None else 0
+
+    def game_bests(self) -> Dict[str, GameBest]:
+        with self._lock:
+            return dict(self._game_bests)
+
+
+def _scopes(labels: Dict[str, Optional[str]]) -> List[Scope]:
+    scopes = [STATEWIDE]
+    for group in ("classification", "district", "team"):
+        if labels.get(group):
+            scopes.append((group, labels[group]))
+    return scopes
+
+
+def _filter(scope: Scope) -> dict:
+    kind, label = scope
+    if kind == "state":
+        return {}
+    return {"team_id" if kind == "team" else kind: label}
+
+
+# Process-wide leaderboards shared by the stats routes
+leaderboards = Leaderboards(player_stats)
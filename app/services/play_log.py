@@ -0,0 +1,320 @@
+"""
+StatIQ Play-by-Play Log
+Append-only per-game play store with monotonically increasing sequence numbers.
+
+Plays are kept in memory as a dense list (seq N lives at index N-1), so
+"plays after seq N" is a list slice. Each play is also packed into a compact
+binary record and written to `game_plays` in batches. Downstream consumers
+(win probability, box scores, leaders) subscribe to the log and fold each
+play as it is appended instead of rescanning the game.
+"""
+
+import logging
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+from app.db import connect, transaction
+from app.services.batch_writer import BatchWriter
+
+logger = logging.getLogger(__name__)
+
+EMPTY_CAPACITY = 4096     # Play-less game ids remembered so repeat reads skip the database
+
+# =============================================================================
+# PLAY TYPES
+# =============================================================================
+PLAY_TYPES = (
+    "rush", "pass", "incomplete", "sack", "interception", "fumble",
+    "punt", "kickoff", "field_goal", "extra_point", "two_point",
+    "penalty", "safety", "timeout", "end_of_quarter", "other",
+)
+PLAY_TYPE_CODES = {name: code for code, name in enumerate(PLAY_TYPES)}
+
+
+@dataclass
+class PlayEvent:
+    game_id: int
+    seq: int
+    quarter: int
+    clock_seconds: int            # Seconds left in the quarter
+    team_id: str
+    team_name: str
+    play_type: str
+    yards: int
+    description: str
+    is_scoring_play: bool
+    home_score_after: int
+    away_score_after: int
+    created_at: datetime
+    player_id: Optional[str] = None    # Ball carrier / passer / kicker
+    target_id: Optional[str] = None    # Receiver on pass plays
+    defender_id: Optional[str] = None  # Tackler / sacker / interceptor
+
+    @property
+    def time(self) -> str:
+        return f"{self.clock_seconds // 60}:{self.clock_seconds % 60:02d}"
+
+    def to_dict(self) -> dict:
+        """Shape expected by the client's `Play` type."""
+        return {
+            "id": f"{self.game_id}-{self.seq}",
+            "seq": self.seq,
+            "game_id": str(self.game_id),
+            "quarter": self.quarter,
+            "time": self.time,
+            "team_id": self.team_id,
+            "team_name": self.team_name,
+            "play_type": self.play_type,
+            "yards": self.yards,
+            "description": self.description,
+            "is_scoring_play": self.is_scoring_play,
+            "home_score_after": self.home_score_after,
+            "away_score_after": self.away_score_after,
+            "player_id": self.player_id,
+            "target_id": self.target_id,
+            "defender_id": self.defender_id,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+def parse_clock_seconds(time: Optional[str]) -> int:
+    """'7:42' -> 462. Missing or malformed clocks count as 0:00."""
+    if not time or ":" not in time:
+        return 0
+    minutes, seconds = time.split(":", 1)
+    try:
+        return int(minutes) * 60 + int(seconds)
+    except ValueError:
+        return 0
+
+
+# =============================================================================
+# COMPACT ENCODING
+# =============================================================================
+# Fixed header followed by length-prefixed UTF-8 strings. A typical play packs
+# into ~80-120 bytes versus ~450 bytes as JSON.
+#
+#   seq u32 | created_at f64 | quarter u8 | clock u16 | play_type u8 |
+#   yards i16 | flags u8 | home_score u16 | away_score u16
+_HEADER = struct.Struct("<IdBHBhBHH")
+_STR_LEN = struct.Struct("<H")
+_FLAG_SCORING = 0x01
+
+
+def _pack_str(value: Optional[str]) -> bytes:
+    raw = (value or "").encode("utf-8")
+    if len(raw) > 0xFFFF:
+        # Cut on a character boundary so the record always decodes
+        raw = raw[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")
+    return _STR_LEN.pack(len(raw)) + raw
+
+
+def encode_play(play: PlayEvent) -> bytes:
+    header = _HEADER.pack(
+        play.seq,
+        play.created_at.timestamp(),
+        play.quarter,
+        play.clock_seconds,
+        PLAY_TYPE_CODES.get(play.play_type, PLAY_TYPE_CODES["other"]),
+        play.yards,
+        _FLAG_SCORING if play.is_scoring_play else 0,
+        play.home_score_after,
+        play.away_score_after,
+    )
+    return header + b"".join(_pack_str(s) for s in (
+        play.team_id, play.team_name, play.player_id,
+        play.target_id, play.defender_id, play.description,
+    ))
+
+
+def decode_play(game_id: int, data: bytes) -> PlayEvent:
+    (seq, created_ts, quarter, clock, type_code, yards,
+     flags, home_after, away_after) = _HEADER.unpack_from(data, 0)
+
+    offset = _HEADER.size
+    strings = []
+    for _ in range(6):
+        (length,) = _STR_LEN.unpack_from(data, offset)
+        offset += _STR_LEN.size
+        strings.append(bytes(data[offset:offset + length]).decode("utf-8"))
+        offset += length
+    team_id, team_name, player_id, target_id, defender_id, description = strings
+
+    return PlayEvent(
+        game_id=game_id,
+        seq=seq,
+        quarter=quarter,
+        clock_seconds=clock,
+        team_id=team_id,
+        team_name=team_name,
+        play_type=PLAY_TYPES[type_code],
+        yards=yards,
+        description=description,
+        is_scoring_play=bool(flags & _FLAG_SCORING),
+        home_score_after=home_after,
+        away_score_after=away_after,
+        created_at=datetime.fromtimestamp(created_ts),
+        player_id=player_id or None,
+        target_id=target_id or None,
+        defender_id=defender_id or None,
+    )
+
+
+# =============================================================================
+# LOG
+# =============================================================================
+
+PlayListener = Callable[[PlayEvent], None]
+
+
+class PlayLogUnavailable(RuntimeError):
+    """A game's log could not be loaded from game_plays; nothing is cached, so the next call retries."""
+
+
+class GamePlayLog:
+    """Append-only play list for one game. seq starts at 1 and never has gaps."""
+
+    def __init__(self, game_id: int, plays: Optional[List[PlayEvent]] = None):
+        self.game_id = game_id
+        self._plays: List[PlayEvent] = plays or []
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        return len(self._plays)
+
+    def append(self, on_append: Optional[Callable[[PlayEvent, bytes], None]] = None, **fields) -> PlayEvent:
+        """
+        Add the next play. The play is encoded first, so one that does not fit
+        the record (struct.error) leaves the log untouched. `on_append` gets
+        the play and its packed record before the lock is released, so the
+        game's plays reach it in seq order.
+        """
+        with self._lock:
+            play = PlayEvent(
+                game_id=self.game_id,
+                seq=len(self._plays) + 1,
+                created_at=fields.pop("created_at", None) or datetime.utcnow(),
+                **fields,
+            )
+            payload = encode_play(play)
+            self._plays.append(play)
+            if on_append is not None:
+                on_append(play, payload)
+        return play
+
+    def after(self, seq: int = 0, limit: Optional[int] = None) -> List[PlayEvent]:
+        """Plays with seq > `seq`, oldest first."""
+        start = max(seq, 0)
+        end = None if limit is None else start + limit
+        return self._plays[start:end]
+
+    def __len__(self) -> int:
+        return len(self._plays)
+
+
+class PlayLogStore:
+    """
+    All game logs plus the listeners that derive state from them.
+
+    Logs are loaded lazily from `game_plays` the first time a game is touched
+    (and again on the next touch if that load failed); appends are fanned out
+    to listeners and queued for batched persistence. Only games with plays
+    are cached: reads of games without any are remembered in a bounded set
+    instead, so polling unknown ids does not grow memory or hit the database.
+    """
+
+    def __init__(self):
+        self._logs: Dict[int, GamePlayLog] = {}
+        self._empty: "OrderedDict[int, None]" = OrderedDict()    # Games read with no plays, LRU
+        self._lock = threading.Lock()
+        self._listeners: List[PlayListener] = []
+        self._writer = BatchWriter("plays", _persist_plays, batch_size=200, interval=1.0)
+
+    def subscribe(self, listener: PlayListener) -> None:
+        self._listeners.append(listener)
+
+    def log(self, game_id: int) -> GamePlayLog:
+        """The game's log. A game without plays gets an empty log that is not cached."""
+        return self._log(game_id, create=False)
+
+    def append(self, game_id: int, **fields) -> PlayEvent:
+        return self._log(game_id, create=True).append(on_append=self._publish, **fields)
+
+    def _publish(self, play: PlayEvent, payload: bytes) -> None:
+        """Queue and fan out one play; runs under the game's lock, so in seq order."""
+        self._writer.add((play.game_id, play.seq, payload))
+        for listener in self._listeners:
+            try:
+                listener(play)
+            except Exception:
+                logger.exception("plays: listener failed on game %s seq %s", play.game_id, play.seq)
+
+    def _log(self, game_id: int, create: bool) -> GamePlayLog:
+        log = self._logs.get(game_id)
+        if log is not None:
+            return log
+        with self._lock:
+            log = self._logs.get(game_id)
+            if log is not None:
+                return log
+            if game_id in self._empty:
+                self._empty.move_to_end(game_id)
+                plays = []
+            else:
+                plays = self._load(game_id)
+            if plays or create:
+                self._empty.pop(game_id, None)
+                log = self._logs[game_id] = GamePlayLog(game_id, plays)
+            else:
+                self._empty[game_id] = None
+                if len(self._empty) > EMPTY_CAPACITY:
+                    self._empty.popitem(last=False)
+                log = GamePlayLog(game_id)
+        return log
+
+    def _load(self, game_id: int) -> List[PlayEvent]:
+        """
+        The game's persisted plays. Raises PlayLogUnavailable rather than
+        starting an empty log, which would reuse seqs already in game_plays.
+        """
+        try:
+            conn = connect()
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT payload FROM game_plays WHERE game_id = %s ORDER BY seq",
+                        (game_id,),
+                    )
+                    return [decode_play(game_id, row["payload"]) for row in cursor.fetchall()]
+            finally:
+                conn.close()
+        except psycopg2.Error as e:
+            logger.exception("plays: could not load game %s", game_id)
+            raise PlayLogUnavailable(game_id) from e
+
+    def start(self) -> None:
+        self._writer.start()
+
+    def stop(self) -> None:
+        self._writer.stop()
+
+
+def _persist_plays(batch: List[Tuple[int, int, bytes]]) -> None:
+    with transaction() as cursor:
+        execute_values(
+            cursor,
+            "INSERT INTO game_plays (game_id, seq, payload) VALUES %s ON CONFLICT DO NOTHING",
+            batch,
+        )
+
+
+# Process-wide store shared by the play routes and derived-stat consumers
+play_log = PlayLogStore()
@@ -0,0 +1,280 @@
+"""
+StatIQ Player Stats Store
+Columnar season stats: one NumPy array per raw stat, indexed by player row.
+
+Only counting stats are stored. Averages and percentages (rushing_avg,
+passing_completion_pct, fg_pct, punt_avg, ...) are derived on read with one
+vectorized divide across every row, so they can never go stale against the
+counts they come from. Leaderboards are a mask plus a partial sort over a
+column rather than a walk over per-player dicts.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Counting stats, one column each. Sacks can be split, so everything is float32;
+# that is still 4 bytes per player per stat versus a boxed value in a dict.
+RAW_STATS = (
+    "passing_yards", "passing_tds", "passing_completions", "passing_attempts", "passing_ints",
+    "rushing_yards", "rushing_tds", "rushing_attempts", "rushing_long",
+    "receptions", "receiving_yards", "receiving_tds",
+    "fg_made", "fg_attempts", "fg_long", "xp_made", "xp_attempts",
+    "punts", "punt_yards",
+    "tackles", "sacks", "interceptions",
+)
+
+# Longest-play stats merge with max(), not +
+MAX_STATS = {"rushing_long", "fg_long"}
+
+# A player's stats response includes a whole group (zeros too) once any
+# stat in it is nonzero, so a rusher shows "rushing_tds": 0
+STAT_GROUPS = (
+    ("passing_yards", "passing_tds", "passing_completions", "passing_attempts", "passing_ints"),
+    ("rushing_yards", "rushing_tds", "rushing_attempts", "rushing_long"),
+    ("receptions", "receiving_yards", "receiving_tds"),
+    ("fg_made", "fg_attempts", "fg_long"),
+    ("xp_made", "xp_attempts"),
+    ("punts", "punt_yards"),
+    ("tackles", "sacks", "interceptions"),
+)
+
+
+@dataclass(frozen=True)
+class DerivedStat:
+    numerator: str
+    denominator: str
+    scale: float = 1.0
+    decimals: int = 1
+
+
+DERIVED_STATS: Dict[str, DerivedStat] = {
+    "rushing_avg": DerivedStat("rushing_yards", "rushing_attempts", decimals=2),
+    "receiving_avg": DerivedStat("receiving_yards", "receptions"),
+    "passing_completion_pct": DerivedStat("passing_completions", "passing_attempts", scale=100.0),
+    "fg_pct": DerivedStat("fg_made", "fg_attempts", scale=100.0),
+    "punt_avg": DerivedStat("punt_yards", "punts"),
+}
+
+INITIAL_CAPACITY = 1024
+
+
+class PlayerStatsStore:
+    """
+    Growable column store keyed by player id.
+
+    Team, classification and district are stored as small integer codes so
+    leaderboard filters are vectorized comparisons too.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._columns: Dict[str, np.ndarray] = {
+            stat: np.zeros(capacity, dtype=np.float32) for stat in RAW_STATS
+        }
+        self._has_stats = np.zeros(capacity, dtype=bool)
+        self._codes: Dict[str, Dict[str, int]] = {"team": {}, "classification": {}, "district": {}}
+        self._labels: Dict[str, List[str]] = {group: [] for group in self._codes}  # code -> label
+        self._groups: Dict[str, np.ndarray] = {
+            group: np.full(capacity, -1, dtype=np.int32) for group in self._codes
+        }
+        # player_id -> (name, jersey, position) for leaderboard rows
+        self._info: Dict[str, Tuple[Optional[str], Optional[int], Optional[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self._rows
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def register(self, player_id: str, team_id: Optional[str] = None,
+                 classification: Optional[str] = None, district: Optional[str] = None,
+                 name: Optional[str] = None, jersey: Optional[int] = None,
+                 position: Optional[str] = None) -> int:
+        """Row for a player, created on first sight; labels and info update if given."""
+        with self._lock:
+            row = self._row(player_id)
+            for group, value in (("team", team_id), ("classification", classification), ("district", district)):
+                if value is not None:
+                    codes = self._codes[group]
+                    code = codes.get(value)
+                    if code is None:
+                        code = codes[value] = len(codes)
+                        self._labels[group].append(value)
+                    self._groups[group][row] = code
+            if name is not None or jersey is not None or position is not None:
+                old = self._info.get(player_id, (None, None, None))
+                self._info[player_id] = (
+                    name if name is not None else old[0],
+                    jersey if jersey is not None else old[1],
+                    position if position is not None else old[2],
+                )
+            return row
+
+    def set(self, player_id: str, stats: Dict[str, float]) -> None:
+        """Overwrite a player's counting stats; unknown and derived keys are ignored."""
+        with self._lock:
+            row = self._row(player_id)
+            for stat, value in stats.items():
+                column = self._columns.get(stat)
+                if column is not None:
+                    column[row] = value
+            self._has_stats[row] = True
+
+    def add(self, player_id: str, deltas: Dict[str, float]) -> None:
+        """Fold one game's (or one play's) stats into a player's totals."""
+        with self._lock:
+            row = self._row(player_id)
+            for stat, value in deltas.items():
+                column = self._columns.get(stat)
+                if column is None or not value:
+                    continue
+                if stat in MAX_STATS:
+                    column[row] = max(column[row], value)
+                else:
+                    column[row] += value
+            self._has_stats[row] = True
+
+    def _row(self, player_id: str) -> int:
+        row = self._rows.get(player_id)
+        if row is not None:
+            return row
+        row = len(self._ids)
+        if row == len(self._has_stats):
+            self._grow()
+        self._rows[player_id] = row
+        self._ids.append(player_id)
+        return row
+
+    def _grow(self) -> None:
+        capacity = len(self._has_stats) * 2
+        for stat, column in self._columns.items():
+            self._columns[stat] = np.resize(column, capacity)
+            self._columns[stat][len(column):] = 0
+        for group, column in self._groups.items():
+            self._groups[group] = np.resize(column, capacity)
+            self._groups[group][len(column):] = -1
+        grown = np.zeros(capacity, dtype=bool)
+        grown[:len(self._has_stats)] = self._has_stats
+        self._has_stats = grown
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def column(self, stat: str) -> np.ndarray:
+        """A raw or derived stat for every row, in row order."""
+        n = len(self._ids)
+        if stat in self._columns:
+            return self._columns[stat][:n]
+        spec = DERIVED_STATS.get(stat)
+        if spec is None:
+            raise KeyError(stat)
+        numerator = self._columns[spec.numerator][:n].astype(np.float64)
+        denominator = self._columns[spec.denominator][:n].astype(np.float64)
+        out = np.zeros(n, dtype=np.float64)
+        np.divide(numerator * spec.scale, denominator, out=out, where=denominator > 0)
+        return np.round(out, spec.decimals)
+
+    def value(self, player_id: str, stat: str) -> float:
+        """One raw or derived stat for one player (0 if unknown)."""
+        row = self._rows.get(player_id)
+        if row is None:
+            return 0
+        spec = DERIVED_STATS.get(stat)
+        if spec is None:
+            return _plain(self._columns[stat][row])
+        denominator = float(self._columns[spec.denominator][row])
+        if not denominator:
+            return 0
+        return round(float(self._columns[spec.numerator][row]) * spec.scale / denominator, spec.decimals)
+
+    def values(self, player_id: str, stats: Iterable[str]) -> Dict[str, float]:
+        return {stat: self.value(player_id, stat) for stat in stats}
+
+    def info(self, player_id: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+        """(name, jersey, position), whatever is known."""
+        return self._info.get(player_id, (None, None, None))
+
+    def labels(self, player_id: str) -> Dict[str, Optional[str]]:
+        """The player's team, classification and district labels (None where unset)."""
+        row = self._rows.get(player_id)
+        out: Dict[str, Optional[str]] = {}
+        for group, labels in self._labels.items():
+            code = int(self._groups[group][row]) if row is not None else -1
+            out[group] = labels[code] if code >= 0 else None
+        return out
+
+    def stats(self, player_id: str) -> Optional[Dict[str, float]]:
+        """
+        One player's counting stats (every STAT_GROUPS group with a nonzero
+        entry) plus each derived stat whose denominator is nonzero, or None
+        if the player has no stats.
+        """
+        row = self._rows.get(player_id)
+        if row is None or not self._has_stats[row]:
+            return None
+        out: Dict[str, float] = {}
+        for group in STAT_GROUPS:
+            values = [self._columns[stat][row] for stat in group]
+            if any(values):
+                for stat, value in zip(group, values):
+                    out[stat] = _plain(value)
+        for stat, spec in DERIVED_STATS.items():
+            denominator = self._columns[spec.denominator][row]
+            if denominator:
+                value = float(self._columns[spec.numerator][row]) * spec.scale / float(denominator)
+                out[stat] = round(value, spec.decimals)
+        return out
+
+    def leaders(self, stat: str, limit: int = 10, team_id: Optional[str] = None,
+                classification: Optional[str] = None, district: Optional[str] = None,
+                min_denominator: float = 1) -> List[Tuple[str, float]]:
+        """
+        Top `limit` (player_id, value) for a stat, highest first, optionally
+        within a team, classification and/or district. Derived stats only
+        rank players with at least `min_denominator` attempts.
+        """
+        with self._lock:
+            values = self.column(stat)
+            mask = self._has_stats[:len(values)].copy()
+            for group, label in (("team", team_id), ("classification", classification), ("district", district)):
+                if label is not None:
+                    code = self._codes[group].get(label)
+                    if code is None:
+                        return []
+                    mask &= self._groups[group][:len(values)] == code
+            spec = DERIVED_STATS.get(stat)
+            if spec is not None:
+                mask &= self._columns[spec.denominator][:len(values)] >= max(min_denominator, 1)
+            else:
+                mask &= values != 0
+
+            rows = np.flatnonzero(mask)
+            if len(rows) > limit:
+                top = np.argpartition(-values[rows], limit - 1)[:limit]
+                rows = rows[top]
+            # Highest value first; stable on row so ties keep insertion order
+            rows = rows[np.lexsort((rows, -values[rows]))]
+            return [(self._ids[row], _plain(values[row])) for row in rows]
+
+    def player_ids(self) -> Iterable[str]:
+        return list(self._ids)
+
+
+def _plain(value) -> float:
+    """NumPy scalar -> int when whole, else float, for JSON responses."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+# Process-wide store shared by the player and leaderboard routes
+player_stats = PlayerStatsStore()
@@ -0,0 +1,271 @@
+"""
+StatIQ Power Rankings
+Margin-of-victory power ratings for every Texas team, solved as one sparse
+least-squares problem.
+
+Each final is a row of a (games x teams + 1) sparse matrix: +1 for the home
+team, -1 for the away team, and a home-field column (0 at neutral sites),
+fit to the capped score margin. That is the Massey system; it is solved
+with LSQR and a small ridge term, which keeps the fit defined when the
+schedule graph is disconnected (out-of-state and unmatched opponents) and
+pulls teams with few games toward average. A rating is in points, so the
+difference between two teams is a predicted margin and strength of
+schedule falls out as the mean rating of the opponents played.
+
+The batch job (scripts/compute_power_rankings.py) writes the results to
+power_rankings; the API reads them back through PowerRankingsStore.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import astuple, dataclass, fields
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from psycopg2.extras import execute_values
+from scipy import sparse
+from scipy.sparse.linalg import lsqr
+
+from app.db import pooled_cursor, transaction
+from app.services.box_scores import CURRENT_SEASON
+
+logger = logging.getLogger(__name__)
+
+MARGIN_CAP = 28               # A blowout counts as four touchdowns
+RIDGE = 0.5                   # LSQR damping: per team, like a quarter of a tie with an average team
+MIN_GAMES = 3                 # Fewer finals than this and the rating is flagged incomplete
+RELOAD_INTERVAL = 10 * 60.0   # seconds before the API re-reads power_rankings
+PAGE_SIZE = 1000
+
+# (home_team_id, away_team_id, home_score, away_score, neutral_site)
+ScoredGame = Tuple[int, int, int, int, bool]
+
+
+@dataclass
+class PowerRanking:
+    team_id: int
+    classification: Optional[str]
+    rank: int
+    state_rank: int
+    previous_rank: Optional[int]
+    power_rating: float
+    sos: float
+    wins: int
+    losses: int
+    point_diff: int
+    games_played: int
+    is_incomplete: bool
+
+
+RANKING_COLUMNS = [f.name for f in fields(PowerRanking)]
+
+
+# =============================================================================
+# SOLVER
+# =============================================================================
+
+def solve_ratings(home: np.ndarray, away: np.ndarray, margin: np.ndarray, neutral: np.ndarray,
+                  team_count: int) -> Tuple[np.ndarray, float]:
+    """
+    Least-squares ratings for team indexes 0..team_count-1 from per-game
+    (home index, away index, home margin, neutral flag). Returns (ratings
+    centered on 0, home-field advantage in points).
+    """
+    games = len(margin)
+    rows = np.repeat(np.arange(games), 3)
+    cols = np.column_stack([home, away, np.full(games, team_count)]).ravel()
+    values = np.column_stack([np.ones(games), -np.ones(games), (~neutral).astype(float)]).ravel()
+    matrix = sparse.csr_matrix((values, (rows, cols)), shape=(games, team_count + 1))
+    target = np.clip(margin, -MARGIN_CAP, MARGIN_CAP).astype(float)
+    solution = lsqr(matrix, target, damp=RIDGE)[0]
+    ratings = solution[:team_count]
+    return ratings - ratings.mean(), float(solution[team_count])
+
+
+def compute_rankings(classifications: Dict[int, Optional[str]], games: Iterable[ScoredGame],
+                     previous_ranks: Optional[Dict[int, int]] = None) -> List[PowerRanking]:
+    """
+    Rank every team in `classifications` (team_id -> classification). Teams
+    that only appear in `games` are rated, since their results inform their
+    opponents', but not ranked. Complete teams rank ahead of incomplete ones.
+    """
+    previous_ranks = previous_ranks or {}
+    games = list(games)
+    team_ids = sorted(set(classifications) | {t for g in games for t in g[:2]})
+    index = {team_id: i for i, team_id in enumerate(team_ids)}
+    n = len(team_ids)
+
+    home = np.fromiter((index[g[0]] for g in games), dtype=np.int64, count=len(games))
+    away = np.fromiter((index[g[1]] for g in games), dtype=np.int64, count=len(games))
+    margin = np.fromiter((g[2] - g[3] for g in games), dtype=np.int64, count=len(games))
+    neutral = np.fromiter((g[4] for g in games), dtype=bool, count=len(games))
+    ratings, _ = solve_ratings(home, away, margin, neutral, n) if games else (np.zeros(n), 0.0)
+
+    played = np.bincount(home, minlength=n) + np.bincount(away, minlength=n)
+    wins = np.bincount(home, weights=margin > 0, minlength=n) + np.bincount(away, weights=margin < 0, minlength=n)
+    losses = np.bincount(home, weights=margin < 0, minlength=n) + np.bincount(away, weights=margin > 0, minlength=n)
+    point_diff = np.bincount(home, weights=margin, minlength=n) - np.bincount(away, weights=margin, minlength=n)
+    opponent_total = np.bincount(home, weights=ratings[away], minlength=n) + np.bincount(away, weights=ratings[home], minlength=n)
+    sos = np.divide(opponent_total, played, out=np.zeros(n), where=played > 0)
+
+    def order(team_ids: List[int]) -> List[int]:
+        return sorted(team_ids, key=lambda t: (played[index[t]] < MIN_GAMES, -ratings[index[t]], t))
+
+    ranked = list(classifications)
+    state_rank = {team_id: r for r, team_id in enumerate(order(ranked), start=1)}
+    by_class: Dict[Optional[str], List[int]] = {}
+    for team_id in ranked:
+        by_class.setdefault(classifications[team_id], []).append(team_id)
+
+    results = []
+    for classification, members in by_class.items():
+        for rank, team_id in enumerate(order(members), start=1):
+            i = index[team_id]
+            results.append(PowerRanking(
+                team_id=team_id,
+                classification=classification,
+                rank=rank,
+                state_rank=state_rank[team_id],
+                previous_rank=previous_ranks.get(team_id),
+                power_rating=round(float(ratings[i]), 2),
+                sos=round(float(sos[i]), 2),
+                wins=int(wins[i]),
+                losses=int(losses[i]),
+                point_diff=int(point_diff[i]),
+                games_played=int(played[i]),
+                is_incomplete=bool(played[i] < MIN_GAMES),
+            ))
+    results.sort(key=lambda r: r.state_rank)
+    return results
+
+
+# =============================================================================
+# BATCH JOB
+# =============================================================================
+
+def season_window(season: str) -> Tuple[date, date]:
+    start = date(int(season), 8, 1)
+    return start, start.replace(year=start.year + 1)
+
+
+def load_season(season: str) -> Tuple[Dict[int, Optional[str]], List[ScoredGame], Dict[int, int]]:
+    """(team_id -> classification, the season's finals, the last run's ranks) from Postgres."""
+    start, end = season_window(season)
+    with pooled_cursor() as cursor:
+        cursor.execute("SELECT t.id, s.classification FROM teams t LEFT JOIN schools s ON s.id = t.school_id")
+        classifications = {row["id"]: row["classification"] for row in cursor.fetchall()}
+        cursor.execute(
+            """
+            SELECT home_team_id, away_team_id, home_score, away_score,
+                   COALESCE(game_type, 'regular') <> 'regular' AS neutral
+            FROM games
+            WHERE status = 'final' AND home_score IS NOT NULL AND away_score IS NOT NULL
+              AND kickoff_at >= %s AND kickoff_at < %s
+            """,
+            (start, end),
+        )
+        games = [(row["home_team_id"], row["away_team_id"], row["home_score"], row["away_score"], row["neutral"])
+                 for row in cursor.fetchall()]
+        cursor.execute("SELECT team_id, rank FROM power_rankings WHERE season = %s", (season,))
+        previous = {row["team_id"]: row["rank"] for row in cursor.fetchall()}
+    return classifications, games, previous
+
+
+def write_rankings(season: str, rankings: List[PowerRanking]) -> int:
+    """Replace the season's rows in one transaction."""
+    with transaction() as cursor:
+        cursor.execute("DELETE FROM power_rankings WHERE season = %s", (season,))
+        execute_values(
+            cursor,
+            f"INSERT INTO power_rankings (season, {', '.join(RANKING_COLUMNS)}) VALUES %s",
+            [(season,) + astuple(ranking) for ranking in rankings],
+            page_size=PAGE_SIZE,
+        )
+    return len(rankings)
+
+
+# =============================================================================
+# READ STORE
+# =============================================================================
+
+# Called with (season, team_id -> power_rating) when a load changes the season's ratings
+RatingsListener = Callable[[str, Dict[int, float]], None]
+
+
+class PowerRankingsStore:
+    """power_rankings rows per season, joined with team names and colors, re-read every RELOAD_INTERVAL."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seasons: Dict[str, Tuple[float, List[dict]]] = {}
+        self._by_team: Dict[str, Dict[str, dict]] = {}
+        self._ratings: Dict[str, Dict[int, float]] = {}     # Last ratings handed to listeners, per season
+        self._listeners: List[RatingsListener] = []
+
+    def subscribe(self, listener: RatingsListener) -> None:
+        self._listeners.append(listener)
+
+    def warm(self, season: str = CURRENT_SEASON) -> int:
+        return len(self._rows(season))
+
+    def rankings(self, season: str = CURRENT_SEASON, classification: Optional[str] = None) -> List[dict]:
+        rows = self._rows(season)
+        if classification is None:
+            return rows
+        classification = classification.upper()
+        return [row for row in rows if (row["classification"] or "").upper() == classification]
+
+    def classifications(self, season: str = CURRENT_SEASON) -> List[str]:
+        return sorted({row["classification"] for row in self._rows(season) if row["classification"]})
+
+    def team(self, team_id, season: str = CURRENT_SEASON) -> Optional[dict]:
+        self._rows(season)
+        return self._by_team.get(season, {}).get(str(team_id))
+
+    def _rows(self, season: str) -> List[dict]:
+        cached = self._seasons.get(season)
+        if cached is not None and time.time() - cached[0] < RELOAD_INTERVAL:
+            return cached[1]
+        try:
+            rows = self._load(season)
+        except Exception:
+            logger.exception("power rankings: could not load season %s", season)
+            rows = cached[1] if cached is not None else []
+        ratings = {row["team_id"]: row["power_rating"] for row in rows}
+        with self._lock:
+            self._seasons[season] = (time.time(), rows)
+            self._by_team[season] = {str(row["team_id"]): row for row in rows}
+            # Reloads mostly find the same rows; only a new batch job run re-prices listeners
+            changed = bool(ratings) and ratings != self._ratings.get(season)
+            if changed:
+                self._ratings[season] = ratings
+        if changed:
+            for listener in self._listeners:
+                try:
+                    listener(season, ratings)
+                except Exception:
+                    logger.exception("power rankings: ratings listener failed")
+        return rows
+
+    @staticmethod
+    def _load(season: str) -> List[dict]:
+        with pooled_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT pr.*, t.school_id, t.name AS school_name, t.mascot, s.city,
+                       t.primary_color, t.background_color
+                FROM power_rankings pr
+                JOIN teams t ON t.id = pr.team_id
+                LEFT JOIN schools s ON s.id = t.school_id
+                WHERE pr.season = %s
+                ORDER BY pr.state_rank
+                """,
+                (season,),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+
+# Process-wide store shared by the rankings, scores and team routes
+power_rankings = PowerRankingsStore()
@@ -0,0 +1,191 @@
+"""
+StatIQ Recent Searches
+Capped, deduplicated, most-recent-first search history per device.
+
+Each device keeps at most MAX_RECENT queries in an ordered dict keyed by the
+normalized query, so recording a search is O(1): move an existing entry to
+the front or push a new one and drop the oldest. Rows reach Postgres through
+the batch writer, so the search path never waits on a DB write. A device's
+persisted history is read once, on its first read, and merged by timestamp
+with anything recorded in memory before that. Only the MAX_DEVICES most
+recently active devices are kept in memory; an evicted device's history is
+read back from Postgres the next time it is asked for.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+from app.db import connect, transaction
+from app.services.batch_writer import BatchWriter
+from app.services.search_index import normalize
+
+logger = logging.getLogger(__name__)
+
+MAX_RECENT = 10
+MAX_QUERY_LENGTH = 100
+SHARD_COUNT = 32
+MAX_DEVICES = 50_000          # Histories held in memory across all shards
+
+
+class _History:
+    """One device's searches: normalized key -> (query as typed, searched_at), oldest first."""
+
+    __slots__ = ("entries", "loaded")
+
+    def __init__(self):
+        self.entries: "OrderedDict[str, Tuple[str, datetime]]" = OrderedDict()
+        self.loaded = False
+
+    def push(self, key: str, query: str, searched_at: datetime, cap: int) -> None:
+        self.entries[key] = (query, searched_at)
+        self.entries.move_to_end(key)
+        if len(self.entries) > cap:
+            self.entries.popitem(last=False)
+
+    def merge(self, rows: List[Tuple[str, str, datetime]], cap: int) -> None:
+        """Fold persisted (key, query, searched_at) rows in, newest timestamp winning per key."""
+        combined = dict(self.entries)
+        for key, query, searched_at in rows:
+            current = combined.get(key)
+            if current is None or searched_at > current[1]:
+                combined[key] = (query, searched_at)
+        newest = sorted(combined.items(), key=lambda item: item[1][1])[-cap:]
+        self.entries = OrderedDict(newest)
+
+
+class _Shard:
+    """A lock stripe of device histories, least recently used first."""
+
+    __slots__ = ("lock", "histories", "capacity")
+
+    def __init__(self, capacity: int):
+        self.lock = threading.Lock()
+        self.histories: "OrderedDict[str, _History]" = OrderedDict()
+        self.capacity = capacity
+
+    def history(self, device_id: str) -> _History:
+        """The device's history, created if needed and marked most recently used. Call with the lock held."""
+        history = self.histories.get(device_id)
+        if history is None:
+            history = self.histories[device_id] = _History()
+            if len(self.histories) > self.capacity:
+                self.histories.popitem(last=False)
+        else:
+            self.histories.move_to_end(device_id)
+        return history
+
+
+class RecentSearchStore:
+    """Per-device recent searches, striped over SHARD_COUNT locks."""
+
+    def __init__(self, cap: int = MAX_RECENT, shard_count: int = SHARD_COUNT, max_devices: int = MAX_DEVICES):
+        self._cap = cap
+        self._shards = [_Shard(max(1, max_devices // shard_count)) for _ in range(shard_count)]
+        self._writer = BatchWriter("recent_searches", _persist_searches, batch_size=500, interval=2.0)
+
+    def _shard(self, device_id: str) -> _Shard:
+        return self._shards[hash(device_id) % len(self._shards)]
+
+    def record(self, device_id: str, query: str) -> bool:
+        """Push a search to the front of the device's list. Blank queries are ignored."""
+        query = " ".join(query.split())[:MAX_QUERY_LENGTH]
+        key = normalize(query)
+        if not key:
+            return False
+        searched_at = datetime.utcnow()
+        shard = self._shard(device_id)
+        with shard.lock:
+            shard.history(device_id).push(key, query, searched_at, self._cap)
+        self._writer.add((device_id, key, query, searched_at))
+        return True
+
+    def recent(self, device_id: str, limit: int = MAX_RECENT) -> List[str]:
+        """Queries as typed, most recent first."""
+        shard = self._shard(device_id)
+        with shard.lock:
+            history = shard.history(device_id)
+            loaded = history.loaded
+        if not loaded:
+            rows = self._load(device_id)
+            with shard.lock:
+                history = shard.history(device_id)
+                if rows is not None and not history.loaded:
+                    history.merge(rows, self._cap)
+                    history.loaded = True
+        with shard.lock:
+            entries = list(history.entries.values())
+        return [query for query, _ in reversed(entries)][:limit]
+
+    def _load(self, device_id: str):
+        """Persisted history for a device, or None if the database is unreachable (retried next read)."""
+        try:
+            conn = connect()
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        """
+                        SELECT query_key, query, searched_at
+                        FROM recent_searches
+                        WHERE device_id = %s
+                        ORDER BY searched_at DESC
+                        LIMIT %s
+                        """,
+                        (device_id, self._cap),
+                    )
+                    return [(row["query_key"], row["query"], row["searched_at"]) for row in cursor.fetchall()]
+            finally:
+                conn.close()
+        except psycopg2.Error:
+            logger.exception("recent_searches: could not load device %s", device_id)
+            return None
+
+    def start(self) -> None:
+        self._writer.start()
+
+    def stop(self) -> None:
+        self._writer.stop()
+
+
+def _persist_searches(batch: List[tuple]) -> None:
+    """Upsert a batch of searches, then trim each touched device back to MAX_RECENT rows."""
+    # One row per (device, key) or ON CONFLICT would touch the same row twice
+    latest: Dict[Tuple[str, str], tuple] = {}
+    for row in batch:
+        latest[(row[0], row[1])] = row
+    with transaction() as cursor:
+        execute_values(
+            cursor,
+            """
+            INSERT INTO recent_searches (device_id, query_key, query, searched_at)
+            VALUES %s
+            ON CONFLICT (device_id, query_key) DO UPDATE SET
+                query = EXCLUDED.query,
+                searched_at = GREATEST(recent_searches.searched_at, EXCLUDED.searched_at)
+            """,
+            list(latest.values()),
+        )
+        cursor.execute(
+            """
+            DELETE FROM recent_searches r
+            USING (
+                SELECT device_id, query_key,
+                       row_number() OVER (PARTITION BY device_id ORDER BY searched_at DESC) AS position
+                FROM recent_searches
+                WHERE device_id = ANY(%s)
+            ) ranked
+            WHERE r.device_id = ranked.device_id
+              AND r.query_key = ranked.query_key
+              AND ranked.position > %s
+            """,
+            (list({device_id for device_id, _ in latest}), MAX_RECENT),
+        )
+
+
+# Process-wide store shared by the search routes
+recent_searches = RecentSearchStore()
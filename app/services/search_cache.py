@@ -0,0 +1,94 @@
+"""
+StatIQ Search Cache
+LRU cache of ranked search results per normalized query, in front of the
+search index.
+
+The search screen queries on every keystroke, so popular prefixes ("hig",
+"jos", "mid") are asked for over and over with identical answers. Entries
+are keyed by (query, limit, followed teams) and the whole cache is dropped
+whenever the index version changes.
+
+A miss first looks for a cached shorter prefix of the query that came back
+with fewer than `limit` hits. That result is complete: it holds every
+entity whose terms match the shorter prefix, so it also holds every term
+match for the longer query, and the index only has to re-rank those slots.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from app.services.search_index import SearchIndex, normalize
+
+DEFAULT_CAPACITY = 4096
+
+CacheKey = Tuple[str, int, Tuple[str, ...]]
+
+
+class SearchCache:
+    """Thread-safe LRU of ranked result slots, invalidated on index.version."""
+
+    def __init__(self, index: SearchIndex, capacity: int = DEFAULT_CAPACITY):
+        self._index = index
+        self._capacity = capacity
+        self._entries: "OrderedDict[CacheKey, List[int]]" = OrderedDict()
+        self._version = index.version
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str, limit: int = 20, followed_team_ids: Iterable[str] = ()) -> List[dict]:
+        query = normalize(query)
+        followed = tuple(sorted(set(followed_team_ids)))
+        key = (query, limit, followed)
+
+        with self._lock:
+            version = self._index.version
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            slots = self._entries.get(key)
+            if slots is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._index.results(slots)
+            within = self._narrowable(query, limit, followed)
+
+        slots = self._index.rank(query, limit, followed, within=within)
+
+        with self._lock:
+            if within is not None:
+                self.narrowed += 1
+            else:
+                self.misses += 1
+            # Skip storing if the index moved on while ranking
+            if self._index.version == version == self._version:
+                self._entries[key] = slots
+                if len(self._entries) > self._capacity:
+                    self._entries.popitem(last=False)
+        return self._index.results(slots)
+
+    def _narrowable(self, query: str, limit: int, followed: Tuple[str, ...]) -> Optional[List[int]]:
+        """Longest cached shorter prefix with fewer than `limit` hits, if any."""
+        for end in range(len(query) - 1, 0, -1):
+            slots = self._entries.get((query[:end], limit, followed))
+            if slots is not None and len(slots) < limit:
+                return slots
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "narrowed": self.narrowed,
+                "misses": self.misses,
+            }
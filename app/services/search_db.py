@@ -0,0 +1,333 @@
+"""
+StatIQ Statewide Search
+Ranked search over every team, player and coach in Postgres.
+
+Backed by the tsvector and trigram GIN indexes from search_schema.sql: word
+prefixes go through `search_vector @@ 'word:*'`, name prefixes/substrings
+through trigram-indexed LIKE, and typos through the trigram `%` operator.
+Queries shorter than a trigram cannot use the index for a substring or
+similarity match, so they only match on word and name prefixes.
+One UNION ALL query covers all three tables and ranks with the same tiers
+as the in-memory index (exact > prefix > word-prefix > substring > fuzzy),
+followed teams lifted one tier.
+
+Search-as-you-type asks for the same popular prefixes over and over, so
+results are kept in a short-lived LRU (SearchResultCache) in front of the
+query. As in the in-memory SearchCache, a miss first looks for a cached
+shorter prefix that came back with fewer than `limit` rows: every term
+match for the longer query is among those rows, so they are re-ranked in
+Python instead of querying again. Typo matches are limited to those rows
+too; they are re-checked with pg_trgm's similarity.
+
+After a database error the cache stops querying for DOWN_INTERVAL and
+raises SearchUnavailable straight away, so callers fall back without
+waiting on the pool for every keystroke.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Set, Tuple
+
+import psycopg2
+
+from app.db import pooled_cursor
+from app.services.search_index import (
+    FOLLOW_BOOST, TIER_EXACT, TIER_FUZZY, TIER_PREFIX, TIER_SUBSTRING, TIER_WORD_PREFIX, normalize,
+)
+
+DEFAULT_CAPACITY = 4096
+RESULT_TTL = 60.0             # seconds; roster edits show up in search within a minute
+MIN_TRIGRAM_QUERY = 3         # Shorter queries skip substring and typo matching
+SIMILARITY_THRESHOLD = 0.3    # pg_trgm.similarity_threshold default, used by the % operator
+DOWN_INTERVAL = 30.0          # seconds to skip the database after an error
+
+# Rows a query can match, per table alias: {0} is the alias
+MATCH = """{0}.search_vector @@ to_tsquery('simple', %(tsquery)s)
+       OR lower({0}.name) LIKE %(contains)s
+       OR lower({0}.name) %% %(query)s"""
+SHORT_MATCH = """{0}.search_vector @@ to_tsquery('simple', %(tsquery)s)
+       OR lower({0}.name) LIKE %(prefix)s"""
+
+_SEARCH_TEMPLATE = """
+WITH hits AS (
+    SELECT
+        'team' AS type,
+        t.id::text AS id,
+        lower(t.name) AS term,
+        t.search_vector @@ to_tsquery('simple', %(tsquery)s) AS word_match,
+        ts_rank(t.search_vector, to_tsquery('simple', %(tsquery)s)) AS text_rank,
+        jsonb_build_object(
+            'type', 'team',
+            'id', t.id::text,
+            'name', t.name,
+            'mascot', t.mascot,
+            'district', CASE WHEN s.district IS NOT NULL
+                             THEN 'District ' || s.district || '-' || s.classification END,
+            'record', t.wins || '-' || t.losses
+        ) AS result
+    FROM teams t
+    LEFT JOIN schools s ON s.id = t.school_id
+    WHERE {team_match}
+
+    UNION ALL
+
+    SELECT
+        'player',
+        p.id::text,
+        lower(p.name),
+        p.search_vector @@ to_tsquery('simple', %(tsquery)s),
+        ts_rank(p.search_vector, to_tsquery('simple', %(tsquery)s)),
+        jsonb_build_object(
+            'type', 'player',
+            'id', 'player_' || p.id,
+            'name', p.name,
+            'number', p.number,
+            'position', p.position,
+            'team', t.name,
+            'team_id', t.id::text
+        )
+    FROM players p
+    JOIN teams t ON t.id = p.team_id
+    WHERE {player_match}
+
+    UNION ALL
+
+    SELECT
+        'coach',
+        c.id::text,
+        lower(c.name),
+        c.search_vector @@ to_tsquery('simple', %(tsquery)s),
+        ts_rank(c.search_vector, to_tsquery('simple', %(tsquery)s)),
+        jsonb_build_object(
+            'type', 'coach',
+            'id', 'coach_' || c.id,
+            'name', c.name,
+            'title', c.title,
+            'team', t.name,
+            'team_id', t.id::text
+        )
+    FROM coaches c
+    JOIN teams t ON t.id = c.team_id
+    WHERE {coach_match}
+),
+ranked AS (
+    SELECT
+        result,
+        term,
+        text_rank,
+        type = 'team' AND id = ANY(%(followed)s::text[]) AS followed,
+        CASE
+            WHEN term = %(query)s THEN 0
+            WHEN term LIKE %(prefix)s THEN 1
+            WHEN word_match THEN 2
+            WHEN term LIKE %(contains)s THEN 3
+            ELSE 4
+        END AS tier
+    FROM hits
+)
+SELECT result
+FROM ranked
+ORDER BY
+    GREATEST(tier - CASE WHEN followed THEN 1 ELSE 0 END, 0),
+    followed DESC,
+    text_rank DESC,
+    similarity(term, %(query)s) DESC,
+    length(term),
+    term
+LIMIT %(limit)s
+"""
+
+SEARCH_SQL = _SEARCH_TEMPLATE.format(
+    team_match=MATCH.format("t"), player_match=MATCH.format("p"), coach_match=MATCH.format("c"))
+SHORT_SEARCH_SQL = _SEARCH_TEMPLATE.format(
+    team_match=SHORT_MATCH.format("t"), player_match=SHORT_MATCH.format("p"), coach_match=SHORT_MATCH.format("c"))
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def prefix_tsquery(query: str) -> str:
+    """'highland pa' -> 'highland:* & pa:*'; punctuation is dropped, not passed to to_tsquery."""
+    return " & ".join(f"{word}:*" for word in _WORD.findall(query))
+
+
+def escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_database(query: str, limit: int = 20, followed_team_ids: Iterable[str] = ()) -> List[dict]:
+    """Top `limit` teams, players and coaches statewide, best first."""
+    query = normalize(query)
+    tsquery = prefix_tsquery(query)
+    if not tsquery or limit <= 0:
+        return []
+
+    with pooled_cursor() as cursor:
+        cursor.execute(SEARCH_SQL if len(query) >= MIN_TRIGRAM_QUERY else SHORT_SEARCH_SQL, {
+            "query": query,
+            "tsquery": tsquery,
+            "prefix": escape_like(query) + "%",
+            "contains": "%" + escape_like(query) + "%",
+            "followed": list(followed_team_ids),
+            "limit": limit,
+        })
+        return [row["result"] for row in cursor.fetchall()]
+
+
+# =============================================================================
+# NARROWING
+# =============================================================================
+
+# Fields each table's search_vector is built from (see search_schema.sql)
+_VECTOR_FIELDS = {"team": ("name", "mascot"), "player": ("name", "number", "position"), "coach": ("name", "title")}
+
+
+def trigrams(text: str) -> Set[str]:
+    """pg_trgm's trigrams: each word padded with two leading spaces and one trailing."""
+    grams = set()
+    for word in _WORD.findall(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm similarity(): shared trigrams over all trigrams."""
+    left, right = trigrams(a), trigrams(b)
+    union = len(left | right)
+    return len(left & right) / union if union else 0.0
+
+
+def _tier(result: dict, query: str) -> Optional[int]:
+    """The SQL ranking tier of a result row for `query`, or None if it no longer matches."""
+    term = normalize(result["name"])
+    if term == query:
+        return TIER_EXACT
+    if term.startswith(query):
+        return TIER_PREFIX
+    words = _WORD.findall(" ".join(normalize(str(result.get(f) or "")) for f in _VECTOR_FIELDS[result["type"]]))
+    if all(any(w.startswith(q) for w in words) for q in _WORD.findall(query)):
+        return TIER_WORD_PREFIX
+    if len(query) >= MIN_TRIGRAM_QUERY and query in term:
+        return TIER_SUBSTRING
+    if len(query) >= MIN_TRIGRAM_QUERY and similarity(term, query) >= SIMILARITY_THRESHOLD:
+        return TIER_FUZZY
+    return None
+
+
+def rerank(results: List[dict], query: str, limit: int, followed_team_ids: Iterable[str] = ()) -> List[dict]:
+    """
+    Re-rank a complete result for a shorter prefix of `query` with the SQL
+    tiers. ts_rank is not available here, so ties fall through to
+    similarity, length and name.
+    """
+    followed = set(followed_team_ids)
+    ranked = []
+    for result in results:
+        tier = _tier(result, query)
+        if tier is None:
+            continue
+        is_followed = result["type"] == "team" and result["id"] in followed
+        term = normalize(result["name"])
+        ranked.append((max(tier - (FOLLOW_BOOST if is_followed else 0), 0), not is_followed,
+                       -similarity(term, query), len(term), term, result))
+    ranked.sort(key=lambda r: r[:5])
+    return [r[5] for r in ranked[:limit]]
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+CacheKey = Tuple[str, int, Tuple[str, ...]]
+
+
+class SearchUnavailable(RuntimeError):
+    """The search database failed recently; nothing is queried until DOWN_INTERVAL passes."""
+
+
+class SearchResultCache:
+    """Thread-safe LRU of search_database results per (query, limit, followed teams), expiring after `ttl`."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, ttl: float = RESULT_TTL,
+                 down_interval: float = DOWN_INTERVAL):
+        self._capacity = capacity
+        self._ttl = ttl
+        self._down_interval = down_interval
+        self._down_until = 0.0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str, limit: int = 20, followed_team_ids: Iterable[str] = ()) -> List[dict]:
+        """
+        Cached results, a narrowed shorter prefix's, or search_database's.
+        Raises SearchUnavailable on a database error and for DOWN_INTERVAL
+        after it; nothing is cached then.
+        """
+        query = normalize(query)
+        followed = tuple(sorted(set(followed_team_ids)))
+        key = (query, limit, followed)
+
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self._ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            within = self._narrowable(query, limit, followed, now)
+            if within is None and now < self._down_until:
+                raise SearchUnavailable("search database unavailable")
+
+        if within is not None:
+            results = rerank(within[1], query, limit, followed)
+        else:
+            try:
+                results = search_database(query, limit=limit, followed_team_ids=followed)
+            except psycopg2.Error as e:
+                with self._lock:
+                    self._down_until = time.monotonic() + self._down_interval
+                raise SearchUnavailable(str(e)) from e
+
+        with self._lock:
+            if within is not None:
+                self.narrowed += 1
+            else:
+                self.misses += 1
+            # A narrowed result expires with the prefix it came from
+            self._entries[key] = (within[0] if within is not None else time.monotonic(), results)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+        return results
+
+    def _narrowable(self, query: str, limit: int, followed: Tuple[str, ...],
+                    now: float) -> Optional[Tuple[float, List[dict]]]:
+        """
+        Longest fresh cached shorter prefix with fewer than `limit` rows, if
+        any. Prefixes shorter than MIN_TRIGRAM_QUERY skipped substring and
+        typo matching, so they only cover queries that do too.
+        """
+        shortest = 1 if len(query) < MIN_TRIGRAM_QUERY else MIN_TRIGRAM_QUERY
+        for end in range(len(query) - 1, shortest - 1, -1):
+            entry = self._entries.get((query[:end], limit, followed))
+            if entry is not None and now - entry[0] < self._ttl and len(entry[1]) < limit:
+                return entry
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._down_until = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "narrowed": self.narrowed,
+                    "misses": self.misses}
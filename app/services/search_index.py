@@ -0,0 +1,339 @@
+"""
+StatIQ Search Index
+In-memory n-gram index over teams, players and coaches.
+
+Every searchable term (names, mascots, jersey numbers, titles) is broken into
+its 1-, 2- and 3-character substrings. A query looks up the postings for its
+own n-grams, intersects them starting from the rarest, and only verifies
+substring matches on that small candidate set - no per-request scan over
+every row.
+
+Results are ranked exact > prefix > word-prefix > substring. Term and word
+prefixes also have their own postings, kept sorted by (length, text), so the
+higher tiers are read in rank order and a query stops as soon as it has
+`limit` results - a one-letter query never touches the substring tier.
+
+When the exact tiers come up short, a SymSpell deletion dictionary fills the
+rest with typo matches (edit distance <= 2), including team alias synonyms.
+"""
+
+import bisect
+import heapq
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.services.fuzzy_index import FuzzyIndex, fuzzy_keys
+
+MAX_GRAM = 3
+
+# Match tiers, best first
+TIER_EXACT = 0
+TIER_PREFIX = 1
+TIER_WORD_PREFIX = 2
+TIER_SUBSTRING = 3
+TIER_FUZZY = 4
+
+# Followed teams are lifted one tier and sort first within it
+FOLLOW_BOOST = 1
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def grams(term: str) -> Set[str]:
+    """All substrings of length 1..MAX_GRAM."""
+    out = set()
+    for n in range(1, MAX_GRAM + 1):
+        for i in range(len(term) - n + 1):
+            out.add(term[i:i + n])
+    return out
+
+
+def query_grams(query: str) -> Set[str]:
+    """The grams a match must contain: the query itself if short, else its trigrams."""
+    if len(query) <= MAX_GRAM:
+        return {query}
+    return {query[i:i + MAX_GRAM] for i in range(len(query) - MAX_GRAM + 1)}
+
+
+def word_starts(term: str) -> List[int]:
+    """Offsets of every word after the first."""
+    return [i + 1 for i, ch in enumerate(term) if ch == " "]
+
+
+@dataclass
+class SearchEntity:
+    type: str            # "team", "player", "coach"
+    id: str
+    terms: Tuple[str, ...]  # Normalized searchable fields, primary name first
+    result: dict         # Prebuilt response dict
+    synonyms: Tuple[str, ...] = ()  # Aliases matched exactly or fuzzily, never by substring
+
+
+# Sorted prefix postings hold (len(term), term, slot, word offset) so
+# iteration is rank order and each entry is checked with one startswith()
+PrefixEntry = Tuple[int, str, int, int]
+
+
+class SearchIndex:
+    """
+    Incrementally updatable n-gram index.
+
+    Entities are stored in a slot list; postings map each gram to the set of
+    slots whose terms contain it. Removing an entity clears its slot and
+    discards it from its postings.
+    """
+
+    def __init__(self):
+        self._entities: List[Optional[SearchEntity]] = []
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._term_prefixes: Dict[str, List[PrefixEntry]] = {}
+        self._word_prefixes: Dict[str, List[PrefixEntry]] = {}
+        self._synonyms: Dict[str, Set[int]] = {}
+        self._fuzzy = FuzzyIndex()
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def add(self, type: str, id: str, terms: Iterable[str], result: dict,
+            synonyms: Iterable[str] = ()) -> None:
+        entity = SearchEntity(
+            type=type,
+            id=id,
+            terms=tuple(normalize(t) for t in terms if t),
+            result=result,
+            synonyms=tuple(normalize(t) for t in synonyms if t),
+        )
+        with self._lock:
+            key = (type, id)
+            if key in self._slots:
+                self._remove_slot(self._slots.pop(key))
+            slot = len(self._entities)
+            self._entities.append(entity)
+            self._slots[key] = slot
+            for term, prefix_key, entry in _prefix_entries(entity, slot, word=False):
+                bisect.insort(self._term_prefixes.setdefault(prefix_key, []), entry)
+            for term, prefix_key, entry in _prefix_entries(entity, slot, word=True):
+                bisect.insort(self._word_prefixes.setdefault(prefix_key, []), entry)
+            for term in entity.terms:
+                for gram in grams(term):
+                    self._postings.setdefault(gram, set()).add(slot)
+            for synonym in entity.synonyms:
+                self._synonyms.setdefault(synonym, set()).add(slot)
+            self._fuzzy.add(slot, fuzzy_keys(entity.terms, entity.synonyms))
+            self.version += 1
+
+    def remove(self, type: str, id: str) -> None:
+        with self._lock:
+            slot = self._slots.pop((type, id), None)
+            if slot is not None:
+                self._remove_slot(slot)
+                self.version += 1
+
+    def _remove_slot(self, slot: int) -> None:
+        entity = self._entities[slot]
+        self._entities[slot] = None
+        for table, word in ((self._term_prefixes, False), (self._word_prefixes, True)):
+            for _, prefix_key, entry in _prefix_entries(entity, slot, word=word):
+                entries = table.get(prefix_key)
+                if entries:
+                    i = bisect.bisect_left(entries, entry)
+                    if i < len(entries) and entries[i] == entry:
+                        del entries[i]
+                    if not entries:
+                        del table[prefix_key]
+        for term in entity.terms:
+            for gram in grams(term):
+                postings = self._postings.get(gram)
+                if postings is not None:
+                    postings.discard(slot)
+                    if not postings:
+                        del self._postings[gram]
+        for synonym in entity.synonyms:
+            self._synonyms.get(synonym, set()).discard(slot)
+        self._fuzzy.remove(slot, fuzzy_keys(entity.terms, entity.synonyms))
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def candidates(self, query: str) -> Set[int]:
+        """Slots whose terms contain every gram of the query (superset of matches)."""
+        postings = []
+        for gram in query_grams(query):
+            slots = self._postings.get(gram)
+            if not slots:
+                return set()
+            postings.append(slots)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for slots in postings[1:]:
+            result &= slots
+            if not result:
+                break
+        return result
+
+    def search(self, query: str, limit: int = 20, followed_team_ids: Iterable[str] = (),
+               fuzzy: bool = True) -> List[dict]:
+        """Top `limit` matches, best first."""
+        return self.results(self.rank(normalize(query), limit, followed_team_ids, fuzzy))
+
+    def results(self, slots: Iterable[int]) -> List[dict]:
+        """Response dicts for ranked slots, skipping any removed since."""
+        results = []
+        for slot in slots:
+            entity = self._entities[slot]
+            if entity is not None:
+                results.append(entity.result)
+        return results
+
+    def rank(self, query: str, limit: int = 20, followed_team_ids: Iterable[str] = (),
+             fuzzy: bool = True, within: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Slots of the top `limit` matches for a normalized query, best first.
+
+        Tiers are filled in order (followed teams, synonyms, prefix,
+        word-prefix, substring, fuzzy) and each later tier is skipped once
+        `limit` results are in hand, since nothing in it can outrank them.
+
+        `within` replaces the prefix and substring tiers with a re-rank of
+        the given slots; it must contain every term match for the query,
+        e.g. the complete result for a shorter prefix of it.
+        """
+        if not query or limit <= 0:
+            return []
+
+        # (tier, followed_first, length, name, slot)
+        ranked: List[Tuple[int, int, int, str, int]] = []
+        seen: Set[int] = set()
+
+        for team_id in followed_team_ids:
+            slot = self._slots.get(("team", team_id))
+            entity = self._entities[slot] if slot is not None else None
+            if entity is None:
+                continue
+            match = _best_match(entity.terms, query)
+            if match is not None:
+                tier, length, term = match
+                seen.add(slot)
+                ranked.append((max(tier - FOLLOW_BOOST, 0), 0, length, term, slot))
+
+        for slot in self._synonyms.get(query, ()):
+            entity = self._entities[slot]
+            if entity is not None and slot not in seen:
+                seen.add(slot)
+                ranked.append((TIER_PREFIX, 1, len(entity.terms[0]), entity.terms[0], slot))
+
+        filled = len(ranked)
+
+        # Every exact-tier match contains all of the query's n-grams. A typo
+        # usually has a gram nothing contains, which skips straight to fuzzy.
+        if within is not None:
+            narrowed = []
+            for slot in within:
+                entity = self._entities[slot]
+                if entity is None or slot in seen:
+                    continue
+                match = _best_match(entity.terms, query)
+                if match is not None:
+                    tier, length, term = match
+                    narrowed.append((tier, 1, length, term, slot))
+            for match in heapq.nsmallest(limit - filled, narrowed):
+                seen.add(match[-1])
+                ranked.append(match)
+            filled = len(ranked)
+            possible = False
+        else:
+            possible = all(gram in self._postings for gram in query_grams(query))
+
+        if possible:
+            for entries in (
+                self._term_prefixes.get(query[:MAX_GRAM], ()),
+                self._word_prefixes.get(query[:MAX_GRAM], ()),
+            ):
+                for length, term, slot, start in entries:
+                    if filled >= limit:
+                        break
+                    if slot in seen or not term.startswith(query, start):
+                        continue
+                    if start:
+                        tier = TIER_WORD_PREFIX
+                    else:
+                        tier = TIER_EXACT if term == query else TIER_PREFIX
+                    seen.add(slot)
+                    ranked.append((tier, 1, length, term, slot))
+                    filled += 1
+
+        if possible and filled < limit:
+            substring = []
+            for slot in self.candidates(query) - seen:
+                entity = self._entities[slot]
+                match = _best_match(entity.terms, query) if entity is not None else None
+                if match is not None:
+                    tier, length, term = match
+                    substring.append((tier, 1, length, term, slot))
+            for match in heapq.nsmallest(limit - filled, substring):
+                seen.add(match[-1])
+                ranked.append(match)
+            filled = len(ranked)
+
+        if fuzzy and filled < limit:
+            for distance, _, slots in self._fuzzy.lookup(query):
+                if filled >= limit:
+                    break
+                for slot in slots:
+                    if filled >= limit:
+                        break
+                    entity = self._entities[slot]
+                    if entity is None or slot in seen:
+                        continue
+                    seen.add(slot)
+                    ranked.append((TIER_FUZZY, distance, len(entity.terms[0]), entity.terms[0], slot))
+                    filled += 1
+
+        ranked.sort()
+        return [slot for *_, slot in ranked[:limit]]
+
+    def entity(self, slot: int) -> Optional[SearchEntity]:
+        return self._entities[slot]
+
+
+def _prefix_entries(entity: SearchEntity, slot: int, word: bool):
+    """(term, posting key, sorted entry) for each 1..MAX_GRAM prefix of a term or inner word."""
+    for term in entity.terms:
+        starts = word_starts(term) if word else [0]
+        keys = {(term[start:start + n], start) for start in starts for n in range(1, MAX_GRAM + 1)}
+        for key, start in keys:
+            if key.strip():
+                yield term, key, (len(term), term, slot, start)
+
+
+def _term_tier(term: str, query: str) -> Optional[int]:
+    if term == query:
+        return TIER_EXACT
+    if term.startswith(query):
+        return TIER_PREFIX
+    if any(term.startswith(query, start) for start in word_starts(term)):
+        return TIER_WORD_PREFIX
+    if query in term:
+        return TIER_SUBSTRING
+    return None
+
+
+def _best_match(terms: Tuple[str, ...], query: str) -> Optional[Tuple[int, int, str]]:
+    """(tier, length, term) for the best-ranked term the query matches, as the prefix postings order it."""
+    best = None
+    for term in terms:
+        tier = _term_tier(term, query)
+        if tier is not None and (best is None or (tier, len(term), term) < best):
+            best = (tier, len(term), term)
+    return best
@@ -0,0 +1,352 @@
+"""
+StatIQ District Standings
+District records, point differentials and head-to-head results, kept
+current as games go final.
+
+The season's teams and games are loaded once. Each district keeps its
+teams' W-L and points, plus two (teams x teams) matrices: wins of row over
+column, and the capped point margin of row over column. A final touches a
+handful of cells (a corrected final is backed out first), and the order is
+re-resolved on the next read from those structures alone, never by
+rescanning the district's games:
+
+1. District winning percentage
+2. Head-to-head record among the tied teams
+3. Point differential among the tied teams, MARGIN_CAP points per game at most
+4. Capped point differential over all district games
+5. Fewest district points allowed, then team id (UIL leaves this to a coin toss)
+
+When a tiebreaker splits a tie into smaller ties, each of those starts
+over at step 2, as UIL district tiebreakers do.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.db import pooled_cursor
+from app.services.box_scores import CURRENT_SEASON
+
+logger = logging.getLogger(__name__)
+
+MARGIN_CAP = 15
+FINAL = "final"
+LIVE = "live"
+
+DistrictKey = Tuple[str, str]   # (classification, district), e.g. ("6A", "5")
+
+
+def district_key(classification: str, district) -> DistrictKey:
+    """("6a", "05") -> ("6A", "5")."""
+    district = str(district).strip()
+    return classification.strip().upper(), str(int(district)) if district.isdigit() else district.upper()
+
+
+def district_name(key: DistrictKey) -> str:
+    return f"{key[0]} District {key[1]}"
+
+
+@dataclass
+class StandingsTeam:
+    id: int
+    name: str
+    mascot: Optional[str] = None
+    primary_color: Optional[str] = None
+    district: Optional[DistrictKey] = None
+
+
+@dataclass
+class StandingsGame:
+    id: int
+    home_team_id: int
+    away_team_id: int
+    kickoff_at: Optional[datetime] = None
+    status: str = "scheduled"
+    home_score: Optional[int] = None
+    away_score: Optional[int] = None
+    quarter: Optional[str] = None
+    time_remaining: Optional[str] = None
+    district: Optional[DistrictKey] = None      # Set for regular-season games inside one district
+
+    @property
+    def is_final(self) -> bool:
+        return self.status == FINAL and self.home_score is not None and self.away_score is not None
+
+
+@dataclass
+class StandingRow:
+    team: StandingsTeam
+    rank: int
+    overall_wins: int
+    overall_losses: int
+    district_wins: int
+    district_losses: int
+    points_for: int
+    points_against: int
+    streak: int
+    streak_type: str              # "W" | "L"
+
+
+# =============================================================================
+# DISTRICT
+# =============================================================================
+
+class District:
+    """One district's records and head-to-head matrices. Callers hold the engine lock."""
+
+    def __init__(self, key: DistrictKey, team_ids: Iterable[int]):
+        self.key = key
+        self.team_ids: List[int] = sorted(team_ids)
+        self.index = {team_id: i for i, team_id in enumerate(self.team_ids)}
+        n = len(self.team_ids)
+        self.wins = np.zeros((n, n))           # wins[i, j]: i's wins over j (a tie is half each)
+        self.margin = np.zeros((n, n))         # margin[i, j]: i's capped point margin over j
+        self.points_for = np.zeros(n, dtype=np.int64)
+        self.points_against = np.zeros(n, dtype=np.int64)
+        self.game_ids: List[int] = []
+        self._order: Optional[List[int]] = None
+
+    def apply(self, game: StandingsGame, sign: int = 1) -> None:
+        """Add a final's result (sign=1) or back it out (sign=-1)."""
+        i, j = self.index[game.home_team_id], self.index[game.away_team_id]
+        home, away = game.home_score, game.away_score
+        if home == away:
+            self.wins[i, j] += sign * 0.5
+            self.wins[j, i] += sign * 0.5
+        elif home > away:
+            self.wins[i, j] += sign
+        else:
+            self.wins[j, i] += sign
+        capped = max(-MARGIN_CAP, min(MARGIN_CAP, home - away))
+        self.margin[i, j] += sign * capped
+        self.margin[j, i] -= sign * capped
+        self.points_for[i] += sign * home
+        self.points_against[i] += sign * away
+        self.points_for[j] += sign * away
+        self.points_against[j] += sign * home
+        self._order = None
+
+    def record(self, team_id: int) -> Tuple[float, float]:
+        i = self.index[team_id]
+        return float(self.wins[i].sum()), float(self.wins[:, i].sum())
+
+    # -------------------------------------------------------------------------
+    # Tiebreakers
+    # -------------------------------------------------------------------------
+
+    def order(self) -> List[int]:
+        """Team ids, first place first. Cached until the next result."""
+        if self._order is None:
+            wins, losses = self.wins.sum(axis=1), self.wins.sum(axis=0)
+            played = wins + losses
+            pct = np.divide(wins, played, out=np.zeros_like(wins), where=played > 0)
+            self._order = [self.team_ids[i] for group in _split(list(range(len(self.team_ids))), pct)
+                           for i in self._break_tie(group)]
+        return self._order
+
+    def _break_tie(self, group: List[int]) -> List[int]:
+        if len(group) < 2:
+            return group
+        block = np.ix_(group, group)
+        steps: List[np.ndarray] = [
+            self.wins[block].sum(axis=1) - self.wins[block].sum(axis=0),    # head-to-head
+            self.margin[block].sum(axis=1),                                 # capped margin among the tied
+            self.margin[group].sum(axis=1),                                 # capped margin, all district
+            -self.points_against[group].astype(float),                      # fewest points allowed
+        ]
+        for values in steps:
+            parts = _split(list(range(len(group))), values)
+            if len(parts) > 1:
+                return [i for part in parts for i in self._break_tie([group[p] for p in part])]
+        return sorted(group, key=lambda i: self.team_ids[i])
+
+
+def _split(members: List[int], values: np.ndarray) -> List[List[int]]:
+    """Group members by value, best (highest) first."""
+    groups: Dict[float, List[int]] = {}
+    for m in members:
+        groups.setdefault(round(float(values[m]), 6), []).append(m)
+    return [groups[value] for value in sorted(groups, reverse=True)]
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class StandingsEngine:
+    """Every district's standings for the season, updated in place per final."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._teams: Dict[int, StandingsTeam] = {}
+        self._games: Dict[int, StandingsGame] = {}
+        self._team_games: Dict[int, List[int]] = {}
+        self._overall: Dict[int, List[float]] = {}     # team_id -> [wins, losses]
+        self._districts: Dict[DistrictKey, District] = {}
+
+    def load(self, teams: Iterable[StandingsTeam], games: Iterable[StandingsGame],
+             is_district_game: Callable[[StandingsGame], bool] = lambda game: True) -> None:
+        """Replace everything. `is_district_game` rules out games that never count (e.g. playoffs)."""
+        teams = {team.id: team for team in teams}
+        members: Dict[DistrictKey, List[int]] = {}
+        for team in teams.values():
+            if team.district is not None:
+                members.setdefault(team.district, []).append(team.id)
+        districts = {key: District(key, team_ids) for key, team_ids in members.items()}
+
+        games = {game.id: game for game in games}
+        team_games: Dict[int, List[int]] = {}
+        for game in sorted(games.values(), key=_kickoff):
+            home, away = teams.get(game.home_team_id), teams.get(game.away_team_id)
+            if home is not None and away is not None and home.district is not None \
+                    and home.district == away.district and is_district_game(game):
+                game.district = home.district
+                districts[game.district].game_ids.append(game.id)
+            for team_id in (game.home_team_id, game.away_team_id):
+                team_games.setdefault(team_id, []).append(game.id)
+
+        with self._lock:
+            self._teams, self._games, self._team_games, self._districts = teams, games, team_games, districts
+            self._overall = {}
+            for game in games.values():
+                if game.is_final:
+                    self._apply(game, 1)
+
+    def warm(self) -> int:
+        """Load the season from the teams, schools and games tables. Returns the number of districts."""
+        start = date(int(CURRENT_SEASON), 8, 1)
+        try:
+            with pooled_cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT t.id, t.name, t.mascot, t.primary_color, s.classification, s.district
+                    FROM teams t
+                    LEFT JOIN schools s ON s.id = t.school_id
+                    """
+                )
+                teams = [
+                    StandingsTeam(
+                        id=row["id"], name=row["name"], mascot=row["mascot"], primary_color=row["primary_color"],
+                        district=(district_key(row["classification"], row["district"])
+                                  if row["classification"] and row["district"] is not None else None),
+                    )
+                    for row in cursor.fetchall()
+                ]
+                cursor.execute(
+                    """
+                    SELECT id, home_team_id, away_team_id, home_score, away_score, status, kickoff_at, game_type
+                    FROM games
+                    WHERE kickoff_at >= %s AND kickoff_at < %s
+                    """,
+                    (start, start.replace(year=start.year + 1)),
+                )
+                rows = cursor.fetchall()
+        except Exception:
+            logger.exception("standings: could not load teams and games")
+            return 0
+        regular = {row["id"] for row in rows if (row["game_type"] or "regular") == "regular"}
+        self.load(
+            teams,
+            (StandingsGame(id=row["id"], home_team_id=row["home_team_id"], away_team_id=row["away_team_id"],
+                           kickoff_at=row["kickoff_at"], status=row["status"] or "scheduled",
+                           home_score=row["home_score"], away_score=row["away_score"]) for row in rows),
+            is_district_game=lambda game: game.id in regular,
+        )
+        return len(self._districts)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def record_score(self, game_id: int, home_score: int, away_score: int,
+                     quarter: Optional[str] = None, time_remaining: Optional[str] = None) -> bool:
+        """A live or final score. Returns False for a game outside the loaded season."""
+        is_final = (quarter or "").strip().upper().startswith("FINAL")
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None:
+                return False
+            if game.is_final:
+                self._apply(game, -1)   # A corrected final replaces the old result
+            game.home_score, game.away_score = home_score, away_score
+            game.status = FINAL if is_final else LIVE
+            game.quarter, game.time_remaining = quarter, None if is_final else time_remaining
+            if game.is_final:
+                self._apply(game, 1)
+        return True
+
+    def _apply(self, game: StandingsGame, sign: int) -> None:
+        home, away = game.home_score, game.away_score
+        for team_id, won, lost in ((game.home_team_id, home > away, home < away),
+                                   (game.away_team_id, away > home, away < home)):
+            record = self._overall.setdefault(team_id, [0, 0])
+            record[0] += sign * won
+            record[1] += sign * lost
+        if game.district is not None:
+            self._districts[game.district].apply(game, sign)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def team(self, team_id: int) -> Optional[StandingsTeam]:
+        return self._teams.get(team_id)
+
+    def game(self, game_id: int) -> Optional[StandingsGame]:
+        return self._games.get(game_id)
+
+    def standings(self, key: DistrictKey) -> Optional[List[StandingRow]]:
+        with self._lock:
+            district = self._districts.get(key)
+            if district is None:
+                return None
+            rows = []
+            for rank, team_id in enumerate(district.order(), start=1):
+                i = district.index[team_id]
+                wins, losses = district.record(team_id)
+                overall = self._overall.get(team_id, [0, 0])
+                streak, streak_type = self._streak(team_id)
+                rows.append(StandingRow(
+                    team=self._teams[team_id],
+                    rank=rank,
+                    overall_wins=int(overall[0]),
+                    overall_losses=int(overall[1]),
+                    district_wins=int(wins),
+                    district_losses=int(losses),
+                    points_for=int(district.points_for[i]),
+                    points_against=int(district.points_against[i]),
+                    streak=streak,
+                    streak_type=streak_type,
+                ))
+        return rows
+
+    def district_games(self, key: DistrictKey) -> List[StandingsGame]:
+        district = self._districts.get(key)
+        return [self._games[game_id] for game_id in district.game_ids] if district is not None else []
+
+    def _streak(self, team_id: int) -> Tuple[int, str]:
+        """Current run of wins or losses, most recent final first (a tie ends it)."""
+        streak, streak_type = 0, "W"
+        for game_id in reversed(self._team_games.get(team_id, ())):
+            game = self._games[game_id]
+            if not game.is_final:
+                continue
+            ours, theirs = ((game.home_score, game.away_score) if game.home_team_id == team_id
+                            else (game.away_score, game.home_score))
+            result = "W" if ours > theirs else "L" if ours < theirs else None
+            if result is None or (streak and result != streak_type):
+                break
+            streak, streak_type = streak + 1, result
+        return streak, streak_type
+
+
+def _kickoff(game: StandingsGame) -> datetime:
+    return game.kickoff_at or datetime.max
+
+
+# Process-wide engine shared by the standings routes
+standings = StandingsEngine()
@@ -0,0 +1,246 @@
+"""
+StatIQ Team Aliases
+Every name variation seen in weekly score feeds for the 5A-D1 teams, mapped
+to the team's database id and official name. scripts/import_all_games_v2.py
+resolves scraped names through it, and search uses it for alias synonyms
+("HP").
+"""
+
+TEAMS_5A_D1 = {
+    # Team name variations -> (db_id, official_name)
+    "abilene": (35, "Abilene"),
+    "aledo": (36, "Aledo"),
+    "amarillo": (37, "Amarillo"),
+    "caprock": (310, "Amarillo Caprock"),
+    "amarillo caprock": (310, "Amarillo Caprock"),
+    "tascosa": (228, "Amarillo Tascosa"),
+    "amarillo tascosa": (228, "Amarillo Tascosa"),
+    "a&m consolidated": (34, "A&M Consolidated"),
+    "a&m": (34, "A&M Consolidated"),
+    "consol": (34, "A&M Consolidated"),
+    "americas": (38, "Americas"),
+    "ep americas": (283, "El Paso Americas"),
+    "el paso americas": (283, "El Paso Americas"),
+    "anderson": (39, "Anderson"),  # Could be Austin Anderson too
+    "austin anderson": (226, "Austin Anderson"),
+    "angleton": (40, "Angleton"),
+    "azle": (180, "Azle"),
+    "barbers hill": (42, "Barbers Hill"),
+    "baytown sterling": (277, "Baytown Sterling"),
+    "sterling": (277, "Baytown Sterling"),
+    "beaumont united": (43, "Beaumont United"),
+    "united": (43, "Beaumont United"),
+    "west brook": (271, "Beaumont West Brook"),
+    "beaumont west brook": (271, "Beaumont West Brook"),
+    "bel air": (44, "Bel Air"),
+    "el paso bel air": (252, "El Paso Bel Air"),
+    "birdville": (186, "Birdville"),
+    "boerne champion": (158, "Boerne Champion"),
+    "boerne-champion": (158, "Boerne Champion"),
+    "champion": (158, "Boerne Champion"),
+    "brewer": (46, "Brewer"),
+    "ft worth brewer": (249, "White Settlement Brewer"),
+    "brownsville rivera": (245, "Brownsville Rivera"),
+    "rivera": (245, "Brownsville Rivera"),
+    "buda hays": (312, "Buda Hays"),
+    "hays": (312, "Buda Hays"),
+    "creekview": (258, "Carrollton Creekview"),
+    "carrollton creekview": (258, "Carrollton Creekview"),
+    "smith": (275, "Carrollton Smith"),
+    "carrollton smith": (275, "Carrollton Smith"),
+    "turner": (289, "Carrollton Turner"),
+    "carrollton turner": (289, "Carrollton Turner"),
+    "cedar creek": (232, "Cedar Creek"),
+    "cedar park": (47, "Cedar Park"),
+    "centennial": (5, "Centennial"),
+    "burleson centennial": (5, "Centennial"),
+    "frisco centennial": (295, "Frisco Centennial"),
+    "chisholm trail": (48, "Chisholm Trail"),
+    "saginaw chisholm trail": (236, "Saginaw Chisholm Trail"),
+    "cleburne": (6, "Cleburne"),
+    "college station": (49, "College Station"),
+    "flour bluff": (298, "Corpus Christi Flour Bluff"),
+    "cc flour bluff": (298, "Corpus Christi Flour Bluff"),
+    "corpus christi flour bluff": (298, "Corpus Christi Flour Bluff"),
+    "cc veterans memorial": (234, "Corpus Christi Veterans Memorial"),
+    "corpus christi veterans memorial": (234, "Corpus Christi Veterans Memorial"),
+    "crosby": (52, "Crosby"),
+    "dallas adams": (282, "Dallas Adams"),
+    "adams": (282, "Dallas Adams"),
+    "highland park": (215, "Dallas Highland Park"),
+    "dallas highland park": (215, "Dallas Highland Park"),
+    "hp": (215, "Dallas Highland Park"),
+    "molina": (272, "Dallas Molina"),
+    "dallas molina": (272, "Dallas Molina"),
+    "sunset": (309, "Dallas Sunset"),
+    "dallas sunset": (309, "Dallas Sunset"),
+    "white": (216, "Dallas White"),
+    "dallas white": (216, "Dallas White"),
+    "denton": (181, "Denton"),
+    "ryan": (79, "Denton Ryan"),
+    "denton ryan": (79, "Denton Ryan"),
+    "donna": (165, "Donna"),
+    "donna north": (169, "Donna North"),
+    "eagle pass winn": (276, "Eagle Pass Winn"),
+    "winn": (276, "Eagle Pass Winn"),
+    "east view": (53, "East View"),
+    "georgetown east view": (303, "Georgetown East View"),
+    "vela": (291, "Edinburg Vela"),
+    "edinburg vela": (291, "Edinburg Vela"),
+    "el dorado": (54, "El Dorado"),
+    "el paso el dorado": (294, "El Paso El Dorado"),
+    "parkland": (300, "El Paso Parkland"),
+    "el paso parkland": (300, "El Paso Parkland"),
+    "kempner": (220, "Fort Bend Kempner"),
+    "fort bend kempner": (220, "Fort Bend Kempner"),
+    "arlington heights": (274, "Fort Worth Arlington Heights"),
+    "ft worth arlington heights": (274, "Fort Worth Arlington Heights"),
+    "north side": (233, "Fort Worth North Side"),
+    "ft worth north side": (233, "Fort Worth North Side"),
+    "paschal": (265, "Fort Worth Paschal"),
+    "ft worth paschal": (265, "Fort Worth Paschal"),
+    "polytechnic": (255, "Fort Worth Polytechnic"),
+    "poly": (255, "Fort Worth Polytechnic"),
+    "south hills": (217, "Fort Worth South Hills"),
+    "trimble tech": (238, "Fort Worth Trimble Tech"),
+    "wyatt": (288, "Fort Worth Wyatt"),
+    "fossil ridge": (184, "Fossil Ridge"),
+    "keller fossil ridge": (222, "Keller Fossil Ridge"),
+    "friendswood": (56, "Friendswood"),
+    "frisco": (57, "Frisco"),
+    "heritage": (214, "Frisco Heritage"),
+    "frisco heritage": (214, "Frisco Heritage"),
+    "lebanon trail": (250, "Frisco Lebanon Trail"),
+    "frisco lebanon trail": (250, "Frisco Lebanon Trail"),
+    "lone star": (251, "Frisco Lone Star"),
+    "frisco lone star": (251, "Frisco Lone Star"),
+    "reedy": (229, "Frisco Reedy"),
+    "frisco reedy": (229, "Frisco Reedy"),
+    "wakeland": (263, "Frisco Wakeland"),
+    "frisco wakeland": (263, "Frisco Wakeland"),
+    "galena park": (58, "Galena Park"),
+    "ball": (260, "Galveston Ball"),
+    "galveston ball": (260, "Galveston Ball"),
+    "georgetown": (59, "Georgetown"),
+    "granbury": (185, "Granbury"),
+    "harlingen south": (60, "Harlingen South"),
+    "houston austin": (261, "Houston Austin"),
+    "madison": (311, "Houston Madison"),
+    "houston madison": (311, "Houston Madison"),
+    "milby": (224, "Houston Milby"),
+    "houston milby": (224, "Houston Milby"),
+    "sharpstown": (278, "Houston Sharpstown"),
+    "spring woods": (218, "Houston Spring Woods"),
+    "houston sterling": (254, "Houston Sterling"),
+    "waltrip": (281, "Houston Waltrip"),
+    "houston waltrip": (281, "Houston Waltrip"),
+    "westbury": (223, "Houston Westbury"),
+    "houston westbury": (223, "Houston Westbury"),
+    "joshua": (16, "Joshua"),
+    "chaparral": (269, "Killeen Chaparral"),
+    "killeen chaparral": (269, "Killeen Chaparral"),
+    "kingwood park": (287, "Kingwood Park"),
+    "lehman": (235, "Kyle Lehman"),
+    "kyle lehman": (235, "Kyle Lehman"),
+    "juarez-lincoln": (264, "La Joya Juarez-Lincoln"),
+    "palmview": (299, "La Joya Palmview"),
+    "la joya palmview": (299, "La Joya Palmview"),
+    "lake belton": (63, "Lake Belton"),
+    "lancaster": (183, "Lancaster"),
+    "la porte": (62, "La Porte"),
+    "laporte": (62, "La Porte"),
+    "cigarroa": (305, "Laredo Cigarroa"),
+    "laredo cigarroa": (305, "Laredo Cigarroa"),
+    "laredo martin": (256, "Laredo Martin"),
+    "nixon": (284, "Laredo Nixon"),
+    "laredo nixon": (284, "Laredo Nixon"),
+    "leander": (131, "Leander"),
+    "glenn": (297, "Leander Glenn"),
+    "leander glenn": (297, "Leander Glenn"),
+    "rouse": (240, "Leander Rouse"),
+    "leander rouse": (240, "Leander Rouse"),
+    "lockhart": (230, "Lockhart"),
+    "lubbock": (192, "Lubbock"),
+    "coronado": (244, "Lubbock Coronado"),
+    "lubbock coronado": (244, "Lubbock Coronado"),
+    "monterey": (292, "Lubbock Monterey"),
+    "lubbock monterey": (292, "Lubbock Monterey"),
+    "lufkin": (19, "Lufkin"),
+    "mcallen": (66, "McAllen"),
+    "mcallen memorial": (67, "McAllen Memorial"),
+    "mcallen rowe": (262, "McAllen Rowe"),
+    "rowe": (262, "McAllen Rowe"),
+    "mckinney north": (293, "McKinney North"),
+    "midlothian": (22, "Midlothian"),
+    "mission": (68, "Mission"),
+    "new braunfels": (70, "New Braunfels"),
+    "new caney porter": (241, "New Caney Porter"),
+    "porter": (241, "New Caney Porter"),
+    "newman smith": (71, "Newman Smith"),
+    "north mesquite": (73, "North Mesquite"),
+    "n mesquite": (73, "North Mesquite"),
+    "north richland hills birdville": (266, "North Richland Hills Birdville"),
+    "nrh richland": (268, "North Richland Hills Richland"),
+    "richland": (268, "North Richland Hills Richland"),
+    "pasadena": (285, "Pasadena"),
+    "hendrickson": (302, "Pflugerville Hendrickson"),
+    "pflugerville hendrickson": (302, "Pflugerville Hendrickson"),
+    "weiss": (290, "Pflugerville Weiss"),
+    "pflugerville weiss": (290, "Pflugerville Weiss"),
+    "pieper": (76, "Pieper"),
+    "port arthur memorial": (23, "Port Arthur Memorial"),
+    "pa memorial": (23, "Port Arthur Memorial"),
+    "psja memorial": (286, "PSJA Memorial"),
+    "psja veterans memorial": (286, "PSJA Memorial"),
+    "psja north": (257, "PSJA North"),
+    "pharr north": (257, "PSJA North"),
+    "red oak": (25, "Red Oak"),
+    "rio grande city": (177, "Rio Grande City"),
+    "saginaw": (80, "Saginaw"),
+    "sa jay": (227, "San Antonio Jay"),
+    "san antonio jay": (227, "San Antonio Jay"),
+    "jay": (227, "San Antonio Jay"),
+    "sa macarthur": (246, "San Antonio MacArthur"),
+    "san antonio macarthur": (246, "San Antonio MacArthur"),
+    "macarthur": (246, "San Antonio MacArthur"),
+    "southside": (304, "San Antonio Southside"),
+    "sa southside": (304, "San Antonio Southside"),
+    "san antonio southside": (304, "San Antonio Southside"),
+    "southwest": (267, "San Antonio Southwest"),
+    "sa southwest": (267, "San Antonio Southwest"),
+    "wagner": (242, "San Antonio Wagner"),
+    "sa wagner": (242, "San Antonio Wagner"),
+    "san antonio wagner": (242, "San Antonio Wagner"),
+    "seguin": (29, "Seguin"),
+    "sherman": (248, "Sherman"),
+    "smithson valley": (81, "Smithson Valley"),
+    "south san antonio": (152, "South San Antonio"),
+    "south san": (152, "South San Antonio"),
+    "southwest legacy": (153, "Southwest Legacy"),
+    "tyler": (31, "Tyler"),
+    "tyler legacy": (32, "Tyler Legacy"),
+    "victoria east": (128, "Victoria East"),
+    "west mesquite": (90, "West Mesquite"),
+    "w mesquite": (90, "West Mesquite"),
+    
+    # El Paso teams added
+    "hanks": (355, "El Paso Hanks"),
+    "el paso hanks": (355, "El Paso Hanks"),
+    "irvin": (356, "El Paso Irvin"),
+    "el paso irvin": (356, "El Paso Irvin"),
+    "montwood": (357, "El Paso Montwood"),
+    "el paso montwood": (357, "El Paso Montwood"),
+    "burges": (358, "El Paso Burges"),
+    "el paso burges": (358, "El Paso Burges"),
+    "ysleta": (359, "El Paso Ysleta"),
+    "el paso ysleta": (359, "El Paso Ysleta"),
+    "eastwood": (360, "El Paso Eastwood"),
+    "el paso eastwood": (360, "El Paso Eastwood"),
+    "canutillo": (361, "Canutillo"),
+    "del valle": (362, "Del Valle"),
+    "ep del valle": (362, "Del Valle"),
+    "san angelo central": (363, "San Angelo Central"),
+    "sa central": (363, "San Angelo Central"),
+    "central": (363, "San Angelo Central"),
+    "roma": (364, "Roma"),
+}
@@ -0,0 +1,216 @@
+"""
+StatIQ Fan Prediction Votes
+In-memory vote ingestion with sharded per-game counters.
+
+Votes are deduped by (game_id, device_id) and counted in memory the moment
+they arrive; the rows are persisted to Postgres asynchronously in batches.
+Reads never touch the votes table - tallies come straight from the
+counters, which are warmed from `game_vote_tallies` at startup.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from app.db import connect, pooled_cursor, transaction
+from app.services.batch_writer import BatchWriter
+
+logger = logging.getLogger(__name__)
+
+Side = Literal["home", "away"]
+
+SHARD_COUNT = 32
+
+
+@dataclass
+class VoteTally:
+    home: int = 0
+    away: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.home + self.away
+
+    @property
+    def home_percentage(self) -> float:
+        return round(self.home * 100.0 / self.total, 1) if self.total else 50.0
+
+    @property
+    def away_percentage(self) -> float:
+        return round(100.0 - self.home_percentage, 1) if self.total else 50.0
+
+
+class _Shard:
+    """One lock stripe: the dedupe set and counters for the games hashed to it."""
+
+    __slots__ = ("lock", "voters", "tallies")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (game_id, device_id) -> side; doubles as the dedupe set
+        self.voters: Dict[Tuple[int, str], Side] = {}
+        self.tallies: Dict[int, VoteTally] = {}
+
+
+class VoteStore:
+    """
+    Sharded vote counters.
+
+    Games are spread over SHARD_COUNT lock stripes so a kickoff burst on one
+    popular game does not serialize votes for every other game.
+    """
+
+    def __init__(self, shard_count: int = SHARD_COUNT):
+        self._shards = [_Shard() for _ in range(shard_count)]
+        self._games: set = set()      # Game ids known to exist in the games table
+        self._writer = BatchWriter("votes", _persist_votes, batch_size=500, interval=2.0)
+
+    def _shard(self, game_id: int) -> _Shard:
+        return self._shards[hash(game_id) % len(self._shards)]
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def cast(self, game_id: int, device_id: str, side: Side) -> Tuple[Side, bool]:
+        """
+        Record a vote. Returns (side, created); a repeat vote from the same
+        device is locked in and returns the original side with created=False.
+        """
+        shard = self._shard(game_id)
+        key = (game_id, device_id)
+        with shard.lock:
+            existing = shard.voters.get(key)
+            if existing is not None:
+                return existing, False
+            shard.voters[key] = side
+            tally = shard.tallies.get(game_id)
+            if tally is None:
+                tally = shard.tallies[game_id] = VoteTally()
+            if side == "home":
+                tally.home += 1
+            else:
+                tally.away += 1
+
+        self._writer.add((game_id, device_id, side, datetime.utcnow()))
+        return side, True
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def is_game(self, game_id: int) -> bool:
+        """
+        Whether the game exists. Games added after warm-up are looked up once
+        and remembered; raises psycopg2.Error if that lookup fails.
+        """
+        if game_id in self._games:
+            return True
+        with pooled_cursor() as cursor:
+            cursor.execute("SELECT 1 FROM games WHERE id = %s", (game_id,))
+            found = cursor.fetchone() is not None
+        if found:
+            self._games.add(game_id)
+        return found
+
+    def tally(self, game_id: int) -> VoteTally:
+        tally = self._shard(game_id).tallies.get(game_id)
+        return VoteTally(tally.home, tally.away) if tally else VoteTally()
+
+    def has_votes(self, game_id: int) -> bool:
+        return game_id in self._shard(game_id).tallies
+
+    def vote_for(self, game_id: int, device_id: str) -> Optional[Side]:
+        return self._shard(game_id).voters.get((game_id, device_id))
+
+    def lookup(self, device_id: str, game_ids: List[int]) -> List[Tuple[int, Optional[Side], VoteTally]]:
+        """Vote status for many games at once: (game_id, device's side, tally) per game."""
+        results = []
+        for game_id in game_ids:
+            shard = self._shard(game_id)
+            tally = shard.tallies.get(game_id)
+            results.append((
+                game_id,
+                shard.voters.get((game_id, device_id)),
+                VoteTally(tally.home, tally.away) if tally else VoteTally(),
+            ))
+        return results
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def warm(self) -> None:
+        """Load known game ids, persisted tallies and voter keys so dedupe survives restarts."""
+        conn = connect()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id FROM games")
+                self._games = {row["id"] for row in cursor.fetchall()}
+
+                cursor.execute("SELECT game_id, home_votes, away_votes FROM game_vote_tallies")
+                for row in cursor.fetchall():
+                    shard = self._shard(row["game_id"])
+                    shard.tallies[row["game_id"]] = VoteTally(row["home_votes"], row["away_votes"])
+
+                cursor.execute("SELECT game_id, device_id, predicted_winner FROM game_votes")
+                for row in cursor.fetchall():
+                    shard = self._shard(row["game_id"])
+                    shard.voters[(row["game_id"], row["device_id"])] = row["predicted_winner"]
+        finally:
+            conn.close()
+
+    def start(self) -> None:
+        try:
+            self.warm()
+        except Exception:
+            logger.exception("votes: warm-up failed, starting with empty counters")
+        self._writer.start()
+
+    def stop(self) -> None:
+        self._writer.stop()
+
+
+def _persist_votes(batch: List[tuple]) -> None:
+    """Insert a batch of votes and bump the tally rows in one transaction."""
+    with transaction() as cursor:
+        inserted = execute_values(
+            cursor,
+            """
+            INSERT INTO game_votes (game_id, device_id, predicted_winner, created_at)
+            VALUES %s
+            ON CONFLICT (game_id, device_id) DO NOTHING
+            RETURNING game_id, predicted_winner
+            """,
+            batch,
+            fetch=True,
+        )
+
+        # Only rows that were actually inserted count toward the tallies
+        deltas: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+        for row in inserted:
+            deltas[row["game_id"]][0 if row["predicted_winner"] == "home" else 1] += 1
+        if not deltas:
+            return
+
+        execute_values(
+            cursor,
+            """
+            INSERT INTO game_vote_tallies (game_id, home_votes, away_votes)
+            VALUES %s
+            ON CONFLICT (game_id) DO UPDATE SET
+                home_votes = game_vote_tallies.home_votes + EXCLUDED.home_votes,
+                away_votes = game_vote_tallies.away_votes + EXCLUDED.away_votes,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            [(game_id, home, away) for game_id, (home, away) in deltas.items()],
+        )
+
+
+# Process-wide store shared by the vote and game routes
+vote_store = VoteStore()
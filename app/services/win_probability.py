@@ -0,0 +1,214 @@
+"""
+StatIQ Live Win Probability
+Lookup-table model that re-prices a game on every live score/clock update.
+
+The table is built once at import time and indexed by
+(quarter, minutes-remaining bucket, score differential), so an update is a
+couple of list lookups and a single exp() - cheap enough to run for every
+live game on every score change.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# =============================================================================
+# MODEL CONFIGURATION
+# =============================================================================
+QUARTER_MINUTES = 12          # Texas high school quarters are 12 minutes
+REGULATION_QUARTERS = 4
+REGULATION_MINUTES = QUARTER_MINUTES * REGULATION_QUARTERS
+MAX_SCORE_DIFF = 42           # Differentials beyond 6 TDs are clamped
+SCORE_SCALE = 0.45            # Logit per point at one minute remaining
+OT_INDEX = REGULATION_QUARTERS  # Quarter index used for overtime
+
+# =============================================================================
+# PRECOMPUTED TABLES
+# =============================================================================
+
+def _remaining_minutes(quarter_index: int, bucket: int) -> float:
+    """Game minutes left at the midpoint of a (quarter, minute) bucket."""
+    if quarter_index == OT_INDEX:
+        # High school OT is untimed - treat it as a one-possession game
+        return 1.0
+    quarters_left = REGULATION_QUARTERS - 1 - quarter_index
+    return quarters_left * QUARTER_MINUTES + bucket + 0.5
+
+
+def _build_tables() -> Tuple[list, list]:
+    score_logit = []
+    prior_weight = []
+    for q in range(REGULATION_QUARTERS + 1):
+        q_scores = []
+        q_weights = []
+        for bucket in range(QUARTER_MINUTES + 1):
+            remaining = _remaining_minutes(q, bucket)
+            denom = math.sqrt(remaining)
+            q_scores.append([
+                diff * SCORE_SCALE / denom
+                for diff in range(-MAX_SCORE_DIFF, MAX_SCORE_DIFF + 1)
+            ])
+            # The pregame ML prediction fades out linearly as the clock runs
+            q_weights.append(min(1.0, remaining / REGULATION_MINUTES))
+        score_logit.append(q_scores)
+        prior_weight.append(q_weights)
+    return score_logit, prior_weight
+
+
+SCORE_LOGIT_TABLE, PRIOR_WEIGHT_TABLE = _build_tables()
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def parse_clock(quarter: Optional[str], time_remaining: Optional[str]) -> Tuple[int, int, bool]:
+    """
+    Convert the scoreboard strings used by LiveGame/GameDetailResponse
+    ("1Q".."4Q", "OT", "HALFTIME", "FINAL" and "12:34") into
+    (quarter_index, minute_bucket, is_final).
+    """
+    q = (quarter or "1Q").strip().upper()
+
+    if q.startswith("FINAL"):
+        return OT_INDEX if "OT" in q else REGULATION_QUARTERS - 1, 0, True
+    if q == "HALFTIME":
+        return 1, 0, False
+    if q.startswith("OT"):
+        return OT_INDEX, 0, False
+
+    digits = "".join(ch for ch in q if ch.isdigit())
+    quarter_index = min(max(int(digits or 1), 1), REGULATION_QUARTERS) - 1
+
+    bucket = QUARTER_MINUTES
+    if time_remaining and ":" in time_remaining:
+        minutes = time_remaining.split(":", 1)[0]
+        if minutes.strip().isdigit():
+            bucket = min(int(minutes), QUARTER_MINUTES)
+
+    return quarter_index, bucket, False
+
+
+def _logit(pct: float) -> float:
+    p = min(max(pct / 100.0, 0.001), 0.999)
+    return math.log(p / (1.0 - p))
+
+
+def confidence_label(home_pct: float) -> str:
+    """Map a win probability to the "High"/"Medium"/"Low" labels used by Analytics."""
+    edge = max(home_pct, 100.0 - home_pct)
+    if edge >= 80.0:
+        return "High"
+    if edge >= 60.0:
+        return "Medium"
+    return "Low"
+
+
+# =============================================================================
+# LIVE TRACKER
+# =============================================================================
+
+@dataclass
+class LiveWinProbability:
+    home_win_probability: float
+    away_win_probability: float
+    confidence: str
+    last_updated: str
+
+    def to_dict(self) -> dict:
+        return {
+            "home_win_probability": self.home_win_probability,
+            "away_win_probability": self.away_win_probability,
+            "confidence": self.confidence,
+            "last_updated": self.last_updated,
+        }
+
+
+@dataclass
+class _GameState:
+    prior_logit: float
+    key: Optional[Tuple[int, int, int, bool]] = None
+    current: Optional[LiveWinProbability] = None
+    final: bool = False     # Settled; later updates are ignored
+
+
+class WinProbabilityTracker:
+    """
+    Keeps the latest win probability per live game.
+
+    Each game is seeded with its pregame ML prediction; every score update
+    then costs one table lookup. Updates that land in the same
+    (quarter, minute, differential) cell as the previous one return the
+    cached result without recomputing. A final update settles the game:
+    its result is kept, and later updates for it are ignored.
+    """
+
+    def __init__(self):
+        self._games: Dict[int, _GameState] = {}
+        self._lock = threading.Lock()
+
+    def start(self, game_id: int, pregame_home_win_probability: float = 50.0) -> None:
+        with self._lock:
+            self._games[game_id] = _GameState(prior_logit=_logit(pregame_home_win_probability))
+
+    def is_tracking(self, game_id: int) -> bool:
+        return game_id in self._games
+
+    def is_final(self, game_id: int) -> bool:
+        state = self._games.get(game_id)
+        return state is not None and state.final
+
+    def update(
+        self,
+        game_id: int,
+        home_score: int,
+        away_score: int,
+        quarter: Optional[str],
+        time_remaining: Optional[str],
+    ) -> LiveWinProbability:
+        quarter_index, bucket, is_final = parse_clock(quarter, time_remaining)
+        diff = home_score - away_score
+        key = (quarter_index, bucket, diff, is_final)
+
+        with self._lock:
+            state = self._games.get(game_id)
+            if state is None:
+                state = self._games[game_id] = _GameState(prior_logit=_logit(50.0))
+            if state.final or (key == state.key and state.current is not None):
+                return state.current
+
+            if is_final:
+                home_pct = 100.0 if diff > 0 else 0.0 if diff < 0 else 50.0
+            else:
+                clamped = min(max(diff, -MAX_SCORE_DIFF), MAX_SCORE_DIFF)
+                logit = (
+                    SCORE_LOGIT_TABLE[quarter_index][bucket][clamped + MAX_SCORE_DIFF]
+                    + state.prior_logit * PRIOR_WEIGHT_TABLE[quarter_index][bucket]
+                )
+                home_pct = 100.0 / (1.0 + math.exp(-logit))
+
+            home_pct = round(home_pct, 1)
+            result = LiveWinProbability(
+                home_win_probability=home_pct,
+                away_win_probability=round(100.0 - home_pct, 1),
+                confidence=confidence_label(home_pct),
+                last_updated=datetime.utcnow().isoformat(),
+            )
+            state.key = key
+            state.current = result
+            state.final = is_final
+        return result
+
+    def get(self, game_id: int) -> Optional[LiveWinProbability]:
+        state = self._games.get(game_id)
+        return state.current if state else None
+
+    def stop(self, game_id: int) -> None:
+        with self._lock:
+            self._games.pop(game_id, None)
+
+
+# Process-wide tracker shared by the game routes
+live_win_probability = WinProbabilityTracker()
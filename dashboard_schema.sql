@@ -0,0 +1,27 @@
+-- ============================================================================
+-- STATIQ COACH DASHBOARD - DATABASE SCHEMA
+-- Coach-entered inputs to the dashboard. The API rebuilds a team's cached
+-- dashboard payload whenever one of these rows (or a game final) changes.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS player_availability (
+    team_id VARCHAR(64) NOT NULL,
+    jersey_number INTEGER NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    position VARCHAR(20),
+    status VARCHAR(10) NOT NULL CHECK (status IN ('cleared', 'limited', 'out')),
+    note VARCHAR(255),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (team_id, jersey_number)
+);
+
+CREATE TABLE IF NOT EXISTS coach_notes (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    team_id VARCHAR(64) NOT NULL,
+    author VARCHAR(255) NOT NULL,
+    body TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_coach_notes_team_time
+    ON coach_notes(team_id, created_at DESC);
@@ -0,0 +1,14 @@
+-- ============================================================================
+-- STATIQ PLAY-BY-PLAY LOG - DATABASE SCHEMA
+-- Append-only; one compact binary record per play (see app/services/play_log.py)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS game_plays (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    payload BYTEA NOT NULL,
+    PRIMARY KEY (game_id, seq)
+);
+
+-- The primary key serves "plays after seq N" as an index range scan:
+--   SELECT payload FROM game_plays WHERE game_id = :game_id AND seq > :seq ORDER BY seq;
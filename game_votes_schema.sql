@@ -0,0 +1,35 @@
+-- ============================================================================
+-- STATIQ FAN PREDICTION VOTES - DATABASE SCHEMA
+-- One vote per device per game; tallies kept in a counter table so reads
+-- never COUNT(*) over game_votes.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS game_votes (
+    id BIGSERIAL PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    device_id VARCHAR(128) NOT NULL,
+    predicted_winner VARCHAR(4) NOT NULL CHECK (predicted_winner IN ('home', 'away')),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (game_id, device_id)
+);
+
+-- ============================================================================
+-- VOTE TALLIES
+-- Incremented by the API's batch writer in the same transaction as the inserts
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS game_vote_tallies (
+    game_id INTEGER PRIMARY KEY REFERENCES games(id) ON DELETE CASCADE,
+    home_votes INTEGER NOT NULL DEFAULT 0,
+    away_votes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Backfill tallies for votes that existed before the counter table
+INSERT INTO game_vote_tallies (game_id, home_votes, away_votes)
+SELECT
+    game_id,
+    COUNT(*) FILTER (WHERE predicted_winner = 'home'),
+    COUNT(*) FILTER (WHERE predicted_winner = 'away')
+FROM game_votes
+GROUP BY game_id
+ON CONFLICT (game_id) DO NOTHING;
@@ -0,0 +1,39 @@
+-- ============================================================================
+-- STATIQ PLAYOFF GAMES - DATABASE SCHEMA
+-- Every conference's playoff bracket, one row per game. Teams are stored on
+-- the row (bracket JSON ids, names and seeds) so placeholder slots such as
+-- "Winner G61" need no teams row. The API loads the whole table in one query
+-- at startup and writes score updates and advanced winners back.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS playoff_games (
+    id INTEGER PRIMARY KEY,
+    conference VARCHAR(20) NOT NULL,  -- '5A D1', '6A D2', ...
+    game_id VARCHAR(10) NOT NULL,  -- 'G1' .. 'G64', unique within a conference
+    round VARCHAR(50) NOT NULL,
+    region INTEGER NOT NULL DEFAULT 0,  -- 0 for state semifinals and final
+
+    home_team_id INTEGER,
+    home_team_name VARCHAR(255),
+    home_team_mascot VARCHAR(100),
+    home_seed VARCHAR(10),
+    away_team_id INTEGER,
+    away_team_name VARCHAR(255),
+    away_team_mascot VARCHAR(100),
+    away_seed VARCHAR(10),
+
+    -- game_id whose winner fills each slot; NULL for first-round games
+    home_feeder VARCHAR(10),
+    away_feeder VARCHAR(10),
+
+    home_score INTEGER,
+    away_score INTEGER,
+    status VARCHAR(20) NOT NULL DEFAULT 'scheduled',  -- 'scheduled', 'live', 'final'
+    kickoff_at TIMESTAMP,
+    location VARCHAR(255) NOT NULL DEFAULT 'TBD',
+    notes TEXT,
+    broadcaster VARCHAR(100),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    UNIQUE (conference, game_id)
+);
@@ -0,0 +1,26 @@
+-- ============================================================================
+-- STATIQ POWER RANKINGS - DATABASE SCHEMA
+-- Output of scripts/compute_power_rankings.py: one row per team per season,
+-- replaced on every run. Read by the rankings, scores and team endpoints.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS power_rankings (
+    season VARCHAR(10) NOT NULL,
+    team_id INTEGER NOT NULL REFERENCES teams(id) ON DELETE CASCADE,
+    classification VARCHAR(20),
+    rank INTEGER NOT NULL,                  -- Within the classification
+    state_rank INTEGER NOT NULL,            -- Across every Texas team
+    previous_rank INTEGER,                  -- rank on the previous run, NULL if new
+    power_rating REAL NOT NULL,             -- Points better than an average team on a neutral field
+    sos REAL NOT NULL,                      -- Mean power_rating of opponents played
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    point_diff INTEGER NOT NULL DEFAULT 0,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    is_incomplete BOOLEAN NOT NULL DEFAULT FALSE,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (season, team_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_power_rankings_class_rank
+    ON power_rankings(season, classification, rank);
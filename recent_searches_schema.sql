@@ -0,0 +1,16 @@
+-- ============================================================================
+-- STATIQ RECENT SEARCHES - DATABASE SCHEMA
+-- Per-device search history, capped at 10 rows per device by the API's batch
+-- writer. One row per normalized query; repeats only bump searched_at.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS recent_searches (
+    device_id VARCHAR(128) NOT NULL,
+    query_key VARCHAR(100) NOT NULL,
+    query VARCHAR(100) NOT NULL,
+    searched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (device_id, query_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_recent_searches_device_time
+    ON recent_searches(device_id, searched_at DESC);
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+StatIQ Bracket Odds Benchmark
+Builds a full 64-team, six-round bracket with random team ratings and times
+Monte Carlo advancement odds three ways: one Python pass per simulation, the
+vectorized engine, and the vectorized engine split across worker processes.
+Checks that the per-pass and vectorized champion odds agree.
+
+Usage: python scripts/bench_bracket_odds.py [simulations] [processes]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+
+from app.services.bracket import Bracket, BracketGame, BracketTeam  # noqa: E402
+from app.services.bracket_odds import POINTS_PER_LOGIT, compile_plan, simulate, worker_pool  # noqa: E402
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+SIMULATIONS = 200_000
+PYTHON_SIMULATIONS = 20_000   # The per-pass loop is too slow to run at full size
+SEED = 44
+ROUNDS = ["Bi-District", "Area", "Regional Quarterfinal", "Regional Semifinal",
+          "Regional Final", "State Semifinal", "State Championship"]
+
+
+def synthetic_bracket() -> tuple:
+    """64 teams, G1..G63 with each game fed by the two before it in the previous round."""
+    rng = random.Random(SEED)
+    ratings = {team_id: rng.gauss(0, 10) for team_id in range(1, 65)}
+    games, number, previous = [], 1, []
+    for r, name in enumerate(ROUNDS[:6]):
+        current = []
+        for i in range(32 >> r):
+            game = BracketGame(id=1000 + number, game_id=f"G{number}", round=name, region=1 + i * 4 // (32 >> r))
+            if r == 0:
+                game.home_team = BracketTeam(2 * i + 1, f"Team {2 * i + 1}")
+                game.away_team = BracketTeam(2 * i + 2, f"Team {2 * i + 2}")
+            else:
+                game.home_feeder, game.away_feeder = previous[2 * i], previous[2 * i + 1]
+            games.append(game)
+            current.append(game.game_id)
+            number += 1
+        previous = current
+    return Bracket("BENCH", games), ratings
+
+
+def python_champions(bracket: Bracket, ratings: dict, simulations: int) -> np.ndarray:
+    rng = random.Random(SEED)
+    _, rounds = bracket.view()
+    champions = np.zeros(65)
+    for _ in range(simulations):
+        winners = {}
+        for _, games in rounds:
+            for game in games:
+                home = winners.get(game.home_feeder, game.home_team.id)
+                away = winners.get(game.away_feeder, game.away_team.id)
+                p = 1.0 / (1.0 + math.exp(-(ratings[home] - ratings[away]) / POINTS_PER_LOGIT))
+                winners[game.game_id] = home if rng.random() < p else away
+        champions[winners["G63"]] += 1
+    return champions / simulations
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<44} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+    return result
+
+
+def main():
+    simulations = int(sys.argv[1]) if len(sys.argv) > 1 else SIMULATIONS
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    bracket, ratings = synthetic_bracket()
+    _, plan = compile_plan(bracket, ratings)
+    simulate(plan, 1_000, seed=SEED)  # Warm up NumPy before timing
+
+    python_odds = timed(f"python loop: {PYTHON_SIMULATIONS:,} passes",
+                        lambda: python_champions(bracket, ratings, PYTHON_SIMULATIONS))
+    timed(f"vectorized: {PYTHON_SIMULATIONS:,} passes", lambda: simulate(plan, PYTHON_SIMULATIONS, seed=SEED))
+    counts = timed(f"vectorized: {simulations:,} passes", lambda: simulate(plan, simulations, seed=SEED))
+    with worker_pool(processes) as pool:
+        list(pool.map(int, range(processes)))  # Spawn the workers before timing
+        timed(f"vectorized x{processes} processes: {simulations:,} passes",
+              lambda: simulate(plan, simulations, pool=pool, seed=SEED))
+
+    vector_odds = np.zeros(65)
+    for index, team in enumerate(plan.teams, start=1):
+        vector_odds[team.id] = counts[-1][index] / simulations
+    worst = np.abs(vector_odds - python_odds).max()
+    print(f"\nlargest champion-odds gap vs python loop: {worst * 100:.2f} pts")
+    assert worst < 0.03
+    assert counts[0].sum() == 64 * simulations  # every team plays in round one every pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+StatIQ Play Log Benchmark
+Replays a synthetic 150-play game through the append-only play log and
+times appends, compact encode/decode, and "plays after seq N" range reads.
+
+Usage: python scripts/bench_play_log.py
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.play_log import GamePlayLog, decode_play, encode_play  # noqa: E402
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+GAME_ID = 8
+PLAY_COUNT = 150
+ROUNDS = 200  # Full replays per measurement
+SEED = 26
+
+
+def synthetic_game(count: int = PLAY_COUNT) -> list:
+    """Build a plausible sequence of plays with a running score and clock."""
+    rng = random.Random(SEED)
+    teams = [("16", "Highland Park"), ("15", "Lovejoy")]
+    home = away = 0
+    plays = []
+    for i in range(count):
+        quarter = min(i * 4 // count + 1, 4)
+        clock = max(720 - (i % (count // 4)) * 19, 0)
+        team_id, team_name = teams[(i // 6) % 2]
+        play_type = rng.choice(["rush", "rush", "pass", "incomplete", "sack", "punt"])
+        yards = rng.randint(-5, 25) if play_type in ("rush", "pass") else 0
+        scoring = rng.random() < 0.05
+        if scoring:
+            if team_id == "16":
+                home += 7
+            else:
+                away += 7
+        plays.append(dict(
+            quarter=quarter,
+            clock_seconds=clock,
+            team_id=team_id,
+            team_name=team_name,
+            play_type=play_type,
+            yards=yards,
+            description=f"{team_name} {play_type} for {yards} yards",
+            is_scoring_play=scoring,
+            home_score_after=home,
+            away_score_after=away,
+            player_id=f"player-{team_id}-{rng.randint(1, 11)}",
+            target_id=f"player-{team_id}-{rng.randint(12, 20)}" if play_type == "pass" else None,
+            defender_id=f"player-x-{rng.randint(21, 40)}" if play_type in ("rush", "sack") else None,
+        ))
+    return plays
+
+
+def timed(label: str, fn, ops: int) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:9.2f} ms total  {elapsed / ops * 1e6:8.2f} us/op")
+
+
+def main():
+    plays = synthetic_game()
+    logs = []
+
+    def replay():
+        for _ in range(ROUNDS):
+            log = GamePlayLog(GAME_ID)
+            for fields in plays:
+                log.append(**dict(fields))
+            logs.append(log)
+
+    timed("append", replay, ROUNDS * PLAY_COUNT)
+
+    log = logs[-1]
+    events = log.after(0)
+    encoded = []
+
+    def encode():
+        encoded.clear()
+        for _ in range(ROUNDS):
+            encoded[:] = [encode_play(p) for p in events]
+
+    timed("encode", encode, ROUNDS * PLAY_COUNT)
+    timed("decode", lambda: [decode_play(GAME_ID, b) for _ in range(ROUNDS) for b in encoded], ROUNDS * PLAY_COUNT)
+
+    # A live client polling after every play: read everything after its last seq
+    def poll():
+        for _ in range(ROUNDS):
+            for seq in range(PLAY_COUNT):
+                log.after(seq)
+
+    timed("range read (after seq N)", poll, ROUNDS * PLAY_COUNT)
+
+    binary_bytes = sum(len(b) for b in encoded)
+    json_bytes = sum(len(json.dumps(p.to_dict())) for p in events)
+    print(f"\n{PLAY_COUNT} plays: {binary_bytes} bytes packed vs {json_bytes} bytes JSON "
+          f"({binary_bytes / PLAY_COUNT:.0f} vs {json_bytes / PLAY_COUNT:.0f} bytes/play)")
+
+    assert [decode_play(GAME_ID, b) for b in encoded] == events
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+StatIQ Player Stats Benchmark
+Loads statewide-size synthetic season stats into the columnar store and
+times "top 10 rushers in 5A-D1" and a derived rushing_avg leaderboard
+against the same queries walked over per-player dicts.
+
+Usage: python scripts/bench_player_stats.py [player_count]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.player_stats import PlayerStatsStore  # noqa: E402
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+PLAYER_COUNT = 100_000
+REPEATS = 50
+SEED = 39
+CLASSIFICATIONS = ["6A-D1", "6A-D2", "5A-D1", "5A-D2", "4A-D1", "4A-D2"]
+
+
+def synthetic_players(count: int) -> list:
+    rng = random.Random(SEED)
+    players = []
+    for i in range(count):
+        attempts = rng.randint(0, 250) if rng.random() < 0.3 else 0
+        players.append({
+            "id": f"p{i}",
+            "classification": rng.choice(CLASSIFICATIONS),
+            "district": str(rng.randint(1, 16)),
+            "stats": {
+                "rushing_attempts": attempts,
+                "rushing_yards": int(attempts * rng.uniform(1, 8)),
+                "rushing_tds": attempts // 25,
+                "receptions": rng.randint(0, 60),
+                "receiving_yards": rng.randint(0, 900),
+            },
+        })
+    return players
+
+
+def dict_leaders(players: list, classification: str, limit: int = 10) -> list:
+    rows = [(p["stats"]["rushing_yards"], p["id"]) for p in players
+            if p["classification"] == classification and p["stats"]["rushing_yards"]]
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def dict_avg_leaders(players: list, limit: int = 10) -> list:
+    rows = []
+    for p in players:
+        stats = p["stats"]
+        if stats["rushing_attempts"] >= 50:
+            rows.append((round(stats["rushing_yards"] / stats["rushing_attempts"], 2), p["id"]))
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    elapsed = (time.perf_counter() - start) / REPEATS
+    print(f"{label:<40} {elapsed * 1e3:9.3f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else PLAYER_COUNT
+    players = synthetic_players(count)
+
+    store = PlayerStatsStore()
+    start = time.perf_counter()
+    for p in players:
+        store.register(p["id"], classification=p["classification"], district=p["district"])
+        store.set(p["id"], p["stats"])
+    print(f"loaded {count:,} players in {time.perf_counter() - start:.2f} s\n")
+
+    timed("dict walk: top rushers 5A-D1", lambda: dict_leaders(players, "5A-D1"))
+    timed("columnar: top rushers 5A-D1", lambda: store.leaders("rushing_yards", 10, classification="5A-D1"))
+    timed("dict walk: top rushing_avg (50+ att)", lambda: dict_avg_leaders(players))
+    timed("columnar: top rushing_avg (50+ att)", lambda: store.leaders("rushing_avg", 10, min_denominator=50))
+
+    expected = [value for value, _ in dict_leaders(players, "5A-D1")]
+    assert [value for _, value in store.leaders("rushing_yards", 10, classification="5A-D1")] == expected
+    expected = [value for value, _ in dict_avg_leaders(players)]
+    assert [value for _, value in store.leaders("rushing_avg", 10, min_denominator=50)] == expected
+
+
+if __name__ == "__main__":
+    main()
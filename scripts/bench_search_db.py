@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+StatIQ Statewide Search Load Test
+Seeds a scratch schema with statewide roster volumes (teams, players,
+coaches), applies search_schema.sql to it, then hammers the unified ranked
+search query from concurrent threads and reports p50/p95/p99 latency.
+
+Runs against the database from DB_HOST/DB_NAME/DB_USER/DB_PASSWORD but only
+touches the `search_bench` schema, which is dropped afterwards unless
+--keep is given.
+
+Usage: python scripts/bench_search_db.py [--teams 1400] [--threads 8] [--seconds 20] [--keep]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from psycopg2.extras import execute_values  # noqa: E402
+
+from app.db import connect  # noqa: E402
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+SCHEMA = "search_bench"
+PLAYERS_PER_TEAM = 70
+COACHES_PER_TEAM = 12
+LIMIT = 20
+SEED = 35
+
+FIRST = ["Aaron", "Brayden", "Cash", "Dylan", "Esteban", "Gavin", "Jaxon", "Kade", "Lucas", "Malachi",
+         "Noah", "Ryan", "Taji", "Trey", "Tyler", "Will", "Carson", "Colin", "Isaiah", "Jayden"]
+LAST = ["Martinez", "Payne", "Criner", "Spann", "Salas", "McManus", "Wells", "Boone", "Liles", "Berry",
+        "Shuler", "Winsett", "Matthews", "Pennell", "Evans", "Lentz", "Kilcoin", "Leeman", "Garcia", "Nguyen"]
+TOWNS = ["Highland Park", "Joshua", "Red Oak", "Tyler", "Midlothian", "Cleburne", "Aledo", "Lovejoy",
+         "Denton Ryan", "Frisco", "Cedar Park", "Amarillo", "El Paso", "Waco", "Katy", "Allen"]
+MASCOTS = ["Scots", "Owls", "Hawks", "Lions", "Panthers", "Yellow Jackets", "Bearcats", "Eagles"]
+POSITIONS = ["QB", "RB", "WR", "TE", "OL", "DL", "LB", "DB", "K", "Slot"]
+TITLES = ["Head Coach", "DC", "OC", "OL", "LB", "QB", "WR", "DB", "Special Teams"]
+
+# What the search screen sends: keystroke prefixes, full names, typos
+QUERIES = ["h", "hi", "hig", "highland", "highland park", "jos", "joshua", "mid", "midlothian",
+           "mar", "martinez", "kade boone", "23", "owls", "midlothain", "martinz", "zzzz"]
+
+BENCH_SCHEMA_SQL = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+SET search_path = {SCHEMA}, public;
+CREATE TABLE schools (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255),
+    classification VARCHAR(10)
+);
+CREATE TABLE teams (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255),
+    mascot VARCHAR(100),
+    wins INTEGER DEFAULT 0,
+    losses INTEGER DEFAULT 0,
+    school_id INTEGER REFERENCES schools(id)
+);
+"""
+
+
+def seed(team_count: int) -> None:
+    rng = random.Random(SEED)
+    conn = connect()
+    try:
+        with conn, conn.cursor() as cursor:
+            cursor.execute(BENCH_SCHEMA_SQL)
+            schools = [(f"{rng.choice(TOWNS)} {i}", rng.choice(["6A", "5A-D1", "5A-D2", "4A-D1"]))
+                       for i in range(team_count)]
+            execute_values(cursor, "INSERT INTO schools (name, classification) VALUES %s", schools)
+            execute_values(cursor, "INSERT INTO teams (name, mascot, wins, losses, school_id) VALUES %s", [
+                (name, rng.choice(MASCOTS), rng.randint(0, 10), rng.randint(0, 10), i + 1)
+                for i, (name, _) in enumerate(schools)
+            ])
+
+            # Rosters need the migration's tables
+            cursor.execute((ROOT / "search_schema.sql").read_text())
+
+            players = [(team_id, f"{rng.choice(FIRST)} {rng.choice(LAST)}", str(rng.randint(0, 99)), rng.choice(POSITIONS))
+                       for team_id in range(1, team_count + 1) for _ in range(PLAYERS_PER_TEAM)]
+            execute_values(cursor, "INSERT INTO players (team_id, name, number, position) VALUES %s",
+                           players, page_size=5000)
+            coaches = [(team_id, f"{rng.choice(FIRST)} {rng.choice(LAST)}", rng.choice(TITLES))
+                       for team_id in range(1, team_count + 1) for _ in range(COACHES_PER_TEAM)]
+            execute_values(cursor, "INSERT INTO coaches (team_id, name, title) VALUES %s",
+                           coaches, page_size=5000)
+            cursor.execute("ANALYZE teams; ANALYZE players; ANALYZE coaches;")
+        print(f"seeded {team_count:,} teams, {len(players):,} players, {len(coaches):,} coaches")
+    finally:
+        conn.close()
+
+
+def drop() -> None:
+    conn = connect()
+    try:
+        with conn, conn.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        conn.close()
+
+
+def percentile(samples: list, pct: float) -> float:
+    return samples[max(int(len(samples) * pct) - 1, 0)]
+
+
+def load(threads: int, seconds: float) -> None:
+    # The pool is created lazily on first use, after this is set
+    os.environ["PGOPTIONS"] = f"-c search_path={SCHEMA},public"
+    from app.services.search_db import search_database
+
+    for query in QUERIES:
+        search_database(query, limit=LIMIT)  # Warm the pool and the buffer cache
+
+    samples = {query: [] for query in QUERIES}
+    deadline = time.perf_counter() + seconds
+
+    def worker(n: int):
+        rng = random.Random(SEED + n)
+        while time.perf_counter() < deadline:
+            query = rng.choice(QUERIES)
+            t0 = time.perf_counter()
+            search_database(query, limit=LIMIT)
+            samples[query].append(time.perf_counter() - t0)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+    everything = sorted(s for query_samples in samples.values() for s in query_samples)
+    print(f"\n{threads} threads x {seconds:.0f} s: {len(everything):,} queries "
+          f"({len(everything) / seconds:,.0f} qps), limit={LIMIT}")
+    print(f"{'query':<16} {'count':>7} {'median':>11} {'p99':>11}")
+    for query in QUERIES:
+        query_samples = sorted(samples[query])
+        if query_samples:
+            print(f"{query!r:<16} {len(query_samples):>7} {statistics.median(query_samples) * 1e3:>8.2f} ms "
+                  f"{percentile(query_samples, 0.99) * 1e3:>8.2f} ms")
+    print(f"\n{'all':<16} p50 {percentile(everything, 0.50) * 1e3:.2f} ms  "
+          f"p95 {percentile(everything, 0.95) * 1e3:.2f} ms  p99 {percentile(everything, 0.99) * 1e3:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test statewide Postgres search')
+    parser.add_argument('--teams', type=int, default=1400, help='Teams to seed (rosters scale with it)')
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent clients')
+    parser.add_argument('--seconds', type=float, default=20, help='Load duration')
+    parser.add_argument('--keep', action='store_true', help=f'Keep the {SCHEMA} schema afterwards')
+    args = parser.parse_args()
+
+    seed(args.teams)
+    try:
+        load(args.threads, args.seconds)
+    finally:
+        if not args.keep:
+            drop()
+
+
+if __name__ == "__main__":
+    main()
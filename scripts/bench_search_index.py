@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+StatIQ Search Index Benchmark
+Builds the n-gram search index over 100k synthetic teams, players and
+coaches and times queries of different lengths, then replays
+search-as-you-type keystrokes through the per-prefix result cache.
+
+Usage: python scripts/bench_search_index.py [entity_count]
+"""
+
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.search_cache import SearchCache  # noqa: E402
+from app.services.search_index import SearchIndex  # noqa: E402
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+ENTITY_COUNT = 100_000
+QUERY_REPEATS = 200
+LIMIT = 20
+SEED = 31
+
+FIRST = ["Aaron", "Brayden", "Cash", "Dylan", "Esteban", "Gavin", "Jaxon", "Kade", "Lucas",
+         "Malachi", "Noah", "Ryan", "Taji", "Trey", "Tyler", "Will", "Carson", "Colin"]
+LAST = ["Martinez", "Payne", "Criner", "Spann", "Salas", "McManus", "Wells", "Boone", "Liles",
+        "Berry", "Shuler", "Winsett", "Matthews", "Pennell", "Evans", "Lentz", "Kilcoin", "Leeman"]
+TOWNS = ["Highland Park", "Joshua", "Red Oak", "Tyler", "Midlothian", "Cleburne", "Aledo",
+         "Lovejoy", "Denton Ryan", "Frisco", "Cedar Park", "Amarillo", "El Paso", "Waco"]
+MASCOTS = ["Scots", "Owls", "Hawks", "Lions", "Panthers", "Yellow Jackets", "Bearcats", "Eagles"]
+TITLES = ["Head Coach", "DC", "OC", "OL", "LB", "QB", "WR", "DB", "Special Teams"]
+
+QUERIES = ["a", "hi", "high", "highland park", "martinez", "mart", "23", "owls", "zzzz",
+           "midlothain", "lovejoi", "martinz"]
+
+# Words typed one keystroke at a time; each prefix is a request
+TYPED = ["highland park", "joshua", "midlothian", "martinez", "lovejoy", "kilcoin 4"]
+KEYSTROKE_ROUNDS = 50
+
+
+def build(count: int) -> SearchIndex:
+    rng = random.Random(SEED)
+    index = SearchIndex()
+    teams = max(count // 60, 1)
+    for i in range(teams):
+        name = f"{rng.choice(TOWNS)} {i}"
+        index.add("team", f"t{i}", (name, rng.choice(MASCOTS)), {"type": "team", "id": f"t{i}", "name": name})
+    for i in range(count - teams):
+        name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+        if i % 12 == 0:
+            index.add("coach", f"c{i}", (name, rng.choice(TITLES)), {"type": "coach", "id": f"c{i}", "name": name})
+        else:
+            number = str(rng.randint(0, 99))
+            index.add("player", f"p{i}", (name, number), {"type": "player", "id": f"p{i}", "name": name})
+    return index
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ENTITY_COUNT
+
+    start = time.perf_counter()
+    index = build(count)
+    print(f"built index over {len(index):,} entities in {time.perf_counter() - start:.2f} s\n")
+
+    print(f"limit={LIMIT}")
+    print(f"{'query':<16} {'hits':>8} {'median':>12} {'p99':>12}")
+    for query in QUERIES:
+        samples = []
+        hits = 0
+        for _ in range(QUERY_REPEATS):
+            t0 = time.perf_counter()
+            hits = len(index.search(query, limit=LIMIT))
+            samples.append(time.perf_counter() - t0)
+        samples.sort()
+        p99 = samples[int(len(samples) * 0.99) - 1]
+        print(f"{query!r:<16} {hits:>8} {statistics.median(samples) * 1e3:>9.3f} ms {p99 * 1e3:>9.3f} ms")
+
+    keystrokes = [word[:end] for word in TYPED for end in range(1, len(word) + 1)]
+    requests = KEYSTROKE_ROUNDS * len(keystrokes)
+
+    start = time.perf_counter()
+    for _ in range(KEYSTROKE_ROUNDS):
+        for prefix in keystrokes:
+            index.search(prefix, limit=LIMIT)
+    uncached = time.perf_counter() - start
+
+    cache = SearchCache(index)
+    start = time.perf_counter()
+    for _ in range(KEYSTROKE_ROUNDS):
+        for prefix in keystrokes:
+            cache.search(prefix, limit=LIMIT)
+    cached = time.perf_counter() - start
+
+    print(f"\n{requests:,} keystroke requests")
+    print(f"{'uncached':<16} {uncached / requests * 1e6:>9.2f} us/request")
+    print(f"{'cached':<16} {cached / requests * 1e6:>9.2f} us/request  {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+StatIQ Power Rankings Job
+Rates every team from the season's final scores in the games table (a
+sparse margin-of-victory least-squares fit) and replaces the season's rows
+in power_rankings. Each team's rank from the previous run is carried over
+as previous_rank, so run it once a week after the Friday/Saturday imports.
+
+The API re-reads the table within ten minutes (see RELOAD_INTERVAL).
+
+Usage:
+    python scripts/compute_power_rankings.py                 # current season
+    python scripts/compute_power_rankings.py --season 2024
+    python scripts/compute_power_rankings.py --dry-run --top 25
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.box_scores import CURRENT_SEASON  # noqa: E402
+from app.services.power_rankings import compute_rankings, load_season, write_rankings  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute power rankings into power_rankings')
+    parser.add_argument('--season', default=CURRENT_SEASON, help='Season year (default: %(default)s)')
+    parser.add_argument('--top', type=int, default=10, help='Teams to print per classification')
+    parser.add_argument('--dry-run', action='store_true', help='Compute and print without writing')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    classifications, games, previous = load_season(args.season)
+    loaded = time.perf_counter()
+    rankings = compute_rankings(classifications, games, previous)
+    solved = time.perf_counter()
+    print(f"Loaded {len(classifications):,} teams and {len(games):,} finals in {loaded - start:.2f} s")
+    print(f"Rated and ranked in {solved - loaded:.2f} s\n")
+
+    by_class = {}
+    for ranking in rankings:
+        by_class.setdefault(ranking.classification or "Unclassified", []).append(ranking)
+    for classification, ranked in sorted(by_class.items()):
+        print(f"{classification} ({len(ranked)} teams)")
+        for ranking in sorted(ranked, key=lambda r: r.rank)[:args.top]:
+            print(f"  {ranking.rank:>3}. team {ranking.team_id:<6} {ranking.power_rating:+7.2f}  "
+                  f"{ranking.wins}-{ranking.losses}  SOS {ranking.sos:+.2f}")
+
+    if args.dry_run:
+        print("\nDRY RUN: nothing written")
+        return
+
+    written = write_rankings(args.season, rankings)
+    print(f"\nWrote {written:,} rankings for {args.season}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+StatIQ Bracket Loader
+Parses playoff bracket JSON files (bracket_output.json format, one bracket
+or a list per file) and bulk-upserts every conference into playoff_games in
+a single transaction. Recorded scores and advanced winners already in the
+table are kept over a file's empty slots.
+
+The API picks the new rows up on its next startup warm-up.
+
+Usage:
+    python scripts/load_brackets.py                          # bracket_output.json
+    python scripts/load_brackets.py brackets/ 6a_d1.json     # files and directories
+    python scripts/load_brackets.py --dry-run                # parse and summarize only
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.bracket import Bracket  # noqa: E402
+from app.services.bracket_loader import DEFAULT_BRACKET_FILES, read_bracket_files, upsert_brackets  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load playoff bracket JSON into playoff_games')
+    parser.add_argument('paths', nargs='*', type=Path, default=DEFAULT_BRACKET_FILES,
+                        help='Bracket JSON files or directories of them')
+    parser.add_argument('--dry-run', action='store_true', help='Parse and summarize without writing')
+    args = parser.parse_args()
+
+    by_conference = read_bracket_files(args.paths)
+    if not by_conference:
+        print("No brackets found")
+        return
+
+    for conference, games in sorted(by_conference.items()):
+        bracket = Bracket(conference, games)  # Links feeders the way the API will
+        linked = sum(1 for game in bracket.games() if game.next_game is not None)
+        rounds = len({game.round for game in games})
+        print(f"{conference:<8} {len(games):>3} games, {rounds} rounds, {linked} feeding a later game")
+
+    if args.dry_run:
+        print("\nDRY RUN: nothing written")
+        return
+
+    written = upsert_brackets(by_conference)
+    print(f"\nUpserted {written} playoff games across {len(by_conference)} conference(s)")
+
+
+if __name__ == "__main__":
+    main()
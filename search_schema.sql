@@ -0,0 +1,66 @@
+-- ============================================================================
+-- STATIQ STATEWIDE SEARCH - DATABASE SCHEMA
+-- Full-text (tsvector) and trigram indexes over teams, players and coaches so
+-- /api/v1/search never runs ILIKE '%q%' scans across every roster.
+-- Run with: sudo -u postgres psql -d statiq -f search_schema.sql
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================================
+-- ROSTERS
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS players (
+    id SERIAL PRIMARY KEY,
+    team_id INTEGER NOT NULL REFERENCES teams(id) ON DELETE CASCADE,
+    name VARCHAR(255) NOT NULL,
+    number VARCHAR(4),
+    position VARCHAR(16),
+    class VARCHAR(16),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS coaches (
+    id SERIAL PRIMARY KEY,
+    team_id INTEGER NOT NULL REFERENCES teams(id) ON DELETE CASCADE,
+    name VARCHAR(255) NOT NULL,
+    title VARCHAR(100),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_players_team ON players(team_id);
+CREATE INDEX IF NOT EXISTS idx_coaches_team ON coaches(team_id);
+
+-- ============================================================================
+-- SEARCH VECTORS
+-- 'simple' config: names are not English words, so no stemming or stop words.
+-- Generated columns stay current on every INSERT/UPDATE without triggers.
+-- ============================================================================
+ALTER TABLE teams ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(mascot, ''))
+    ) STORED;
+
+ALTER TABLE players ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(number, '') || ' ' || coalesce(position, ''))
+    ) STORED;
+
+ALTER TABLE coaches ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(title, ''))
+    ) STORED;
+
+-- Word-prefix matches ("park:*")
+CREATE INDEX IF NOT EXISTS idx_teams_search_vector ON teams USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_players_search_vector ON players USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_coaches_search_vector ON coaches USING GIN (search_vector);
+
+-- Prefix/substring LIKE and typo (%) matches on the display name
+CREATE INDEX IF NOT EXISTS idx_teams_name_trgm ON teams USING GIN (lower(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_players_name_trgm ON players USING GIN (lower(name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_coaches_name_trgm ON coaches USING GIN (lower(name) gin_trgm_ops);
+
+ANALYZE teams;
+ANALYZE players;
+ANALYZE coaches;
@@ -0,0 +1,49 @@
+-- ============================================================================
+-- STATIQ SEASON STATS - DATABASE SCHEMA
+-- Season totals maintained incrementally by the API's box-score aggregator.
+-- Rows are upserted with current values; never recomputed from play logs.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS team_season_stats (
+    season VARCHAR(4) NOT NULL,
+    team_id VARCHAR(64) NOT NULL,
+    team_name VARCHAR(255),
+    games_played INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+    points_allowed INTEGER NOT NULL DEFAULT 0,
+    passing_yards INTEGER NOT NULL DEFAULT 0,
+    rushing_yards INTEGER NOT NULL DEFAULT 0,
+    yards_allowed INTEGER NOT NULL DEFAULT 0,
+    plays INTEGER NOT NULL DEFAULT 0,
+    turnovers INTEGER NOT NULL DEFAULT 0,
+    takeaways INTEGER NOT NULL DEFAULT 0,
+    sacks REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (season, team_id)
+);
+
+CREATE TABLE IF NOT EXISTS player_season_stats (
+    season VARCHAR(4) NOT NULL,
+    player_id VARCHAR(64) NOT NULL,
+    team_id VARCHAR(64),
+    games_played INTEGER NOT NULL DEFAULT 0,
+    passing_yards INTEGER NOT NULL DEFAULT 0,
+    passing_completions INTEGER NOT NULL DEFAULT 0,
+    passing_attempts INTEGER NOT NULL DEFAULT 0,
+    passing_tds INTEGER NOT NULL DEFAULT 0,
+    passing_ints INTEGER NOT NULL DEFAULT 0,
+    rushing_yards INTEGER NOT NULL DEFAULT 0,
+    rushing_carries INTEGER NOT NULL DEFAULT 0,
+    rushing_tds INTEGER NOT NULL DEFAULT 0,
+    receptions INTEGER NOT NULL DEFAULT 0,
+    receiving_yards INTEGER NOT NULL DEFAULT 0,
+    receiving_tds INTEGER NOT NULL DEFAULT 0,
+    tackles INTEGER NOT NULL DEFAULT 0,
+    sacks REAL NOT NULL DEFAULT 0,
+    interceptions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (season, player_id)
+);
+
+-- Added after the first release
+ALTER TABLE player_season_stats ADD COLUMN IF NOT EXISTS games_played INTEGER NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_player_season_stats_team ON player_season_stats(season, team_id);
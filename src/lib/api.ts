@@ -726,7 +726,8 @@ export async function search(query: string): Promise<SearchResult[]> {
  * Get recent searches for current user
  */
 export async function getRecentSearches(): Promise<string[]> {
-  const resp = await fetch(`${API_BASE}/search/recent`, { headers: ngrokHeaders });
+  const deviceId = await getOrCreateDeviceId();
+  const resp = await fetch(`${API_BASE}/search/recent?device_id=${encodeURIComponent(deviceId)}`, { headers: ngrokHeaders });
   return parseJSON<string[]>(resp);
 }
 
@@ -734,10 +735,11 @@ export async function getRecentSearches(): Promise<string[]> {
  * Save a recent search
  */
 export async function saveRecentSearch(query: string): Promise<void> {
+  const deviceId = await getOrCreateDeviceId();
   await fetch(`${API_BASE}/search/recent`, {
     method: "POST",
     headers: { ...ngrokHeaders, "Content-Type": "application/json" },
-    body: JSON.stringify({ query }),
+    body: JSON.stringify({ device_id: deviceId, query }),
   });
 }
 
@@ -37,8 +37,8 @@ export interface DashboardPayload {
     points_per_game: number;
     yards_per_game: number;
     turnover_margin: string;
-    third_down_pct: number;
-    red_zone_efficiency: number;
+    third_down_pct: number | null;
+    red_zone_efficiency: number | null;
   };
   coach_notes: Array<{
     id: string;
@@ -46,4 +46,5 @@ export interface DashboardPayload {
     body: string;
     created_at: string;
   }>;
+  stale_sections: string[];
 }
\ No newline at end of file
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.routes import playoff_bracket
+from app.api.v1.routes.moderation import verify_admin
+from app.services import bracket as bracket_module
+from app.services.bracket import TBD, Bracket, BracketGame, BracketStore, BracketTeam
+
+A, B, C, D = (BracketTeam(i, name) for i, name in enumerate(["Aledo", "Mansfield", "Lovejoy", "Frisco"], start=1))
+
+
+def four_team_games():
+    return [
+        BracketGame(id=101, game_id="G1", round="Area", region=1, home_team=A, away_team=B),
+        BracketGame(id=102, game_id="G2", round="Area", region=1, home_team=C, away_team=D),
+        BracketGame(id=103, game_id="G3", round="Regional Final", region=1, home_feeder="G1", away_feeder="G2"),
+    ]
+
+
+def test_final_moves_the_winner_into_the_next_slot():
+    bracket = Bracket("5A D1", four_team_games())
+    changed = bracket.record_score("G1", 21, 35)
+    assert [game.game_id for game in changed] == ["G1", "G3"]
+    assert bracket.game("G3").home_team == B
+    assert bracket.game("G3").away_team == TBD
+
+
+def test_corrected_final_replaces_the_winner_up_the_chain():
+    bracket = Bracket("5A D1", four_team_games())
+    bracket.record_score("G1", 35, 21)
+    bracket.record_score("G2", 14, 10)
+    bracket.record_score("G3", 28, 7)
+
+    bracket.record_score("G1", 21, 35)
+    assert bracket.game("G3").home_team == B
+
+
+def test_tied_or_open_games_have_no_winner():
+    bracket = Bracket("5A D1", four_team_games())
+    bracket.record_score("G1", 14, 14)
+    assert bracket.game("G1").winner() is None
+    bracket.record_score("G2", 28, 0, status="live")
+    assert bracket.game("G3").away_team == TBD
+
+
+def test_finals_on_the_books_fill_later_slots_at_load():
+    games = four_team_games()
+    games[1].home_score, games[1].away_score, games[1].status = 3, 17, "final"
+    assert Bracket("5A D1", games).game("G3").away_team == D
+
+
+@pytest.fixture
+def client(monkeypatch):
+    store = BracketStore()
+    store.load("5A D1", four_team_games())
+    monkeypatch.setattr(playoff_bracket, "brackets", store)
+    monkeypatch.setattr(bracket_module, "_persist_games", lambda games: None)
+    app = FastAPI()
+    app.include_router(playoff_bracket.router)
+    app.dependency_overrides[verify_admin] = lambda: {"id": 1}
+    return TestClient(app), store
+
+
+def test_score_update_route_advances_the_winner(client):
+    client, store = client
+    response = client.patch("/api/v1/playoff-bracket/games/101", json={"home_score": 35, "away_score": 21})
+    assert response.status_code == 200
+    assert store.get("5A D1").game("G3").home_team == A
+
+
+@pytest.mark.parametrize("body", [
+    {"home_score": 35, "away_score": 21, "status": "FINAL"},
+    {"home_score": 35, "away_score": 21, "status": "Final"},
+    {"home_score": -1, "away_score": 21},
+    {"home_score": 21, "away_score": 21},
+    {"home_score": 21},
+])
+def test_score_update_route_rejects_bad_finals(client, body):
+    client, store = client
+    assert client.patch("/api/v1/playoff-bracket/games/101", json=body).status_code == 422
+    assert store.get("5A D1").game("G1").status == "scheduled"
+
+
+def test_stream_of_an_unknown_conference_is_404(client):
+    client, _ = client
+    assert client.get("/api/v1/playoff-bracket/stream", params={"conference": "9A D7"}).status_code == 404
@@ -0,0 +1,121 @@
+import threading
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.routes import playoff_bracket
+from app.services import bracket_odds as bracket_odds_module
+from app.services.bracket import Bracket, BracketGame, BracketStore, BracketTeam
+from app.services.bracket_odds import BracketOddsEngine, compile_plan, simulate, simulation_count
+from app.services.win_probability import WinProbabilityTracker
+
+A, B, C, D = (BracketTeam(i, name) for i, name in enumerate(["Aledo", "Mansfield", "Lovejoy", "Frisco"], start=1))
+
+
+def four_team_bracket(**g1) -> Bracket:
+    return Bracket("5A D1", [
+        BracketGame(id=101, game_id="G1", round="Area", region=1, home_team=A, away_team=B, **g1),
+        BracketGame(id=102, game_id="G2", round="Area", region=1, home_team=C, away_team=D),
+        BracketGame(id=103, game_id="G3", round="Regional Final", region=1, home_feeder="G1", away_feeder="G2"),
+    ])
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = WinProbabilityTracker()
+    monkeypatch.setattr(bracket_odds_module, "live_win_probability", tracker)
+    return tracker
+
+
+def odds_by_team(result) -> dict:
+    return {team.name: dict(zip(result.rounds, odds)) for team, odds in result.teams}
+
+
+def test_round_odds_add_up(tracker):
+    result = BracketOddsEngine().odds(four_team_bracket(), 10_000)
+    odds = odds_by_team(result)
+    assert result.rounds == ["Area", "Regional Final", "Champion"]
+    assert all(team["Area"] == 1.0 for team in odds.values())
+    assert sum(team["Regional Final"] for team in odds.values()) == pytest.approx(2.0)
+    assert sum(team["Champion"] for team in odds.values()) == pytest.approx(1.0)
+
+
+def test_ratings_favor_the_stronger_team(tracker):
+    engine = BracketOddsEngine()
+    engine.set_ratings({A.id: 14.0})
+    odds = odds_by_team(engine.odds(four_team_bracket(), 10_000))
+    assert odds["Aledo"]["Champion"] > 0.5
+    assert odds["Mansfield"]["Regional Final"] < 0.2
+
+
+def test_finals_are_certain(tracker):
+    odds = odds_by_team(BracketOddsEngine().odds(four_team_bracket(home_score=7, away_score=21, status="final")))
+    assert odds["Mansfield"]["Regional Final"] == 1.0
+    assert odds["Aledo"]["Regional Final"] == 0.0
+
+
+def test_a_live_game_at_final_is_settled(tracker):
+    tracker.update(101, 21, 7, "FINAL", None)
+    odds = odds_by_team(BracketOddsEngine().odds(four_team_bracket(status="live")))
+    assert odds["Aledo"]["Regional Final"] == 1.0
+
+
+def test_results_are_cached_until_the_bracket_changes(tracker):
+    engine = BracketOddsEngine()
+    bracket = four_team_bracket()
+    first = engine.odds(bracket, 5_000)
+    assert first.simulations == 10_000
+    assert engine.odds(bracket, 10_000) is first
+
+    bracket.record_score("G1", 0, 7)
+    assert engine.odds(bracket, 10_000) is not first
+
+
+def test_concurrent_misses_simulate_once(monkeypatch, tracker):
+    runs = []
+    real_simulate = bracket_odds_module.simulate
+    monkeypatch.setattr(bracket_odds_module, "simulate",
+                        lambda *args, **kwargs: runs.append(1) or real_simulate(*args, **kwargs))
+    engine, bracket = BracketOddsEngine(), four_team_bracket()
+    start = threading.Barrier(8)
+
+    def read():
+        start.wait()
+        engine.odds(bracket, 100_000)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(runs) == 1
+
+
+def test_chunked_runs_match_the_requested_count(tracker):
+    _, plan = compile_plan(four_team_bracket(), {})
+    counts = simulate(plan, 250_000, seed=44)
+    assert counts[0][1:].tolist() == [250_000] * 4
+    assert np.sum(counts[-1]) == 250_000
+
+
+def test_simulation_count_rounds_up():
+    assert simulation_count(100) == 1_000
+    assert simulation_count(10_001) == 100_000
+    assert simulation_count(5_000_000) == 1_000_000
+
+
+def test_public_route_caps_the_run_size(monkeypatch, tracker):
+    store = BracketStore()
+    store.load("5A D1", four_team_bracket().games())
+    monkeypatch.setattr(playoff_bracket, "brackets", store)
+    monkeypatch.setattr(playoff_bracket, "bracket_odds", BracketOddsEngine())
+    app = FastAPI()
+    app.include_router(playoff_bracket.router)
+    client = TestClient(app)
+
+    assert client.get("/api/v1/playoff-bracket/odds", params={"simulations": 1_000_000}).status_code == 422
+    response = client.get("/api/v1/playoff-bracket/odds", params={"simulations": 100_000})
+    assert response.status_code == 200
+    assert response.json()["simulations"] == 100_000
@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+import pytest
+
+from app.schemas.dashboard import Team, TeamStats
+from app.services import dashboard as dashboard_module
+from app.services.dashboard import DashboardStore, DashboardUnavailable, TeamNotFound
+
+
+def fake_sections(failing=()):
+    """Section loaders that return fixed values, or raise for the names in `failing`."""
+    values = {
+        "team": Team(id="2", name="Joshua", mascot="Owls", record="4-3"),
+        "team_stats": TeamStats(points_per_game=24.5, yards_per_game=355, turnover_margin="+3"),
+    }
+
+    def loader(name):
+        def load(team_id):
+            if name in failing:
+                raise RuntimeError(f"{name} down")
+            return values.get(name)
+        return load
+
+    return {name: loader(name) for name in dashboard_module.SECTIONS}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.setattr(dashboard_module, "SECTIONS", fake_sections())
+    return DashboardStore(section_timeout=1.0)
+
+
+def test_build_caches_the_serialized_payload(store):
+    payload = asyncio.run(store.build("2"))
+    body = json.loads(payload)
+    assert body["team"]["name"] == "Joshua"
+    assert body["team_stats"]["points_per_game"] == 24.5
+    assert body["stale_sections"] == []
+    assert store.cached("2") == payload
+
+
+def test_failed_sections_fall_back_to_the_last_good_copy(monkeypatch, store):
+    asyncio.run(store.build("2"))
+    monkeypatch.setattr(dashboard_module, "SECTIONS", fake_sections(failing={"team_stats"}))
+
+    body = json.loads(asyncio.run(store.build("2")))
+    assert body["team_stats"]["points_per_game"] == 24.5
+    assert body["stale_sections"] == ["team_stats"]
+    assert store.cached("2") is None  # A partial payload is served once, not kept
+
+
+def test_cold_build_without_the_team_section_is_unavailable(monkeypatch, store):
+    monkeypatch.setattr(dashboard_module, "SECTIONS", fake_sections(failing={"team"}))
+    with pytest.raises(DashboardUnavailable):
+        asyncio.run(store.build("2"))
+
+
+def test_non_numeric_team_ids_are_not_found(store):
+    with pytest.raises(TeamNotFound):
+        asyncio.run(store.build("team-joshua"))
@@ -0,0 +1,145 @@
+import random
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from app.services import box_scores as box_scores_module
+from app.services import play_log as play_log_module
+from app.services.box_scores import BoxScoreAggregator
+from app.services.play_log import GamePlayLog, PlayEvent, PlayLogStore, decode_play, encode_play
+
+GAME_ID = 7
+
+
+def play_fields(**overrides) -> dict:
+    fields = dict(
+        quarter=1,
+        clock_seconds=462,
+        team_id="10",
+        team_name="Joshua",
+        play_type="rush",
+        yards=4,
+        description="Smith up the middle",
+        is_scoring_play=False,
+        home_score_after=0,
+        away_score_after=0,
+        player_id="p1",
+        defender_id="d9",
+    )
+    fields.update(overrides)
+    return fields
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """A play log store with no database behind it."""
+    monkeypatch.setattr(PlayLogStore, "_load", lambda self, game_id: [])
+    store = PlayLogStore()
+    # Queueing for persistence takes a moment, which is when a later append could overtake this one
+    monkeypatch.setattr(store._writer, "add", lambda row: time.sleep(random.random() / 2000))
+    return store
+
+
+@pytest.fixture
+def aggregator(monkeypatch, store):
+    monkeypatch.setattr(box_scores_module, "play_log", store)
+    monkeypatch.setattr(box_scores_module, "_game_record", lambda game_id: ("10", "20", "2025"))
+    aggregator = BoxScoreAggregator()
+    store.subscribe(aggregator.fold)
+    return aggregator
+
+
+def test_encode_decode_round_trip():
+    play = PlayEvent(game_id=GAME_ID, seq=3, created_at=datetime(2025, 10, 17, 19, 30),
+                     **play_fields(play_type="pass", target_id="p2", is_scoring_play=True, yards=-3))
+    assert decode_play(GAME_ID, encode_play(play)) == play
+
+
+def test_unknown_play_type_encodes_as_other():
+    play = PlayEvent(game_id=GAME_ID, seq=1, created_at=datetime(2025, 10, 17), **play_fields(play_type="hail_mary"))
+    assert decode_play(GAME_ID, encode_play(play)).play_type == "other"
+
+
+def test_oversized_string_is_cut_on_a_character_boundary():
+    # 0xFFFF bytes would end halfway through a two-byte character
+    description = "é" * 40_000
+    play = PlayEvent(game_id=GAME_ID, seq=1, created_at=datetime(2025, 10, 17), **play_fields(description=description))
+    decoded = decode_play(GAME_ID, encode_play(play))
+    assert decoded.description == "é" * (0xFFFF // 2)
+
+
+def test_after_reads_a_range():
+    log = GamePlayLog(GAME_ID)
+    for _ in range(5):
+        log.append(**play_fields())
+    assert [p.seq for p in log.after(2)] == [3, 4, 5]
+    assert [p.seq for p in log.after(1, 2)] == [2, 3]
+
+
+def test_reads_of_games_without_plays_are_not_cached(monkeypatch):
+    loads = []
+    monkeypatch.setattr(PlayLogStore, "_load", lambda self, game_id: loads.append(game_id) or [])
+    store = PlayLogStore()
+    assert len(store.log(99)) == 0
+    assert len(store.log(99)) == 0
+    assert loads == [99]
+    assert 99 not in store._logs
+
+    store.append(99, **play_fields())
+    assert store.log(99).last_seq == 1
+
+
+def test_concurrent_appends_reach_listeners_in_seq_order(store):
+    seen = []
+    store.subscribe(lambda play: seen.append(play.seq))
+    start = threading.Barrier(8)
+
+    def append_many():
+        start.wait()
+        for _ in range(100):
+            store.append(GAME_ID, **play_fields())
+
+    threads = [threading.Thread(target=append_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == list(range(1, 801))
+
+
+def test_concurrent_appends_are_all_folded(aggregator, store):
+    start = threading.Barrier(8)
+
+    def append_many():
+        start.wait()
+        for _ in range(50):
+            store.append(GAME_ID, **play_fields())
+
+    threads = [threading.Thread(target=append_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    box = aggregator.game(GAME_ID)
+    assert box.last_seq == 400
+    assert box.players["p1"].rushing_carries == 400
+    assert aggregator.player_season("p1").rushing_yards == 1600
+
+
+def test_fold_credits_points_and_games_played(aggregator, store):
+    store.append(GAME_ID, **play_fields(yards=12, is_scoring_play=True, home_score_after=7))
+    store.append(GAME_ID, **play_fields(team_id="20", team_name="Red Oak", player_id="p5", defender_id=None,
+                                        play_type="pass", target_id="p6", yards=30, away_score_after=0,
+                                        home_score_after=7))
+
+    box = aggregator.game(GAME_ID)
+    assert (box.home_score, box.away_score) == (7, 0)
+    assert box.teams["10"].points == 7
+    assert box.teams["20"].points_allowed == 7
+    assert box.players["p1"].rushing_tds == 1
+    assert box.players["p6"].receiving_yards == 30
+    assert aggregator.team_season("10").games_played == 1
+    assert aggregator.player_season("p1").games_played == 1
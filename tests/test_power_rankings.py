@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from app.services import power_rankings as power_rankings_module
+from app.services.power_rankings import MIN_GAMES, PowerRankingsStore, compute_rankings, solve_ratings
+
+
+def test_ratings_recover_margins_and_home_field():
+    # A beats B by 10 and B beats C by 10, each twice at home and twice away
+    home = np.array([0, 1, 1, 2, 0, 1, 1, 2])
+    away = np.array([1, 0, 2, 1, 1, 0, 2, 1])
+    margin = np.array([13, -7, 13, -7, 13, -7, 13, -7])
+    ratings, home_field = solve_ratings(home, away, margin, np.zeros(8, dtype=bool), 3)
+
+    assert ratings.sum() == pytest.approx(0.0, abs=1e-9)
+    assert ratings[0] - ratings[1] == pytest.approx(10.0, abs=1.0)
+    assert ratings[1] - ratings[2] == pytest.approx(10.0, abs=1.0)
+    assert home_field == pytest.approx(3.0, abs=0.5)
+
+
+def test_blowouts_are_capped():
+    home, away, neutral = np.array([0]), np.array([1]), np.array([True])
+    capped, _ = solve_ratings(home, away, np.array([70]), neutral, 2)
+    four_touchdowns, _ = solve_ratings(home, away, np.array([28]), neutral, 2)
+    assert capped == pytest.approx(four_touchdowns)
+
+
+def test_rankings_are_per_classification_and_complete_teams_first():
+    classifications = {1: "6A", 2: "6A", 3: "6A", 4: "5A-D1"}
+    games = [(1, 2, 35, 7, False), (1, 3, 28, 14, False), (2, 3, 21, 20, False),
+             (1, 4, 14, 10, False), (2, 4, 10, 17, False), (3, 4, 3, 24, False),
+             (4, 99, 42, 0, False)]
+    rankings = {r.team_id: r for r in compute_rankings(classifications, games, previous_ranks={1: 2})}
+
+    assert 99 not in rankings  # Rated as an opponent, never ranked
+    assert rankings[1].rank == 1 and rankings[1].classification == "6A"
+    assert rankings[4].rank == 1 and rankings[4].classification == "5A-D1"
+    assert (rankings[1].wins, rankings[1].losses, rankings[1].point_diff) == (3, 0, 46)
+    assert rankings[1].previous_rank == 2
+    assert rankings[1].games_played == 3 and not rankings[1].is_incomplete
+
+    short = compute_rankings({1: "6A", 2: "6A", 3: "6A"}, [(3, 2, 50, 0, False)] * (MIN_GAMES - 1)
+                             + [(1, 2, 7, 0, False)] * MIN_GAMES)
+    assert [r.team_id for r in short][0] == 1
+    assert next(r for r in short if r.team_id == 3).is_incomplete
+
+
+def test_listeners_hear_only_changed_ratings(monkeypatch):
+    rows = [{"team_id": 1, "power_rating": 4.5, "classification": "6A"}]
+    monkeypatch.setattr(PowerRankingsStore, "_load", staticmethod(lambda season: [dict(row) for row in rows]))
+    monkeypatch.setattr(power_rankings_module, "RELOAD_INTERVAL", 0.0)
+    store, heard = PowerRankingsStore(), []
+    store.subscribe(lambda season, ratings: heard.append(ratings))
+
+    store.warm("2025")
+    store.warm("2025")
+    rows[0]["power_rating"] = 6.0
+    store.warm("2025")
+    assert heard == [{1: 4.5}, {1: 6.0}]
@@ -0,0 +1,73 @@
+from app.services.fuzzy_index import FuzzyIndex, deletes, edit_distance, max_distance_for
+from app.services.search_cache import SearchCache
+from app.services.search_index import SearchIndex
+
+
+def build_index() -> SearchIndex:
+    index = SearchIndex()
+    for team_id, name, mascot in (("1", "Highland Park", "Scots"), ("5", "Midlothian", "Panthers"),
+                                  ("9", "Midland", "Bulldogs")):
+        index.add("team", team_id, (name, mascot), {"type": "team", "id": team_id, "name": name},
+                  synonyms={"hp"} if team_id == "1" else set())
+    index.add("player", "player_9", ("Brayden Payne", "9"), {"type": "player", "id": "player_9", "name": "Brayden Payne"})
+    return index
+
+
+def names(results) -> list:
+    return [result["name"] for result in results]
+
+
+def test_edit_distance_counts_transpositions_once():
+    assert edit_distance("midlothain", "midlothian") == 1
+    assert edit_distance("highland prk", "highland park") == 1
+    assert edit_distance("aledo", "frisco") == 3
+
+
+def test_deletes_stay_within_the_distance():
+    assert "mdland" in deletes("midland", 1)
+    assert "mland" not in deletes("midland", 1)
+
+
+def test_short_queries_get_no_slack():
+    assert max_distance_for("tx") == 0
+    assert max_distance_for("owls") == 1
+    assert max_distance_for("midlothain") == 2
+
+
+def test_fuzzy_lookup_finds_keys_within_distance():
+    fuzzy = FuzzyIndex()
+    fuzzy.add(0, ["midlothian"])
+    fuzzy.add(1, ["midland"])
+    assert [(distance, key) for distance, key, _ in fuzzy.lookup("midlothain")] == [(1, "midlothian")]
+
+
+def test_removed_slots_stop_matching():
+    fuzzy = FuzzyIndex()
+    fuzzy.add(0, ["midlothian"])
+    fuzzy.remove(0, ["midlothian"])
+    assert fuzzy.lookup("midlothain") == []
+
+
+def test_search_ranks_exact_matches_over_typos():
+    index = build_index()
+    assert names(index.search("midland")) == ["Midland"]
+    assert names(index.search("midlothain")) == ["Midlothian"]
+    assert names(index.search("highland prk")) == ["Highland Park"]
+
+
+def test_alias_synonyms_match():
+    assert names(build_index().search("hp"))[0] == "Highland Park"
+
+
+def test_followed_teams_are_lifted():
+    index = build_index()
+    assert names(index.search("mid"))[0] == "Midland"
+    assert names(index.search("mid", followed_team_ids=["5"]))[0] == "Midlothian"
+
+
+def test_cache_narrows_from_a_shorter_prefix():
+    index = build_index()
+    cache = SearchCache(index)
+    cache.search("mid")
+    assert names(cache.search("midl")) == names(index.search("midl"))
+    assert cache.stats()["narrowed"] == 1
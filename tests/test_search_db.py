@@ -0,0 +1,83 @@
+import psycopg2
+import pytest
+
+from app.services import search_db
+from app.services.search_db import SearchResultCache, SearchUnavailable, prefix_tsquery, rerank, similarity
+
+ROWS = [
+    {"type": "team", "id": "5", "name": "Midlothian", "mascot": "Panthers"},
+    {"type": "team", "id": "9", "name": "Midland", "mascot": "Bulldogs"},
+    {"type": "player", "id": "player_1", "name": "Jo Midd", "number": "4", "position": "QB"},
+]
+
+
+@pytest.fixture
+def database(monkeypatch):
+    """search_database stand-in recording the queries it was asked."""
+    queries = []
+
+    def search_database(query, limit=20, followed_team_ids=()):
+        queries.append(query)
+        return [row for row in ROWS if query[:3] in row["name"].lower()][:limit]
+
+    monkeypatch.setattr(search_db, "search_database", search_database)
+    return queries
+
+
+def test_prefix_tsquery_drops_punctuation():
+    assert prefix_tsquery("highland pa") == "highland:* & pa:*"
+    assert prefix_tsquery("o'connor") == "o:* & connor:*"
+
+
+def test_similarity_matches_pg_trgm():
+    assert similarity("word", "word") == 1.0
+    assert similarity("word", "two words") == pytest.approx(4 / 11)  # The pg_trgm documentation example
+    assert similarity("abc", "xyz") == 0.0
+
+
+def test_rerank_uses_the_sql_tiers():
+    assert [row["name"] for row in rerank(ROWS, "midl", 20)] == ["Midland", "Midlothian", "Jo Midd"]
+    assert [row["name"] for row in rerank(ROWS, "midlothia", 20)] == ["Midlothian"]
+    assert [row["name"] for row in rerank(ROWS, "midl", 20, followed_team_ids=["5"])][0] == "Midlothian"
+
+
+def test_longer_queries_narrow_a_complete_shorter_prefix(database):
+    cache = SearchResultCache()
+    cache.search("mid")
+    assert [row["name"] for row in cache.search("midlothia")] == ["Midlothian"]
+    assert database == ["mid"]
+    assert cache.stats()["narrowed"] == 1
+
+
+def test_a_full_prefix_result_is_not_narrowed(database):
+    cache = SearchResultCache()
+    cache.search("mid", limit=3)
+    cache.search("midl", limit=3)
+    assert database == ["mid", "midl"]
+
+
+def test_prefixes_shorter_than_a_trigram_do_not_cover_longer_queries(database):
+    cache = SearchResultCache()
+    cache.search("mi")
+    cache.search("mid")
+    assert database == ["mi", "mid"]
+
+
+def test_database_errors_back_off(monkeypatch):
+    calls = []
+
+    def down(query, limit=20, followed_team_ids=()):
+        calls.append(query)
+        raise psycopg2.OperationalError("connection refused")
+
+    monkeypatch.setattr(search_db, "search_database", down)
+    cache = SearchResultCache(down_interval=60.0)
+    for query in ("aledo", "frisco", "lovejoy"):
+        with pytest.raises(SearchUnavailable):
+            cache.search(query)
+    assert calls == ["aledo"]
+
+    cache.clear()
+    with pytest.raises(SearchUnavailable):
+        cache.search("aledo")
+    assert calls == ["aledo", "aledo"]
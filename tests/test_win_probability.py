@@ -0,0 +1,70 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.routes import games
+from app.api.v1.routes.moderation import verify_admin
+from app.services.win_probability import WinProbabilityTracker, parse_clock
+
+
+def test_lead_late_is_worth_more_than_lead_early():
+    tracker = WinProbabilityTracker()
+    early = tracker.update(1, 7, 0, "1Q", "11:00").home_win_probability
+    late = tracker.update(2, 7, 0, "4Q", "1:00").home_win_probability
+    assert 50.0 < early < late < 100.0
+
+
+def test_pregame_prior_moves_a_tied_game():
+    tracker = WinProbabilityTracker()
+    tracker.start(1, pregame_home_win_probability=80.0)
+    assert tracker.update(1, 0, 0, "1Q", "12:00").home_win_probability > 50.0
+
+
+def test_same_cell_returns_the_cached_result():
+    tracker = WinProbabilityTracker()
+    first = tracker.update(1, 14, 10, "2Q", "5:40")
+    assert tracker.update(1, 14, 10, "2Q", "5:10") is first
+
+
+def test_final_is_kept_and_later_updates_are_ignored():
+    tracker = WinProbabilityTracker()
+    tracker.update(5, 14, 7, "4Q", "2:00")
+    final = tracker.update(5, 21, 7, "FINAL", None)
+
+    assert (final.home_win_probability, final.away_win_probability) == (100.0, 0.0)
+    assert tracker.is_tracking(5)
+    assert tracker.is_final(5)
+    assert tracker.get(5) is final
+    assert tracker.update(5, 21, 28, "4Q", "0:30") is final
+
+
+def test_tied_final_is_even():
+    tracker = WinProbabilityTracker()
+    assert tracker.update(1, 10, 10, "FINAL", None).home_win_probability == 50.0
+
+
+def test_parse_clock():
+    assert parse_clock("FINAL", None)[2] is True
+    assert parse_clock("4Q", "1:00")[2] is False
+
+
+def test_game_detail_keeps_the_final_after_later_posts(monkeypatch):
+    tracker = WinProbabilityTracker()
+    recorded = []
+    monkeypatch.setattr(games, "live_win_probability", tracker)
+    monkeypatch.setattr(games.standings, "record_score", lambda *args: recorded.append(args))
+    monkeypatch.setattr(games.standings, "game", lambda game_id: None)
+    app = FastAPI()
+    app.include_router(games.router)
+    app.dependency_overrides[verify_admin] = lambda: {"id": 1}
+    client = TestClient(app)
+
+    final = client.post("/api/v1/games/5/live", json={
+        "home_score": 21, "away_score": 7, "quarter": "FINAL", "pregame_home_win_probability": 40.0,
+    })
+    late = client.post("/api/v1/games/5/live", json={"home_score": 21, "away_score": 28, "quarter": "4Q",
+                                                     "time_remaining": "0:30"})
+
+    assert final.json()["home_win_probability"] == 100.0
+    assert late.json() == final.json()
+    assert len(recorded) == 1
+    assert games.get_game_detail(5).analytics.home_win_probability == 100.0